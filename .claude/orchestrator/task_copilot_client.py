@@ -10,23 +10,68 @@ Future: Can be replaced with MCP API calls when Task Copilot MCP server is avail
 
 import sqlite3
 import json
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Union
 from dataclasses import dataclass
 from enum import Enum
 
-
-class TaskStatus(Enum):
-    """Task status values"""
+# orjson decodes the small dependency lists faster when installed; its
+# JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Per-connection tuning applied to connections kept open for reuse. The
+# Task Copilot server already puts the database in WAL mode, so readers here
+# never block its writes; these only keep more of the file cached between
+# queries on a long-lived connection.
+KEPT_CONNECTION_PRAGMAS = (
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Stream IDs bound per IN (...) query; stays under SQLite's default limit of
+# 999 host parameters on older builds, leaving room for the initiative ID.
+MAX_IN_PARAMS = 900
+
+# Per-status count columns for the stream progress queries. COUNT(*) FILTER
+# (SQLite 3.30+) skips evaluating a CASE for every row; older libraries get
+# the equivalent SUM(CASE ...) form.
+if sqlite3.sqlite_version_info >= (3, 30, 0):
+    _STATUS_COUNT = "COUNT(*) FILTER (WHERE {column} = '{status}')"
+else:
+    _STATUS_COUNT = "SUM(CASE WHEN {column} = '{status}' THEN 1 ELSE 0 END)"
+
+
+def _status_count_columns(column: str) -> str:
+    """SELECT columns counting completed, in_progress, pending and blocked tasks."""
+    return ",\n".join(
+        f"{_STATUS_COUNT.format(column=column, status=status)} as {status}"
+        for status in ("completed", "in_progress", "pending", "blocked")
+    )
+
+
+STATUS_COUNT_COLUMNS = _status_count_columns("status")
+ALIASED_STATUS_COUNT_COLUMNS = _status_count_columns("t.status")
+
+
+class TaskStatus(str, Enum):
+    """Task status values (str members bind directly as SQLite parameters)"""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     BLOCKED = "blocked"
 
 
-@dataclass
+@dataclass(frozen=True)
 class StreamInfo:
     """Stream information"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("stream_id", "stream_name", "dependencies")
+
     stream_id: str
     stream_name: str
     dependencies: List[str]
@@ -35,9 +80,12 @@ class StreamInfo:
         return f"StreamInfo(id={self.stream_id}, name={self.stream_name}, deps={self.dependencies})"
 
 
-@dataclass
+@dataclass(frozen=True)
 class StreamProgress:
     """Stream progress statistics"""
+    __slots__ = ("stream_id", "total_tasks", "completed_tasks", "in_progress_tasks",
+                 "pending_tasks", "blocked_tasks")
+
     stream_id: str
     total_tasks: int
     completed_tasks: int
@@ -55,15 +103,18 @@ class StreamProgress:
         """Get completion percentage (0-100)"""
         if self.total_tasks == 0:
             return 0
-        return int((self.completed_tasks / self.total_tasks) * 100)
+        return self.completed_tasks * 100 // self.total_tasks
 
     def __repr__(self):
         return f"StreamProgress(id={self.stream_id}, {self.completed_tasks}/{self.total_tasks} tasks, {self.completion_percentage}%)"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProgressSummary:
     """Overall progress summary across all streams"""
+    __slots__ = ("total_tasks", "completed_tasks", "in_progress_tasks", "pending_tasks",
+                 "blocked_tasks", "stream_count", "completed_stream_count")
+
     total_tasks: int
     completed_tasks: int
     in_progress_tasks: int
@@ -77,12 +128,14 @@ class ProgressSummary:
         """Get overall completion percentage (0-100)"""
         if self.total_tasks == 0:
             return 0
-        return int((self.completed_tasks / self.total_tasks) * 100)
+        return self.completed_tasks * 100 // self.total_tasks
 
 
-@dataclass
+@dataclass(frozen=True)
 class InitiativeDetails:
     """Initiative details from Memory Copilot"""
+    __slots__ = ("id", "name", "goal", "status")
+
     id: str
     name: str
     goal: Optional[str]
@@ -97,23 +150,62 @@ class TaskCopilotClient:
     when Task Copilot MCP server becomes available.
     """
 
-    def __init__(self, workspace_id: str):
+    def __init__(self, workspace_id: str, keep_connection: bool = False):
         """
         Initialize Task Copilot client.
 
         Args:
             workspace_id: Workspace identifier (typically project folder name)
+            keep_connection: Reuse one database connection per thread instead
+                of opening a new one for every query. Meant for long-running
+                callers that poll; call close() when done.
         """
         self.workspace_id = workspace_id
         self.db_path = Path.home() / ".claude" / "tasks" / workspace_id / "tasks.db"
         self.memory_db_path = Path.home() / ".claude" / "memory" / workspace_id / "memory.db"
+        # Read-write without create, so a missing database fails to open
+        # instead of being created empty
+        self._db_uri = self.db_path.absolute().as_uri() + "?mode=rw"
+        self.keep_connection = keep_connection
+        self._local = threading.local()
 
     def _connect(self) -> sqlite3.Connection:
-        """Create database connection with timeout"""
-        if not self.db_path.exists():
-            raise FileNotFoundError(f"Task Copilot database not found: {self.db_path}")
+        """Create database connection with timeout (or reuse the kept one)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
 
-        return sqlite3.connect(str(self.db_path), timeout=5)
+        try:
+            conn = sqlite3.connect(self._db_uri, uri=True, timeout=5)
+        except sqlite3.OperationalError:
+            if not self.db_path.exists():
+                raise FileNotFoundError(f"Task Copilot database not found: {self.db_path}") from None
+            raise
+
+        if self.keep_connection:
+            for pragma in KEPT_CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+        return conn
+
+    def _release(self, conn: sqlite3.Connection):
+        """Finish with a connection from _connect.
+
+        Closes it, unless it is the kept connection; that one only has any
+        uncommitted transaction rolled back, as closing would have done.
+        """
+        if conn is getattr(self._local, "conn", None):
+            if conn.in_transaction:
+                conn.rollback()
+        else:
+            conn.close()
+
+    def close(self):
+        """Close the connection kept for the calling thread, if any."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
 
     def stream_list(self, initiative_id: Optional[str] = None) -> List[StreamInfo]:
         """
@@ -167,8 +259,7 @@ class TaskCopilotClient:
                 dependencies = []
                 if dependencies_json:
                     try:
-                        import json
-                        deps = json.loads(dependencies_json)
+                        deps = json_loads(dependencies_json)
                         if isinstance(deps, list):
                             dependencies = deps
                     except (json.JSONDecodeError, TypeError):
@@ -182,7 +273,7 @@ class TaskCopilotClient:
 
             return streams
         finally:
-            conn.close()
+            self._release(conn)
 
     def stream_get(self, stream_id: str, initiative_id: Optional[str] = None) -> Optional[StreamProgress]:
         """
@@ -202,15 +293,13 @@ class TaskCopilotClient:
         conn = self._connect()
         try:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             if initiative_id:
-                cursor.execute("""
+                cursor.execute(f"""
                     SELECT
                         COUNT(*) as total,
-                        SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) as completed,
-                        SUM(CASE WHEN t.status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                        SUM(CASE WHEN t.status = 'pending' THEN 1 ELSE 0 END) as pending,
-                        SUM(CASE WHEN t.status = 'blocked' THEN 1 ELSE 0 END) as blocked
+                        {ALIASED_STATUS_COUNT_COLUMNS}
                     FROM tasks t
                     LEFT JOIN prds p ON t.prd_id = p.id
                     WHERE json_extract(t.metadata, '$.streamId') = ?
@@ -218,25 +307,139 @@ class TaskCopilotClient:
                       AND p.initiative_id = ?
                 """, (stream_id, initiative_id))
             else:
-                cursor.execute("""
+                cursor.execute(f"""
                     SELECT
                         COUNT(*) as total,
-                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                        SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                        SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                        SUM(CASE WHEN status = 'blocked' THEN 1 ELSE 0 END) as blocked
+                        {STATUS_COUNT_COLUMNS}
                     FROM tasks
                     WHERE json_extract(metadata, '$.streamId') = ?
                       AND archived = 0
                 """, (stream_id,))
 
             row = cursor.fetchone()
-            if not row or row[0] == 0:
+            if not row or row["total"] == 0:
                 return None
 
-            total, completed, in_progress, pending, blocked = row
-
+            # The SUMs are never NULL once at least one task matched
             return StreamProgress(
+                stream_id=stream_id,
+                total_tasks=row["total"],
+                completed_tasks=row["completed"],
+                in_progress_tasks=row["in_progress"],
+                pending_tasks=row["pending"],
+                blocked_tasks=row["blocked"]
+            )
+        finally:
+            self._release(conn)
+
+    def stream_get_all(self, initiative_id: Optional[str] = None) -> Dict[str, StreamProgress]:
+        """
+        Get progress information for every stream in a single query.
+
+        Equivalent to calling stream_get() for each stream, without the
+        per-stream round trip.
+
+        Args:
+            initiative_id: Optional initiative ID to filter by
+
+        Returns:
+            Dict mapping stream ID to StreamProgress (streams with no tasks are omitted)
+
+        Raises:
+            FileNotFoundError: If database doesn't exist
+            sqlite3.Error: If query fails
+        """
+        conn = self._connect()
+        try:
+            return self._query_stream_progress(conn.cursor(), initiative_id)
+        finally:
+            self._release(conn)
+
+    def stream_get_many(self, stream_ids: List[str], initiative_id: Optional[str] = None) -> Dict[str, StreamProgress]:
+        """
+        Get progress information for the given streams.
+
+        Like stream_get_all(), but only the requested streams are counted,
+        using one query per MAX_IN_PARAMS stream IDs.
+
+        Args:
+            stream_ids: Stream identifiers to look up
+            initiative_id: Optional initiative ID to filter by
+
+        Returns:
+            Dict mapping stream ID to StreamProgress (streams with no tasks are omitted)
+
+        Raises:
+            FileNotFoundError: If database doesn't exist
+            sqlite3.Error: If query fails
+        """
+        stream_ids = list(dict.fromkeys(stream_ids))
+        if not stream_ids:
+            return {}
+
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            progress_by_stream = {}
+            for start in range(0, len(stream_ids), MAX_IN_PARAMS):
+                chunk = stream_ids[start:start + MAX_IN_PARAMS]
+                progress_by_stream.update(self._query_stream_progress(cursor, initiative_id, chunk))
+            return progress_by_stream
+        finally:
+            self._release(conn)
+
+    def _query_stream_progress(
+        self,
+        cursor: sqlite3.Cursor,
+        initiative_id: Optional[str] = None,
+        stream_ids: Optional[List[str]] = None
+    ) -> Dict[str, StreamProgress]:
+        """
+        Count tasks by status per stream in one grouped query.
+
+        Args:
+            cursor: Cursor on an open Task Copilot connection
+            initiative_id: Optional initiative ID to filter by
+            stream_ids: Optional stream IDs to restrict to (at most
+                MAX_IN_PARAMS); all streams when omitted
+
+        Returns:
+            Dict mapping stream ID to StreamProgress (streams with no tasks are omitted)
+        """
+        params: List[str] = []
+        if stream_ids is None:
+            stream_filter = "IS NOT NULL"
+        else:
+            stream_filter = f"IN ({','.join('?' * len(stream_ids))})"
+            params.extend(stream_ids)
+
+        if initiative_id:
+            cursor.execute(f"""
+                SELECT
+                    json_extract(t.metadata, '$.streamId') as stream_id,
+                    COUNT(*) as total,
+                    {ALIASED_STATUS_COUNT_COLUMNS}
+                FROM tasks t
+                LEFT JOIN prds p ON t.prd_id = p.id
+                WHERE json_extract(t.metadata, '$.streamId') {stream_filter}
+                  AND t.archived = 0
+                  AND p.initiative_id = ?
+                GROUP BY json_extract(t.metadata, '$.streamId')
+            """, (*params, initiative_id))
+        else:
+            cursor.execute(f"""
+                SELECT
+                    json_extract(metadata, '$.streamId') as stream_id,
+                    COUNT(*) as total,
+                    {STATUS_COUNT_COLUMNS}
+                FROM tasks
+                WHERE json_extract(metadata, '$.streamId') {stream_filter}
+                  AND archived = 0
+                GROUP BY json_extract(metadata, '$.streamId')
+            """, params)
+
+        return {
+            stream_id: StreamProgress(
                 stream_id=stream_id,
                 total_tasks=total or 0,
                 completed_tasks=completed or 0,
@@ -244,8 +447,8 @@ class TaskCopilotClient:
                 pending_tasks=pending or 0,
                 blocked_tasks=blocked or 0
             )
-        finally:
-            conn.close()
+            for stream_id, total, completed, in_progress, pending, blocked in cursor.fetchall()
+        }
 
     def progress_summary(self, initiative_id: Optional[str] = None) -> ProgressSummary:
         """
@@ -261,66 +464,20 @@ class TaskCopilotClient:
             FileNotFoundError: If database doesn't exist
             sqlite3.Error: If query fails
         """
-        conn = self._connect()
-        try:
-            cursor = conn.cursor()
-
-            # Get overall task counts with optional initiative filter
-            if initiative_id:
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total,
-                        SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) as completed,
-                        SUM(CASE WHEN t.status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                        SUM(CASE WHEN t.status = 'pending' THEN 1 ELSE 0 END) as pending,
-                        SUM(CASE WHEN t.status = 'blocked' THEN 1 ELSE 0 END) as blocked
-                    FROM tasks t
-                    LEFT JOIN prds p ON t.prd_id = p.id
-                    WHERE json_extract(t.metadata, '$.streamId') IS NOT NULL
-                      AND t.archived = 0
-                      AND p.initiative_id = ?
-                """, (initiative_id,))
-            else:
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total,
-                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                        SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                        SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                        SUM(CASE WHEN status = 'blocked' THEN 1 ELSE 0 END) as blocked
-                    FROM tasks
-                    WHERE json_extract(metadata, '$.streamId') IS NOT NULL
-                      AND archived = 0
-                """)
-
-            row = cursor.fetchone()
-            total = row[0] or 0
-            completed = row[1] or 0
-            in_progress = row[2] or 0
-            pending = row[3] or 0
-            blocked = row[4] or 0
-
-            # Get stream counts (pass initiative_id for consistency)
-            streams = self.stream_list(initiative_id)
-            stream_count = len(streams)
-            completed_stream_count = 0
-
-            for stream_info in streams:
-                progress = self.stream_get(stream_info.stream_id, initiative_id)
-                if progress and progress.is_complete:
-                    completed_stream_count += 1
-
-            return ProgressSummary(
-                total_tasks=total,
-                completed_tasks=completed,
-                in_progress_tasks=in_progress,
-                pending_tasks=pending,
-                blocked_tasks=blocked,
-                stream_count=stream_count,
-                completed_stream_count=completed_stream_count
-            )
-        finally:
-            conn.close()
+        # Every total is a sum over the per-stream groups, so one grouped
+        # query covers both the task counts and the stream counts
+        progress_by_stream = self.stream_get_all(initiative_id)
+        streams = progress_by_stream.values()
+
+        return ProgressSummary(
+            total_tasks=sum(p.total_tasks for p in streams),
+            completed_tasks=sum(p.completed_tasks for p in streams),
+            in_progress_tasks=sum(p.in_progress_tasks for p in streams),
+            pending_tasks=sum(p.pending_tasks for p in streams),
+            blocked_tasks=sum(p.blocked_tasks for p in streams),
+            stream_count=len(progress_by_stream),
+            completed_stream_count=sum(1 for p in streams if p.is_complete)
+        )
 
     def get_active_initiative_id(self) -> Optional[str]:
         """
@@ -381,6 +538,7 @@ class TaskCopilotClient:
         try:
             conn = sqlite3.connect(str(self.memory_db_path), timeout=5)
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             cursor.execute("""
                 SELECT id, name, goal, status
@@ -395,29 +553,36 @@ class TaskCopilotClient:
                 return None
 
             return InitiativeDetails(
-                id=row[0],
-                name=row[1] or "Unnamed Initiative",
-                goal=row[2],
-                status=row[3] or "UNKNOWN"
+                id=row["id"],
+                name=row["name"] or "Unnamed Initiative",
+                goal=row["goal"],
+                status=row["status"] or "UNKNOWN"
             )
         except sqlite3.Error:
             return None
 
-    def get_stream_tasks_by_status(self, stream_id: str, status: TaskStatus) -> List[Dict]:
+    def get_stream_tasks_by_status(
+        self, stream_id: str, status: Union[TaskStatus, Iterable[TaskStatus]]
+    ) -> List[Dict]:
         """
         Get tasks for a stream filtered by status.
 
         Args:
             stream_id: Stream identifier
-            status: Task status to filter by
+            status: Task status, or several statuses, to filter by
 
         Returns:
             List of task dictionaries
         """
+        statuses = [status] if isinstance(status, TaskStatus) else list(status)
+        if not statuses:
+            return []
+
         conn = self._connect()
         try:
             cursor = conn.cursor()
-            cursor.execute("""
+            placeholders = ",".join("?" * len(statuses))
+            cursor.execute(f"""
                 SELECT
                     id,
                     title,
@@ -425,10 +590,10 @@ class TaskCopilotClient:
                     metadata
                 FROM tasks
                 WHERE json_extract(metadata, '$.streamId') = ?
-                  AND status = ?
+                  AND status IN ({placeholders})
                   AND archived = 0
                 ORDER BY created_at
-            """, (stream_id, status.value))
+            """, (stream_id, *statuses))
 
             tasks = []
             for task_id, title, task_status, metadata in cursor.fetchall():
@@ -441,7 +606,7 @@ class TaskCopilotClient:
 
             return tasks
         finally:
-            conn.close()
+            self._release(conn)
 
     def get_non_me_agent_tasks(self, initiative_id: Optional[str] = None) -> List[Dict]:
         """
@@ -502,7 +667,51 @@ class TaskCopilotClient:
 
             return tasks
         finally:
-            conn.close()
+            self._release(conn)
+
+    def get_non_me_agent_counts(self, initiative_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count stream tasks per agent, for agents other than 'me'.
+
+        Same selection as get_non_me_agent_tasks(), aggregated in SQL for
+        callers that only need the totals.
+
+        Args:
+            initiative_id: Optional initiative ID to filter by
+
+        Returns:
+            Dict mapping agent name to number of assigned tasks
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+
+            if initiative_id:
+                cursor.execute("""
+                    SELECT t.assigned_agent, COUNT(*)
+                    FROM tasks t
+                    LEFT JOIN prds p ON t.prd_id = p.id
+                    WHERE json_extract(t.metadata, '$.streamId') IS NOT NULL
+                      AND t.archived = 0
+                      AND p.initiative_id = ?
+                      AND t.assigned_agent IS NOT NULL
+                      AND t.assigned_agent != 'me'
+                    GROUP BY t.assigned_agent
+                """, (initiative_id,))
+            else:
+                cursor.execute("""
+                    SELECT assigned_agent, COUNT(*)
+                    FROM tasks
+                    WHERE json_extract(metadata, '$.streamId') IS NOT NULL
+                      AND archived = 0
+                      AND assigned_agent IS NOT NULL
+                      AND assigned_agent != 'me'
+                    GROUP BY assigned_agent
+                """)
+
+            return dict(cursor.fetchall())
+        finally:
+            self._release(conn)
 
     def reassign_task_to_me(self, task_id: str) -> bool:
         """
@@ -528,7 +737,7 @@ class TaskCopilotClient:
         except sqlite3.Error:
             return False
         finally:
-            conn.close()
+            self._release(conn)
 
 
 # Convenience function for creating a client
@@ -566,10 +775,11 @@ if __name__ == "__main__":
             print(f"  {stream}")
         print()
 
-        # Get progress for each stream
+        # Get progress for each stream (one bulk query)
         print("=== Stream Progress ===")
+        progress_by_stream = client.stream_get_all()
         for stream in streams:
-            progress = client.stream_get(stream.stream_id)
+            progress = progress_by_stream.get(stream.stream_id)
             if progress:
                 print(f"  {progress}")
         print()
@@ -279,7 +279,27 @@ CREATE INDEX IF NOT EXISTS idx_violations_severity ON protocol_violations(severi
 CREATE INDEX IF NOT EXISTS idx_violations_created ON protocol_violations(created_at DESC);
 `;
 
-const CURRENT_VERSION = 10;
+// Migration SQL for version 11: Stream lookup index
+const MIGRATION_V11_SQL = `
+-- Expression index on the stream ID stored in task metadata. Queries that
+-- filter or group by json_extract(metadata, '$.streamId') use it directly
+-- instead of scanning every task.
+CREATE INDEX IF NOT EXISTS idx_tasks_stream ON tasks(json_extract(metadata, '$.streamId'), archived, created_at);
+`;
+
+// Migration SQL for version 12: Status indexes
+const MIGRATION_V12_SQL = `
+-- Compound indexes for status filters. The v11 stream index is replaced by
+-- one that adds status after (stream, archived): per-stream lookups still
+-- use the same prefix, while per-stream status filters and counts seek on
+-- status instead of filtering every task in the stream. Workspace-wide status
+-- counts are answered from (archived, status) without touching the table.
+DROP INDEX IF EXISTS idx_tasks_stream;
+CREATE INDEX IF NOT EXISTS idx_tasks_stream_status ON tasks(json_extract(metadata, '$.streamId'), archived, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_archived_status ON tasks(archived, status);
+`;
+
+const CURRENT_VERSION = 12;
 
 export class DatabaseClient {
   private db: Database.Database;
@@ -409,6 +429,24 @@ export class DatabaseClient {
         new Date().toISOString()
       );
     }
+
+    // Migration v11: Stream lookup index
+    if (currentVersion < 11) {
+      this.db.exec(MIGRATION_V11_SQL);
+      this.db.prepare('INSERT INTO migrations (version, applied_at) VALUES (?, ?)').run(
+        11,
+        new Date().toISOString()
+      );
+    }
+
+    // Migration v12: Status indexes
+    if (currentVersion < 12) {
+      this.db.exec(MIGRATION_V12_SQL);
+      this.db.prepare('INSERT INTO migrations (version, applied_at) VALUES (?, ?)').run(
+        12,
+        new Date().toISOString()
+      );
+    }
   }
 
   getWorkspaceId(): string {
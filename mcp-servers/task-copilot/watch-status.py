@@ -40,6 +40,9 @@ except ImportError:
 DEFAULT_API_BASE = "http://127.0.0.1:9090"
 DEFAULT_REFRESH_INTERVAL = 5  # seconds
 PROGRESS_BAR_WIDTH = 20
+# Every bar of the default width, indexed by number of filled cells
+PROGRESS_BARS = tuple('█' * filled + '░' * (PROGRESS_BAR_WIDTH - filled)
+                      for filled in range(PROGRESS_BAR_WIDTH + 1))
 
 # ANSI color codes
 class Colors:
@@ -112,9 +115,11 @@ class StatusMonitor:
 
     def _progress_bar(self, percentage: float, width: int = PROGRESS_BAR_WIDTH) -> str:
         """Create Unicode progress bar."""
-        filled = int(width * percentage / 100)
-        empty = width - filled
-        bar = '█' * filled + '░' * empty
+        filled = min(int(width * percentage / 100), width)
+        if width == PROGRESS_BAR_WIDTH:
+            bar = PROGRESS_BARS[filled]
+        else:
+            bar = '█' * filled + '░' * (width - filled)
 
         # Color based on completion
         if percentage >= 100:
@@ -192,7 +197,7 @@ class StatusMonitor:
         task_count = f"({completed}/{total} tasks)"
 
         # Calculate visible length (without ANSI codes)
-        visible_content = f"Overall: {'█' * PROGRESS_BAR_WIDTH} {percentage:5.1f}% {task_count}"
+        visible_content = f"Overall: {PROGRESS_BARS[-1]} {percentage:5.1f}% {task_count}"
         padding = 68 - len(visible_content) - 2
 
         print(f"║  Overall: {bar} {pct} {self._color(task_count, Colors.WHITE)}{' ' * max(0, padding)}║")
@@ -208,7 +213,7 @@ class StatusMonitor:
         status = stream.get('status', 'pending')
 
         percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        bar = self._progress_bar(percentage, 20)
+        bar = self._progress_bar(percentage)
         pct = self._format_percentage(percentage)
         icon = self._status_icon(status)
 
@@ -225,7 +230,7 @@ class StatusMonitor:
 
         # Calculate visible length (without ANSI codes)
         # Format: "  {stream_id} ({phase})  {bar} {pct} {status_or_tasks}"
-        bar_plain = '█' * 20  # Progress bar visual width
+        bar_plain = PROGRESS_BARS[-1]  # Progress bar visual width
         pct_plain = f"{percentage:5.1f}%"
 
         if status.lower() == 'completed':
@@ -722,6 +722,7 @@ def get_progress_bar_style(percentage: float) -> Dict[str, str]:
     Returns:
         Dictionary with filled_style, empty_style, emoji, and status keys.
     """
+    # NaN fails every comparison below and falls through to the low style
     if percentage >= 90:
         return {
             "filled_style": "error",
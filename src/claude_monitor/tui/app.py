@@ -129,8 +129,9 @@ class ClaudeMonitorApp(App):
         Args:
             data: Monitoring data dictionary
         """
-        # Update state
-        self.state.update_from_monitoring_data(data)
+        # Update state; nothing to redraw if it was skipped (paused or repeated payload)
+        if not self.state.update_from_monitoring_data(data):
+            return
 
         # Post event for widgets to react
         self.post_message(DataUpdated(data))
@@ -1,6 +1,6 @@
 """Agents activity screen."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
@@ -74,6 +74,10 @@ class AgentsScreen(BaseMonitorScreen):
         ("enter", "show_details", "Details"),
     ]
 
+    # Blocks list the active blocks were last collected from
+    _blocks_source: Optional[Sequence[Dict[str, Any]]] = None
+    _active_blocks: List[Dict[str, Any]] = []
+
     def compose(self) -> ComposeResult:
         """Compose the agents view layout."""
         with Container(id="agents-container"):
@@ -123,25 +127,28 @@ class AgentsScreen(BaseMonitorScreen):
         self._update_summary(agents)
         self._update_relationships(agents)
 
-    def _extract_agents_from_blocks(self, blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _extract_agents_from_blocks(self, blocks: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract agent info from blocks (placeholder)."""
+        # Active blocks are collected once per blocks list; refreshes that
+        # see the same list reuse them instead of rescanning every block
+        if blocks is not self._blocks_source:
+            self._blocks_source = blocks
+            self._active_blocks = [block for block in blocks if block.get("isActive")]
+
         # This would be populated from the orchestrator with actual agent data
         # For now, return mock data showing the structure
-        agents = []
-
-        for block in blocks:
-            if block.get("isActive"):
-                agents.append({
-                    "name": "Main Session",
-                    "type": "Session",
-                    "tokens": block.get("totalTokens", 0),
-                    "is_active": True,
-                    "context_percent": block.get("usagePercentage", 0),
-                    "last_action": "Active monitoring",
-                    "parent_id": None,
-                })
-
-        return agents
+        return [
+            {
+                "name": "Main Session",
+                "type": "Session",
+                "tokens": block.get("totalTokens", 0),
+                "is_active": True,
+                "context_percent": block.get("usagePercentage", 0),
+                "last_action": "Active monitoring",
+                "parent_id": None,
+            }
+            for block in self._active_blocks
+        ]
 
     def _update_summary(self, agents: List[Dict[str, Any]]) -> None:
         """Update the summary display."""
@@ -2,8 +2,9 @@
 
 import logging
 import traceback
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar, FrozenSet
 
+from textual.binding import Binding
 from textual.widget import Widget
 
 if TYPE_CHECKING:
@@ -30,6 +31,17 @@ class BaseMonitorScreen(Widget):
     }
     """
 
+    # Keys bound by this screen's BINDINGS (and its parent screens'), set per subclass
+    BINDING_KEYS: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        own_keys = frozenset(
+            b.key if isinstance(b, Binding) else b[0]
+            for b in cls.__dict__.get("BINDINGS", ())
+        )
+        cls.BINDING_KEYS = cls.BINDING_KEYS | own_keys
+
     @property
     def monitor_app(self) -> "ClaudeMonitorApp":
         """Get the typed app instance."""
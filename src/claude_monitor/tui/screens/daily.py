@@ -135,19 +135,20 @@ class DailyScreen(BaseMonitorScreen):
             if isinstance(start_time, str):
                 try:
                     dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                    date_str = dt.strftime("%Y-%m-%d")
-                    hour = dt.hour
                 except (ValueError, AttributeError):
                     continue
             else:
                 continue
 
-            # Aggregate
-            daily[date_str]["date"] = date_str
-            daily[date_str]["tokens"] += block.get("totalTokens", 0)
-            daily[date_str]["cost"] += block.get("costUSD", 0.0)
-            daily[date_str]["sessions"] += 1
-            daily[date_str]["hours"][hour] += block.get("totalTokens", 0)
+            # Aggregate (isoformat() is much cheaper than strftime())
+            date_str = dt.date().isoformat()
+            day = daily[date_str]
+            tokens = block.get("totalTokens", 0)
+            day["date"] = date_str
+            day["tokens"] += tokens
+            day["cost"] += block.get("costUSD", 0.0)
+            day["sessions"] += 1
+            day["hours"][dt.hour] += tokens
 
         # Find peak hours and convert to list
         result = []
@@ -112,18 +112,18 @@ class MonthlyScreen(BaseMonitorScreen):
             if isinstance(start_time, str):
                 try:
                     dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                    month_str = dt.strftime("%Y-%m")
-                    date_str = dt.strftime("%Y-%m-%d")
                 except (ValueError, AttributeError):
                     continue
             else:
                 continue
 
-            # Aggregate
-            monthly[month_str]["month"] = month_str
-            monthly[month_str]["tokens"] += block.get("totalTokens", 0)
-            monthly[month_str]["cost"] += block.get("costUSD", 0.0)
-            monthly[month_str]["days"].add(date_str)
+            # Aggregate (days only need counting, so the date itself is the key)
+            month_str = f"{dt.year:04d}-{dt.month:02d}"
+            month = monthly[month_str]
+            month["month"] = month_str
+            month["tokens"] += block.get("totalTokens", 0)
+            month["cost"] += block.get("costUSD", 0.0)
+            month["days"].add(dt.date())
 
         # Calculate daily averages and convert to list
         result = []
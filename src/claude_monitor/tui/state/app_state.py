@@ -1,11 +1,16 @@
 """Centralized application state for the TUI."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+# Slotted state instances where supported (dataclass(slots=True) needs
+# Python 3.10+; explicit __slots__ would clash with the field defaults)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SessionState:
     """Current active session state."""
 
@@ -23,7 +28,7 @@ class SessionState:
     end_time: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AppState:
     """Central application state for the TUI.
 
@@ -56,14 +61,25 @@ class AppState:
     # Filter state
     filter_text: str = ""
 
-    def update_from_monitoring_data(self, monitoring_data: Dict[str, Any]) -> None:
+    # Last payload applied by update_from_monitoring_data (held, not just its
+    # id(), so a new payload can never be mistaken for it)
+    _last_payload: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def update_from_monitoring_data(self, monitoring_data: Dict[str, Any]) -> bool:
         """Update state from orchestrator monitoring data.
 
         Args:
             monitoring_data: Data dict from orchestrator callback
+
+        Returns:
+            True if the state was updated, False if it was skipped because
+            monitoring is paused or this payload was already applied
         """
-        if self.is_paused:
-            return
+        if self.is_paused or monitoring_data is self._last_payload:
+            return False
+        self._last_payload = monitoring_data
 
         data = monitoring_data.get("data", {})
         blocks = data.get("blocks", [])
@@ -117,6 +133,7 @@ class AppState:
         # Update refresh time
         self.last_refresh = datetime.now()
         self.is_loading = False
+        return True
 
     def toggle_paused(self) -> bool:
         """Toggle pause state.
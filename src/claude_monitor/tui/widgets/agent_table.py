@@ -1,12 +1,34 @@
 """Agent data table widget for agents view."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import DataTable
 
+# (casefolded name, casefolded type, agent) per agent, built once per agents update
+SearchIndex = List[Tuple[str, str, Dict[str, Any]]]
+
+
+def _build_search_index(agents: List[Dict[str, Any]]) -> SearchIndex:
+    """Casefold each agent's searchable fields once, rather than on every keystroke."""
+    return [
+        (agent.get("name", "").casefold(), agent.get("type", "").casefold(), agent)
+        for agent in agents
+    ]
+
+
+def _filter_agents(index: SearchIndex, filter_text: str, show_inactive: bool) -> List[Dict[str, Any]]:
+    """Agents matching the filter text (by name or type) and active state."""
+    needle = filter_text.casefold()
+    return [
+        agent
+        for name, agent_type, agent in index
+        if (show_inactive or agent.get("is_active", False))
+        and (not needle or needle in name or needle in agent_type)
+    ]
+
 
 class AgentDataTable(Widget):
     """Data table for displaying agent activity."""
@@ -27,6 +49,8 @@ class AgentDataTable(Widget):
     sort_column: reactive[str] = reactive("tokens")
     sort_reverse: reactive[bool] = reactive(True)
 
+    _search_index: Optional[SearchIndex] = None  # rebuilt lazily after agents changes
+
     def compose(self) -> ComposeResult:
         """Compose the data table."""
         yield DataTable(id="agent-data-table")
@@ -52,24 +76,9 @@ class AgentDataTable(Widget):
 
     def _filter_agents(self) -> List[Dict[str, Any]]:
         """Filter agents based on current filter settings."""
-        filtered = []
-
-        for agent in self.agents:
-            # Filter by active state
-            if not self.show_inactive and not agent.get("is_active", False):
-                continue
-
-            # Filter by text
-            if self.filter_text:
-                filter_lower = self.filter_text.lower()
-                name = agent.get("name", "").lower()
-                agent_type = agent.get("type", "").lower()
-                if filter_lower not in name and filter_lower not in agent_type:
-                    continue
-
-            filtered.append(agent)
-
-        return filtered
+        if self._search_index is None:
+            self._search_index = _build_search_index(self.agents)
+        return _filter_agents(self._search_index, self.filter_text, self.show_inactive)
 
     def _load_data(self) -> None:
         """Load data into the table."""
@@ -124,6 +133,7 @@ class AgentDataTable(Widget):
 
     def watch_agents(self, value: List[Dict[str, Any]]) -> None:
         """React to agent data changes."""
+        self._search_index = None
         self._load_data()
 
     def watch_filter_text(self, value: str) -> None:
@@ -1,5 +1,6 @@
 """Model usage distribution widget."""
 
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from textual.app import ComposeResult
@@ -9,6 +10,19 @@ from textual.widget import Widget
 from textual.widgets import Static
 
 
+@lru_cache(maxsize=128)
+def _model_display_name(model_id: str) -> str:
+    """Display-friendly name for a model ID (cached; the set of IDs is small)."""
+    model_lower = model_id.lower()
+    if "opus" in model_lower:
+        return "Opus 4"
+    elif "sonnet" in model_lower:
+        return "Sonnet 4.5"
+    elif "haiku" in model_lower:
+        return "Haiku"
+    return model_id[:20]
+
+
 class ModelUsageWidget(Widget):
     """Widget displaying per-model token usage breakdown."""
 
@@ -75,14 +89,7 @@ class ModelUsageWidget(Widget):
 
     def _get_model_display_name(self, model_id: str) -> str:
         """Get a display-friendly model name."""
-        model_lower = model_id.lower()
-        if "opus" in model_lower:
-            return "Opus 4"
-        elif "sonnet" in model_lower:
-            return "Sonnet 4.5"
-        elif "haiku" in model_lower:
-            return "Haiku"
-        return model_id[:20]
+        return _model_display_name(model_id)
 
     def _get_model_color_class(self, model_id: str) -> str:
         """Get CSS class for model color."""
@@ -1,44 +1,44 @@
 """Progress bar widgets for usage display."""
 
+from typing import Optional, Tuple
+
 from textual.app import ComposeResult
-from textual.containers import Horizontal
 from textual.reactive import reactive
 from textual.widget import Widget
-from textual.widgets import Label, ProgressBar, Static
+from textual.widgets import Static
 
+# Width of the rendered bar in cells
+BAR_WIDTH = 30
 
-class TokenBar(Widget):
-    """Token usage progress bar with threshold coloring."""
+# Precomputed filled/empty segments indexed by cell count
+_FILLED_SEGMENTS = tuple("█" * i for i in range(BAR_WIDTH + 1))
+_EMPTY_SEGMENTS = tuple("░" * i for i in range(BAR_WIDTH + 1))
 
-    DEFAULT_CSS = """
-    TokenBar {
-        height: 3;
-        padding: 0 1;
-    }
 
-    TokenBar .bar-label {
-        width: 10;
-    }
+def _render_bar(pct: float, color: str) -> str:
+    """Render a percentage as a Rich markup bar of BAR_WIDTH cells.
 
-    TokenBar .bar-container {
-        width: 1fr;
-    }
+    Args:
+        pct: Percentage to render (clamped to 0-100)
+        color: Rich color for the filled segment
 
-    TokenBar ProgressBar {
-        width: 100%;
-    }
+    Returns:
+        Markup string for the bar
+    """
+    filled = int(BAR_WIDTH * max(0.0, min(pct, 100.0)) / 100)
+    return (
+        f"[{color}]{_FILLED_SEGMENTS[filled]}[/]"
+        f"[dim]{_EMPTY_SEGMENTS[BAR_WIDTH - filled]}[/]"
+    )
 
-    TokenBar .bar-value {
-        width: 20;
-        text-align: right;
-    }
 
-    TokenBar.warning ProgressBar > .bar--bar {
-        color: $warning;
-    }
+class TokenBar(Widget):
+    """Token usage progress bar with threshold coloring."""
 
-    TokenBar.critical ProgressBar > .bar--bar {
-        color: $error;
+    DEFAULT_CSS = """
+    TokenBar {
+        height: 1;
+        padding: 0 1;
     }
     """
 
@@ -46,13 +46,14 @@ class TokenBar(Widget):
     token_limit: reactive[int] = reactive(44000)
     show_label: reactive[bool] = reactive(True)
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the widget."""
+        super().__init__(*args, **kwargs)
+        self._bar = Static("", classes="bar")
+
     def compose(self) -> ComposeResult:
         """Compose the token bar layout."""
-        with Horizontal():
-            if self.show_label:
-                yield Label("Tokens:", classes="bar-label")
-            yield ProgressBar(total=100, show_eta=False, show_percentage=False, classes="bar-container")
-            yield Static("", id="token-value", classes="bar-value")
+        yield self._bar
 
     def on_mount(self) -> None:
         """Initialize the progress bar."""
@@ -63,29 +64,34 @@ class TokenBar(Widget):
         if not self.is_mounted:
             return
 
-        try:
-            # Calculate percentage
-            if self.token_limit > 0:
-                pct = (self.tokens_used / self.token_limit) * 100
-            else:
-                pct = 0
-
-            # Update progress bar
-            bar = self.query_one(ProgressBar)
-            bar.update(progress=pct)
-
-            # Update value display
-            value = self.query_one("#token-value", Static)
-            value.update(f"{self.tokens_used:,} / {self.token_limit:,}")
-
-            # Update styling based on threshold
-            self.remove_class("warning", "critical")
-            if pct >= 90:
-                self.add_class("critical")
-            elif pct >= 75:
-                self.add_class("warning")
-        except Exception:
-            pass  # Widget not fully mounted yet
+        # Calculate percentage
+        if self.token_limit > 0:
+            pct = (self.tokens_used / self.token_limit) * 100
+        else:
+            pct = 0
+
+        # Update styling based on threshold
+        self.remove_class("warning", "critical")
+        if pct >= 90:
+            self.add_class("critical")
+            color = "red"
+        elif pct >= 75:
+            self.add_class("warning")
+            color = "yellow"
+        else:
+            color = "green"
+
+        label = "Tokens:   " if self.show_label else ""
+        self._bar.update(
+            f"{label}{_render_bar(pct, color)} "
+            f"{self.tokens_used:,} / {self.token_limit:,}"
+        )
+
+    def set_usage(self, used: int, limit: int) -> None:
+        """Set tokens used and limit together with a single redraw."""
+        self.set_reactive(TokenBar.tokens_used, used)
+        self.set_reactive(TokenBar.token_limit, limit)
+        self._update_display()
 
     def watch_tokens_used(self, value: int) -> None:
         """React to token changes."""
@@ -103,43 +109,23 @@ class CostBar(Widget):
 
     DEFAULT_CSS = """
     CostBar {
-        height: 3;
+        height: 1;
         padding: 0 1;
     }
-
-    CostBar .bar-label {
-        width: 10;
-    }
-
-    CostBar .bar-container {
-        width: 1fr;
-    }
-
-    CostBar ProgressBar {
-        width: 100%;
-    }
-
-    CostBar .bar-value {
-        width: 20;
-        text-align: right;
-    }
-
-    CostBar ProgressBar > .bar--bar {
-        color: $success;
-    }
     """
 
     cost_used: reactive[float] = reactive(0.0)
     cost_projected: reactive[float] = reactive(0.0)
     show_label: reactive[bool] = reactive(True)
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the widget."""
+        super().__init__(*args, **kwargs)
+        self._bar = Static("", classes="bar")
+
     def compose(self) -> ComposeResult:
         """Compose the cost bar layout."""
-        with Horizontal():
-            if self.show_label:
-                yield Label("Cost:", classes="bar-label")
-            yield ProgressBar(total=100, show_eta=False, show_percentage=False, classes="bar-container")
-            yield Static("", id="cost-value", classes="bar-value")
+        yield self._bar
 
     def on_mount(self) -> None:
         """Initialize the progress bar."""
@@ -150,25 +136,22 @@ class CostBar(Widget):
         if not self.is_mounted:
             return
 
-        try:
-            # Calculate percentage based on projected
-            if self.cost_projected > 0:
-                pct = (self.cost_used / self.cost_projected) * 100
-            else:
-                pct = 0
-
-            # Update progress bar
-            bar = self.query_one(ProgressBar)
-            bar.update(progress=min(pct, 100))
-
-            # Update value display
-            value = self.query_one("#cost-value", Static)
-            if self.cost_projected > 0:
-                value.update(f"${self.cost_used:.2f} / ${self.cost_projected:.2f}")
-            else:
-                value.update(f"${self.cost_used:.2f}")
-        except Exception:
-            pass  # Widget not fully mounted yet
+        # Calculate percentage based on projected
+        if self.cost_projected > 0:
+            pct = (self.cost_used / self.cost_projected) * 100
+            value = f"${self.cost_used:.2f} / ${self.cost_projected:.2f}"
+        else:
+            pct = 0
+            value = f"${self.cost_used:.2f}"
+
+        label = "Cost:     " if self.show_label else ""
+        self._bar.update(f"{label}{_render_bar(pct, 'green')} {value}")
+
+    def set_cost(self, used: float, projected: float) -> None:
+        """Set cost used and projected together with a single redraw."""
+        self.set_reactive(CostBar.cost_used, used)
+        self.set_reactive(CostBar.cost_projected, projected)
+        self._update_display()
 
     def watch_cost_used(self, value: float) -> None:
         """React to cost changes."""
@@ -186,43 +169,25 @@ class TimeBar(Widget):
 
     DEFAULT_CSS = """
     TimeBar {
-        height: 3;
+        height: 1;
         padding: 0 1;
     }
-
-    TimeBar .bar-label {
-        width: 10;
-    }
-
-    TimeBar .bar-container {
-        width: 1fr;
-    }
-
-    TimeBar ProgressBar {
-        width: 100%;
-    }
-
-    TimeBar .bar-value {
-        width: 20;
-        text-align: right;
-    }
-
-    TimeBar ProgressBar > .bar--bar {
-        color: cyan;
-    }
     """
 
     elapsed_minutes: reactive[float] = reactive(0.0)
     total_minutes: reactive[float] = reactive(300.0)  # 5 hours default
     show_label: reactive[bool] = reactive(True)
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the widget."""
+        super().__init__(*args, **kwargs)
+        self._bar = Static("", classes="bar")
+        # Last rendered (filled cells, elapsed, remaining whole minutes)
+        self._last_time_values: Optional[Tuple[int, int, int]] = None
+
     def compose(self) -> ComposeResult:
         """Compose the time bar layout."""
-        with Horizontal():
-            if self.show_label:
-                yield Label("Time:", classes="bar-label")
-            yield ProgressBar(total=100, show_eta=False, show_percentage=False, classes="bar-container")
-            yield Static("", id="time-value", classes="bar-value")
+        yield self._bar
 
     def on_mount(self) -> None:
         """Initialize the progress bar."""
@@ -233,27 +198,28 @@ class TimeBar(Widget):
         if not self.is_mounted:
             return
 
-        try:
-            # Calculate percentage
-            if self.total_minutes > 0:
-                pct = (self.elapsed_minutes / self.total_minutes) * 100
-            else:
-                pct = 0
-
-            # Update progress bar
-            bar = self.query_one(ProgressBar)
-            bar.update(progress=min(pct, 100))
-
-            # Update value display
-            value = self.query_one("#time-value", Static)
-            elapsed_h = int(self.elapsed_minutes // 60)
-            elapsed_m = int(self.elapsed_minutes % 60)
-            remaining = max(0, self.total_minutes - self.elapsed_minutes)
-            remaining_h = int(remaining // 60)
-            remaining_m = int(remaining % 60)
-            value.update(f"{elapsed_h}h{elapsed_m:02d}m / {remaining_h}h{remaining_m:02d}m left")
-        except Exception:
-            pass  # Widget not fully mounted yet
+        # Calculate percentage
+        if self.total_minutes > 0:
+            pct = (self.elapsed_minutes / self.total_minutes) * 100
+        else:
+            pct = 0
+
+        # Only redraw when the bar or the whole-minute values change
+        filled = int(BAR_WIDTH * max(0.0, min(pct, 100.0)) / 100)
+        elapsed_total = int(self.elapsed_minutes)
+        remaining_total = int(max(0, self.total_minutes - self.elapsed_minutes))
+        time_values = (filled, elapsed_total, remaining_total)
+        if time_values == self._last_time_values:
+            return
+
+        elapsed_h, elapsed_m = divmod(elapsed_total, 60)
+        remaining_h, remaining_m = divmod(remaining_total, 60)
+        label = "Time:     " if self.show_label else ""
+        self._bar.update(
+            f"{label}{_render_bar(pct, 'cyan')} "
+            f"{elapsed_h}h{elapsed_m:02d}m / {remaining_h}h{remaining_m:02d}m left"
+        )
+        self._last_time_values = time_values
 
     def watch_elapsed_minutes(self, value: float) -> None:
         """React to elapsed time changes."""
@@ -1,15 +1,38 @@
 """Session data table widget for daily/monthly views."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from textual.app import ComposeResult
+from textual.coordinate import Coordinate
 from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import DataTable
+from textual.widgets.data_table import CellDoesNotExist
 
 logger = logging.getLogger(__name__)
 
+# Maps data field names (as used by sort_column) to table column keys
+_SORT_COLUMN_KEYS: Dict[str, str] = {
+    "date": "date",
+    "month": "month",
+    "tokens": "tokens",
+    "cost": "cost",
+    "sessions": "sessions",
+    "peak_hour": "peak",
+    "days_active": "days",
+    "daily_avg": "avg",
+}
+
+
+def _cell_sort_key(value: Any) -> Tuple[int, Any]:
+    """Sort key for a formatted cell, ordering numbers numerically."""
+    text = str(value)
+    try:
+        return (0, float(text.replace("$", "").replace(",", "")))
+    except ValueError:
+        return (1, text)
+
 
 class SessionDataTable(Widget):
     """Data table for displaying session/daily/monthly data."""
@@ -34,6 +57,7 @@ class SessionDataTable(Widget):
         super().__init__(*args, **kwargs)
         self._columns_initialized = False
         self._current_column_mode: Optional[str] = None
+        self._is_empty_row_shown = False
 
     def compose(self) -> ComposeResult:
         """Compose the data table."""
@@ -62,6 +86,7 @@ class SessionDataTable(Widget):
         try:
             # First clear rows, then clear with columns
             table.clear()
+            self._is_empty_row_shown = False
             # Remove all existing columns by clearing with columns=True
             if table.columns:
                 logger.debug(f"Clearing {len(table.columns)} existing columns")
@@ -91,25 +116,26 @@ class SessionDataTable(Widget):
             logger.error(f"Error setting up columns: {e}")
 
     def _load_data(self) -> None:
-        """Load data into the table."""
-        table = self.query_one(DataTable)
-        table.clear()
+        """Load data into the table.
 
+        Rows are keyed by their index in ``data`` so the table can be
+        re-sorted in place without rebuilding it.
+        """
         if not self.data:
-            if self.view_mode == "daily":
-                table.add_row("No data", "--", "--", "--", "--")
-            else:
-                table.add_row("No data", "--", "--", "--", "--")
+            # Placeholder row is already showing, nothing to redraw
+            if self._is_empty_row_shown:
+                return
+            table = self.query_one(DataTable)
+            table.clear()
+            table.add_row("No data", "--", "--", "--", "--")
+            self._is_empty_row_shown = True
             return
 
-        # Sort data
-        sorted_data = sorted(
-            self.data,
-            key=lambda x: x.get(self.sort_column, ""),
-            reverse=self.sort_reverse,
-        )
+        table = self.query_one(DataTable)
+        table.clear()
+        self._is_empty_row_shown = False
 
-        for item in sorted_data:
+        for index, item in enumerate(self.data):
             if self.view_mode == "daily":
                 table.add_row(
                     item.get("date", "--"),
@@ -117,6 +143,7 @@ class SessionDataTable(Widget):
                     f"${item.get('cost', 0.0):.2f}",
                     str(item.get("sessions", 0)),
                     item.get("peak_hour", "--"),
+                    key=str(index),
                 )
             else:  # monthly
                 table.add_row(
@@ -125,10 +152,29 @@ class SessionDataTable(Widget):
                     f"${item.get('cost', 0.0):.2f}",
                     str(item.get("days_active", 0)),
                     f"{item.get('daily_avg', 0):,}",
+                    key=str(index),
                 )
 
-    def watch_data(self, value: List[Dict[str, Any]]) -> None:
+        self._sort_table()
+
+    def _sort_table(self) -> None:
+        """Sort the existing rows in place by the current sort column."""
+        if not self.data:
+            return
+
+        table = self.query_one(DataTable)
+        column_key = _SORT_COLUMN_KEYS.get(self.sort_column)
+        if column_key is None or column_key not in table.columns:
+            return
+
+        table.sort(column_key, key=_cell_sort_key, reverse=self.sort_reverse)
+
+    def watch_data(
+        self, old_value: List[Dict[str, Any]], new_value: List[Dict[str, Any]]
+    ) -> None:
         """React to data changes."""
+        if not old_value and not new_value and self._is_empty_row_shown:
+            return
         self._load_data()
 
     def watch_view_mode(self, value: str) -> None:
@@ -142,11 +188,11 @@ class SessionDataTable(Widget):
 
     def watch_sort_column(self, value: str) -> None:
         """React to sort column changes."""
-        self._load_data()
+        self._sort_table()
 
     def watch_sort_reverse(self, value: bool) -> None:
         """React to sort direction changes."""
-        self._load_data()
+        self._sort_table()
 
     def sort_by(self, column: str) -> None:
         """Sort by the specified column."""
@@ -160,7 +206,11 @@ class SessionDataTable(Widget):
         """Get the currently selected row data."""
         table = self.query_one(DataTable)
         if table.cursor_row is not None and self.data:
-            idx = table.cursor_row
+            try:
+                row_key, _ = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0))
+                idx = int(row_key.value)
+            except (CellDoesNotExist, TypeError, ValueError):
+                return None
             if 0 <= idx < len(self.data):
                 return self.data[idx]
         return None
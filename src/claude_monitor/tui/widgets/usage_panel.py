@@ -82,14 +82,10 @@ class UsagePanel(Widget):
             plan_info.update(f"Plan: {self.plan_name} | Limit: {self.token_limit:,} tokens{reset_str}")
 
             # Update token bar
-            token_bar = self.query_one(TokenBar)
-            token_bar.tokens_used = self.tokens_used
-            token_bar.token_limit = self.token_limit
+            self.query_one(TokenBar).set_usage(self.tokens_used, self.token_limit)
 
             # Update cost bar
-            cost_bar = self.query_one(CostBar)
-            cost_bar.cost_used = self.cost_used
-            cost_bar.cost_projected = self.cost_projected
+            self.query_one(CostBar).set_cost(self.cost_used, self.cost_projected)
 
             # Update summary
             summary = self.query_one("#summary", Static)
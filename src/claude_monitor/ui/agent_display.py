@@ -22,6 +22,14 @@ HEALTH_NORMAL_THRESHOLD = 500_000  # Under 500K tokens
 HEALTH_HEAVY_THRESHOLD = 1_000_000  # Under 1M tokens
 # Above 1M = Consider restart
 
+# Column setup shared by every agent table, as (header, add_column kwargs)
+_AGENT_TABLE_COLUMNS = (
+    ("Agent", {"style": "cyan", "width": 25}),
+    ("Last Action", {"style": "white", "width": 35}),
+    ("Tokens", {"style": "yellow", "justify": "right", "width": 12}),
+    ("Context %", {"style": "green", "justify": "right", "width": 10}),
+)
+
 
 class AgentDisplayComponent:
     """Display component for agent activity view."""
@@ -334,10 +342,8 @@ class AgentDisplayComponent:
             expand=True,
         )
 
-        table.add_column("Agent", style="cyan", width=25)
-        table.add_column("Last Action", style="white", width=35)
-        table.add_column("Tokens", style="yellow", justify="right", width=12)
-        table.add_column("Context %", style="green", justify="right", width=10)
+        for header, column_kwargs in _AGENT_TABLE_COLUMNS:
+            table.add_column(header, **column_kwargs)
 
         for agent in snapshot.agents[:15]:
             # Status indicator
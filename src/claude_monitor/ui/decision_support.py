@@ -4,8 +4,9 @@ Provides Tier 1 dashboard components for at-a-glance session health
 and work capacity information.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from claude_monitor.terminal.themes import (
     SESSION_HEALTH_STATUS,
@@ -14,11 +15,58 @@ from claude_monitor.terminal.themes import (
     get_session_health_status,
 )
 
+# Capacity of a limit that is not being consumed
+_UNLIMITED = float("inf")
+
+# Work capacity description bands: upper bounds (minutes, inclusive) and labels
+_CAPACITY_THRESHOLDS = (10, 30, 60, 120, 180)
+_CAPACITY_DESCRIPTIONS = (
+    "Minimal capacity - finish immediately",  # <= 10 mins
+    "Low capacity - finish current task",  # 10-30 mins
+    "Limited capacity - wrap up soon",  # 30-60 mins
+    "Moderate capacity remaining",  # 1-2 hours
+    "Good capacity for substantial tasks",  # 2-3 hours
+    "Plenty of capacity for complex work",  # > 3 hours
+)
+
+# Precomputed bar segments per bar width: (filled, empty) tuples indexed by length
+_BAR_SEGMENT_CACHE: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+
+def _bar_segments(filled: int, bar_width: int) -> Tuple[str, str]:
+    """Get the filled and empty bar strings for a bar of the given width.
+
+    Args:
+        filled: Number of filled cells.
+        bar_width: Total width of the bar.
+
+    Returns:
+        Tuple of (filled string, empty string).
+    """
+    # Out-of-range fills (negative or >100% inputs) are clamped so the bar
+    # keeps its width and always comes from the cache
+    if filled < 0:
+        filled = 0
+    elif filled > bar_width:
+        filled = bar_width
+
+    segments = _BAR_SEGMENT_CACHE.get(bar_width)
+    if segments is None:
+        segments = (
+            tuple("█" * i for i in range(bar_width + 1)),
+            tuple("░" * i for i in range(bar_width + 1)),
+        )
+        _BAR_SEGMENT_CACHE[bar_width] = segments
+    return segments[0][filled], segments[1][bar_width - filled]
+
 
-@dataclass
+@dataclass(frozen=True)
 class WorkCapacity:
     """Work capacity estimate for the current session."""
 
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("minutes_remaining", "tokens_remaining", "limiting_factor", "description")
+
     minutes_remaining: float
     tokens_remaining: int
     limiting_factor: str  # "tokens", "time", or "cost"
@@ -67,36 +115,24 @@ def calculate_work_capacity(
     if burn_rate > 0:
         minutes_until_tokens_gone = tokens_left / burn_rate
     else:
-        minutes_until_tokens_gone = float("inf")
+        minutes_until_tokens_gone = _UNLIMITED
 
     # Calculate time until cost runs out (if applicable)
     if cost_remaining is not None and cost_per_minute is not None and cost_per_minute > 0:
         minutes_until_cost_gone = cost_remaining / cost_per_minute
     else:
-        minutes_until_cost_gone = float("inf")
-
-    # Find the limiting factor
-    limiting_factors = [
-        ("tokens", minutes_until_tokens_gone),
-        ("time", time_to_reset_minutes),
-        ("cost", minutes_until_cost_gone),
-    ]
+        minutes_until_cost_gone = _UNLIMITED
 
-    limiting_factor, capacity_minutes = min(limiting_factors, key=lambda x: x[1])
+    # Find the limiting factor (ties go to tokens, then time, then cost)
+    capacity_minutes = minutes_until_tokens_gone
+    limiting_factor = "tokens"
+    if time_to_reset_minutes < capacity_minutes:
+        capacity_minutes, limiting_factor = time_to_reset_minutes, "time"
+    if minutes_until_cost_gone < capacity_minutes:
+        capacity_minutes, limiting_factor = minutes_until_cost_gone, "cost"
 
     # Generate description based on capacity
-    if capacity_minutes > 180:  # > 3 hours
-        description = "Plenty of capacity for complex work"
-    elif capacity_minutes > 120:  # 2-3 hours
-        description = "Good capacity for substantial tasks"
-    elif capacity_minutes > 60:  # 1-2 hours
-        description = "Moderate capacity remaining"
-    elif capacity_minutes > 30:  # 30-60 mins
-        description = "Limited capacity - wrap up soon"
-    elif capacity_minutes > 10:  # 10-30 mins
-        description = "Low capacity - finish current task"
-    else:
-        description = "Minimal capacity - finish immediately"
+    description = _CAPACITY_DESCRIPTIONS[bisect_left(_CAPACITY_THRESHOLDS, capacity_minutes)]
 
     return WorkCapacity(
         minutes_remaining=capacity_minutes,
@@ -110,6 +146,7 @@ def format_session_health_header(
     usage_pct: float,
     time_remaining_minutes: float,
     work_capacity: WorkCapacity,
+    status_key: Optional[str] = None,
 ) -> List[str]:
     """Format the session health header section (Tier 1).
 
@@ -117,11 +154,13 @@ def format_session_health_header(
         usage_pct: Current usage percentage.
         time_remaining_minutes: Minutes until reset.
         work_capacity: Calculated work capacity.
+        status_key: Precomputed health status key (computed if omitted).
 
     Returns:
         List of formatted lines for the header.
     """
-    status_key = get_session_health_status(usage_pct, time_remaining_minutes)
+    if status_key is None:
+        status_key = get_session_health_status(usage_pct, time_remaining_minutes)
     status = SESSION_HEALTH_STATUS[status_key]
 
     lines = []
@@ -169,12 +208,7 @@ def format_metric_progress_bar(
     # Calculate filled segments
     capped_pct = min(percentage, 100.0)
     filled = int(bar_width * capped_pct / 100)
-    empty = bar_width - filled
-
-    # Build the bar
-    filled_part = f"[{style_info['filled_style']}]{'█' * filled}[/]"
-    empty_part = f"[table.border]{'░' * empty}[/]"
-    bar = f"{filled_part}{empty_part}"
+    filled_bar, empty_bar = _bar_segments(filled, bar_width)
 
     # Format value string
     if is_currency:
@@ -187,7 +221,7 @@ def format_metric_progress_bar(
 
     return (
         f"{emoji} [value]{label}[/]".ljust(22)
-        + f" {style_info['emoji']} \\[{bar}] "
+        + f" {style_info['emoji']} \\[[{style_info['filled_style']}]{filled_bar}[/][table.border]{empty_bar}[/]] "
         + f"{percentage:5.1f}%   {value_str}"
     )
 
@@ -228,9 +262,9 @@ def format_time_bar(
         emoji = "🔴"
 
     filled = int(bar_width * (100 - percentage) / 100)
-    empty = bar_width - filled
+    filled_bar, empty_bar = _bar_segments(filled, bar_width)
 
-    bar = f"[{filled_style}]{'█' * filled}[/][table.border]{'░' * empty}[/]"
+    bar = f"[{filled_style}]{filled_bar}[/][table.border]{empty_bar}[/]"
 
     time_str = f"{hours}h {mins}m" if hours > 0 else f"{mins}m"
 
@@ -240,17 +274,20 @@ def format_time_bar(
 def format_recommendation(
     usage_pct: float,
     time_remaining_minutes: float,
+    status_key: Optional[str] = None,
 ) -> str:
     """Format the recommendation line.
 
     Args:
         usage_pct: Current usage percentage.
         time_remaining_minutes: Minutes until reset.
+        status_key: Precomputed health status key (computed if omitted).
 
     Returns:
         Formatted recommendation line.
     """
-    status_key = get_session_health_status(usage_pct, time_remaining_minutes)
+    if status_key is None:
+        status_key = get_session_health_status(usage_pct, time_remaining_minutes)
     recommendation = SESSION_RECOMMENDATIONS[status_key]
 
     return f"[info]💡 RECOMMENDATION:[/] {recommendation}"
@@ -303,31 +340,28 @@ def format_decision_support_panel(
         cost_per_minute=cost_per_minute,
     )
 
-    # Build the panel content
-    lines = []
+    # Health status drives both the header and the recommendation
+    usage_pct = max(token_pct, cost_pct)  # Use highest usage
+    status_key = get_session_health_status(usage_pct, time_remaining)
 
-    # Session health header
-    lines.extend(
-        format_session_health_header(
-            usage_pct=max(token_pct, cost_pct),  # Use highest usage
+    # Build the panel content in one list display
+    lines = [
+        # Session health header
+        *format_session_health_header(
+            usage_pct=usage_pct,
             time_remaining_minutes=time_remaining,
             work_capacity=work_capacity,
-        )
-    )
-    lines.append("")
-
-    # Progress bars
-    lines.append(
+            status_key=status_key,
+        ),
+        "",
+        # Progress bars
         format_metric_progress_bar(
             label="Token Usage",
             emoji="📊",
             percentage=token_pct,
             used=tokens_used,
             limit=token_limit,
-        )
-    )
-
-    lines.append(
+        ),
         format_metric_progress_bar(
             label="Cost Usage",
             emoji="💰",
@@ -335,26 +369,20 @@ def format_decision_support_panel(
             used=session_cost,
             limit=cost_limit,
             is_currency=True,
-        )
-    )
-
-    lines.append(
+        ),
         format_metric_progress_bar(
             label="Messages",
             emoji="📨",
             percentage=messages_pct,
             used=sent_messages,
             limit=messages_limit,
-        )
-    )
-
-    # Time bar
-    lines.append(format_time_bar(elapsed_minutes, total_minutes))
-
-    lines.append("")
-
-    # Recommendation
-    lines.append(format_recommendation(max(token_pct, cost_pct), time_remaining))
+        ),
+        # Time bar
+        format_time_bar(elapsed_minutes, total_minutes),
+        "",
+        # Recommendation
+        format_recommendation(usage_pct, time_remaining, status_key=status_key),
+    ]
 
     return lines
 
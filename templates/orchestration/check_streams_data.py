@@ -31,6 +31,8 @@ def main():
         print("NO_DATABASE")
         return
 
+    # Output lines are collected and written in one go when done
+    out = []
     try:
         # Determine initiative ID to filter by
         initiative_id = None
@@ -53,13 +55,13 @@ def main():
 
         # If no initiative found and filtering is enabled, report no initiative
         if not args.no_filter and not initiative_id:
-            print("NO_INITIATIVE")
+            out.append("NO_INITIATIVE")
             return
 
         # Output initiative info if available
         if initiative_id and initiative_name:
             goal_str = initiative_goal if initiative_goal else ""
-            print(f"INITIATIVE {initiative_id}|{initiative_name}|{goal_str}")
+            out.append(f"INITIATIVE {initiative_id}|{initiative_name}|{goal_str}")
 
         # Get streams (filtered by initiative if applicable)
         streams = client.stream_list(initiative_id)
@@ -67,41 +69,47 @@ def main():
         # Check if there are any streams
         if not streams:
             if initiative_id:
-                print("NO_ACTIVE_STREAMS")
+                out.append("NO_ACTIVE_STREAMS")
             else:
-                print("NO_STREAMS")
+                out.append("NO_STREAMS")
             return
 
         # Get overall summary (filtered by initiative if applicable)
         summary = client.progress_summary(initiative_id)
-        print(f"OVERALL {summary.completed_tasks} {summary.total_tasks} {summary.in_progress_tasks} {summary.pending_tasks} {summary.completion_percentage}")
+        out.append(f"OVERALL {summary.completed_tasks} {summary.total_tasks} {summary.in_progress_tasks} {summary.pending_tasks} {summary.completion_percentage}")
+
+        # Progress for every stream in one query
+        progress_by_stream = client.stream_get_all(initiative_id)
 
         # Check if ALL streams are 100% complete
         all_complete = True
         for stream_info in streams:
-            progress = client.stream_get(stream_info.stream_id, initiative_id)
+            progress = progress_by_stream.get(stream_info.stream_id)
             if progress and not progress.is_complete:
                 all_complete = False
                 break
 
         if all_complete and streams:
             # All streams complete - still output them but signal completion
-            print("ALL_STREAMS_COMPLETE")
+            out.append("ALL_STREAMS_COMPLETE")
 
         # Get progress for each stream
         for stream_info in streams:
-            progress = client.stream_get(stream_info.stream_id, initiative_id)
+            progress = progress_by_stream.get(stream_info.stream_id)
             if progress:
                 # Format: STREAM <id> <completed> <total> <pct> <in_progress> <pending> <blocked> <stream_name>
                 stream_name = stream_info.stream_name if stream_info.stream_name else ""
-                print(f"STREAM {progress.stream_id} {progress.completed_tasks} {progress.total_tasks} {progress.completion_percentage} {progress.in_progress_tasks} {progress.pending_tasks} {progress.blocked_tasks} {stream_name}")
+                out.append(f"STREAM {progress.stream_id} {progress.completed_tasks} {progress.total_tasks} {progress.completion_percentage} {progress.in_progress_tasks} {progress.pending_tasks} {progress.blocked_tasks} {stream_name}")
 
     except FileNotFoundError:
         # Database doesn't exist - this is okay
-        print("NO_DATABASE")
+        out.append("NO_DATABASE")
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
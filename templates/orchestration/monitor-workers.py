@@ -3,8 +3,8 @@
 Monitor Workers Daemon - Auto-restart dead/crashed workers
 
 This daemon continuously monitors worker processes for crashes and automatically
-restarts them with configurable retry limits. It uses the same zombie detection
-pattern as check-streams (ps -p verification).
+restarts them with configurable retry limits. Zombie processes are detected from
+/proc/<pid>/stat on Linux, falling back to ps -p verification elsewhere.
 
 Usage:
     python monitor-workers.py                       # One-shot check (no restart)
@@ -13,7 +13,7 @@ Usage:
     python monitor-workers.py --interval 30         # Custom check interval (seconds)
 
 Features:
-- Detects dead workers using ps -p verification (catches zombies)
+- Detects dead workers including zombies (/proc state, or ps -p without /proc)
 - Auto-restarts failed workers with configurable max restart count
 - Logs all restart attempts with timestamps
 - Works as background daemon or one-shot check
@@ -24,12 +24,13 @@ Features:
 import os
 import sys
 import time
+import atexit
 import signal
 import argparse
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Set
+from typing import Dict, FrozenSet, Optional, Set
 from collections import defaultdict
 
 # Import Task Copilot client
@@ -46,10 +47,18 @@ MONITOR_LOG = LOG_DIR / "monitor.log"
 # Default settings
 DEFAULT_CHECK_INTERVAL = 30  # seconds
 DEFAULT_MAX_RESTARTS = 2
+PID_WAIT_TIMEOUT = 2.0  # seconds to wait for a restarted wrapper's PID file
+PID_POLL_INTERVAL = 0.01  # seconds
 
 # Task Copilot workspace ID
 WORKSPACE_ID = PROJECT_NAME
 
+# Shared dependency set for streams without dependencies
+_NO_DEPENDENCIES: FrozenSet[str] = frozenset()
+
+# Linux exposes process state in /proc; elsewhere fall back to ps
+HAS_PROC = Path("/proc/self/stat").exists()
+
 
 class Colors:
     RED = '\033[0;31m'
@@ -63,25 +72,83 @@ class Colors:
     NC = '\033[0m'
 
 
+# Colored console prefix per log level
+_LEVEL_PREFIX = {
+    "INFO": f"{Colors.BLUE}[MONITOR]{Colors.NC} ",
+    "SUCCESS": f"{Colors.GREEN}[MONITOR]{Colors.NC} ",
+    "WARNING": f"{Colors.YELLOW}[MONITOR]{Colors.NC} ",
+    "ERROR": f"{Colors.RED}[MONITOR]{Colors.NC} ",
+}
+_DEFAULT_PREFIX = f"{Colors.NC}[MONITOR]{Colors.NC} "
+
+# Monitor log handle, opened on first use and kept for the life of the process
+_log_file = None
+
+
+def _get_log_file():
+    """Get the shared monitor log handle, opening it on first use."""
+    global _log_file
+    if _log_file is None:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        # Line buffered so the log stays tail-able while the daemon runs
+        _log_file = open(MONITOR_LOG, 'a', buffering=1)
+        atexit.register(_log_file.close)
+    return _log_file
+
+
 def log_message(msg: str, level: str = "INFO"):
     """Log message to both console and log file."""
     timestamp = datetime.now().isoformat()
     log_entry = f"[{timestamp}] [{level}] {msg}"
 
     # Console output with colors
-    color = {
-        "INFO": Colors.BLUE,
-        "SUCCESS": Colors.GREEN,
-        "WARNING": Colors.YELLOW,
-        "ERROR": Colors.RED,
-    }.get(level, Colors.NC)
-
-    print(f"{color}[MONITOR]{Colors.NC} {msg}")
+    print(_LEVEL_PREFIX.get(level, _DEFAULT_PREFIX) + msg)
 
     # File output
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(MONITOR_LOG, 'a') as f:
-        f.write(log_entry + '\n')
+    _get_log_file().write(log_entry + '\n')
+
+
+def _is_zombie(pid: int) -> bool:
+    """Check whether a process that passed kill -0 is a zombie or already gone.
+
+    Workers restarted by this monitor are its children, so waitpid reaps
+    and reports them directly. Other processes fall back to the state field
+    of /proc/<pid>/stat when available (no fork), otherwise to ps.
+    """
+    try:
+        wpid, _ = os.waitpid(pid, os.WNOHANG)
+        # A child that already exited has just been reaped
+        return wpid == pid
+    except ChildProcessError:
+        # Not our child
+        pass
+
+    if HAS_PROC:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            return True
+        # The command name may contain spaces or parens; state follows the last ')'
+        return stat.rsplit(b")", 1)[1].split()[0] == b"Z"
+
+    result = subprocess.run(
+        ["ps", "-p", str(pid), "-o", "pid="],
+        capture_output=True,
+        timeout=5
+    )
+    return result.returncode != 0
+
+
+def _stream_from_title(title: str, title_prefixes: Dict[str, str]) -> Optional[str]:
+    """Get the stream named by a "Stream-A: ..." or "[Stream-A] ..." task title.
+
+    title_prefixes maps each "Stream-A:" and "[Stream-A]" prefix to its stream ID.
+    """
+    end = title.find("]") if title.startswith("[") else title.find(":")
+    if end < 0:
+        return None
+    return title_prefixes.get(title[:end + 1])
 
 
 def success(msg: str):
@@ -98,11 +165,22 @@ def error(msg: str):
 
 class WorkerMonitor:
     def __init__(self, max_restarts: int = DEFAULT_MAX_RESTARTS, auto_restart: bool = False):
-        self.tc_client = TaskCopilotClient(WORKSPACE_ID)
+        # Polled every check interval, so keep the database connection open
+        self.tc_client = TaskCopilotClient(WORKSPACE_ID, keep_connection=True)
+        atexit.register(self.tc_client.close)
         self.max_restarts = max_restarts
         self.auto_restart = auto_restart
         self.restart_counts: Dict[str, int] = defaultdict(int)
 
+        # Streams never regress from complete, so resolved deps are remembered
+        self._completed_deps: Set[str] = set()
+        # Stream status fetched during the current check, cleared each tick
+        self._status_cache: Dict[str, Optional[dict]] = {}
+        # Dependency that last kept each stream from running, checked first
+        self._last_blocker: Dict[str, str] = {}
+        # Worker prompts by stream ID (streams and deps are fixed after __init__)
+        self._prompt_cache: Dict[str, str] = {}
+
         # Get active initiative
         self.initiative_id = self.tc_client.get_active_initiative_id()
         if not self.initiative_id:
@@ -151,10 +229,20 @@ class WorkerMonitor:
             error(f"Failed to query streams: {e}")
             return {}
 
-    def _build_dependency_graph(self) -> Dict[str, Set[str]]:
-        """Build stream dependency graph from task metadata."""
+    def _build_dependency_graph(self) -> Dict[str, FrozenSet[str]]:
+        """Build stream dependency graph from task metadata.
+
+        The graph is read-only after construction, so it is returned as
+        a plain dict of frozensets.
+        """
         dependency_graph: Dict[str, Set[str]] = defaultdict(set)
 
+        # Task title prefixes ("Stream-A:" or "[Stream-A]") that name a stream
+        title_prefixes: Dict[str, str] = {}
+        for sid in self.streams:
+            title_prefixes[f"{sid}:"] = sid
+            title_prefixes[f"[{sid}]"] = sid
+
         for stream_id, stream in self.streams.items():
             dependencies = stream.get("dependencies", [])
 
@@ -163,76 +251,132 @@ class WorkerMonitor:
                     dependency_graph[stream_id].add(dep)
                 else:
                     # Try to extract stream ID from task title format
-                    for sid in self.streams.keys():
-                        if dep.startswith(f"{sid}:") or dep.startswith(f"[{sid}]"):
-                            dependency_graph[stream_id].add(sid)
-                            break
+                    sid = _stream_from_title(dep, title_prefixes)
+                    if sid:
+                        dependency_graph[stream_id].add(sid)
 
-        return dependency_graph
+        return {stream_id: frozenset(deps) for stream_id, deps in dependency_graph.items()}
 
     def _is_running(self, stream_id: str) -> bool:
         """Check if a stream worker is currently running.
 
-        Uses ps -p verification to detect zombie processes.
-        Zombies pass kill -0 but ps -p will fail.
+        Zombies pass kill -0, so the process state is checked as well.
         """
         pid_file = PID_DIR / f"{stream_id}.pid"
-        if not pid_file.exists():
-            return False
 
         try:
-            pid = int(pid_file.read_text().strip())
+            # A single read covers both existence and parsing of the PID file
+            with open(pid_file, "rb") as f:
+                pid = int(f.read().strip())
+        except FileNotFoundError:
+            return False
+        except ValueError:
+            pid_file.unlink(missing_ok=True)
+            return False
 
-            # Check if process exists with kill -0
-            os.kill(pid, 0)
+        if pid <= 0:
+            # kill -0 on 0 or a negative PID would probe a process group
+            pid_file.unlink(missing_ok=True)
+            return False
 
-            # Double-check with ps to catch zombies
-            result = subprocess.run(
-                ["ps", "-p", str(pid), "-o", "pid="],
-                capture_output=True,
-                timeout=5
-            )
+        try:
+            # Check if process exists with kill -0
+            try:
+                os.kill(pid, 0)
+            except PermissionError:
+                # EPERM: the process exists but belongs to another user
+                pass
 
-            if result.returncode != 0:
+            # Double-check the process state to catch zombies
+            if _is_zombie(pid):
                 # Process is zombie or doesn't exist
                 pid_file.unlink(missing_ok=True)
                 return False
 
             return True
 
-        except (ProcessLookupError, ValueError, subprocess.TimeoutExpired):
+        except (ProcessLookupError, subprocess.TimeoutExpired):
             pid_file.unlink(missing_ok=True)
             return False
 
+    @staticmethod
+    def _progress_to_status(progress) -> Optional[dict]:
+        """Convert a StreamProgress into the status dict used by the monitor."""
+        if not progress:
+            return None
+
+        return {
+            "total_tasks": progress.total_tasks,
+            "completed_tasks": progress.completed_tasks,
+            "in_progress_tasks": progress.in_progress_tasks,
+            "is_complete": progress.is_complete
+        }
+
+    def _load_stream_statuses(self):
+        """Fill the status cache for all streams with one bulk query.
+
+        On failure the cache is left empty and _get_stream_status falls
+        back to per-stream queries.
+        """
+        try:
+            progress_by_stream = self.tc_client.stream_get_many(list(self.streams))
+        except Exception as e:
+            warn(f"Failed to bulk-load stream status: {e}")
+            return
+
+        for stream_id in self.streams:
+            self._status_cache[stream_id] = self._progress_to_status(progress_by_stream.get(stream_id))
+
     def _get_stream_status(self, stream_id: str):
-        """Get stream status using Task Copilot client."""
+        """Get stream status using Task Copilot client.
+
+        Results are cached for the duration of one check (see check_once).
+        """
+        if stream_id in self._status_cache:
+            return self._status_cache[stream_id]
+
+        status = None
         try:
-            progress = self.tc_client.stream_get(stream_id)
-            if not progress:
-                return None
-
-            return {
-                "total_tasks": progress.total_tasks,
-                "completed_tasks": progress.completed_tasks,
-                "in_progress_tasks": progress.in_progress_tasks,
-                "is_complete": progress.is_complete
-            }
+            status = self._progress_to_status(self.tc_client.stream_get(stream_id))
         except Exception as e:
             warn(f"Failed to get status for {stream_id}: {e}")
-            return None
+
+        self._status_cache[stream_id] = status
+        return status
+
+    def _is_dependency_complete(self, dep_stream_id: str) -> bool:
+        """Check if a single dependency stream is complete."""
+        if dep_stream_id in self._completed_deps:
+            return True
+
+        status = self._get_stream_status(dep_stream_id)
+        if not status or not status["is_complete"]:
+            return False
+
+        self._completed_deps.add(dep_stream_id)
+        return True
 
     def _are_dependencies_complete(self, stream_id: str) -> bool:
-        """Check if all dependencies for a stream are complete."""
-        dependencies = self.stream_dependencies.get(stream_id, set())
+        """Check if all dependencies for a stream are complete.
+
+        The dependency that blocked the stream on the previous check is
+        tried first, since it is the most likely to still be incomplete.
+        """
+        dependencies = self.stream_dependencies.get(stream_id, _NO_DEPENDENCIES)
 
         if not dependencies:
             return True
 
+        last_blocker = self._last_blocker.get(stream_id)
+        if last_blocker in dependencies and not self._is_dependency_complete(last_blocker):
+            return False
+
         for dep_stream_id in dependencies:
-            status = self._get_stream_status(dep_stream_id)
-            if not status or not status["is_complete"]:
+            if dep_stream_id != last_blocker and not self._is_dependency_complete(dep_stream_id):
+                self._last_blocker[stream_id] = dep_stream_id
                 return False
 
+        self._last_blocker.pop(stream_id, None)
         return True
 
     def _get_log_file(self, stream_id: str) -> Path:
@@ -264,21 +408,33 @@ class WorkerMonitor:
             if not self._are_dependencies_complete(stream_id):
                 continue
 
-            # Check if there's evidence of prior execution
-            log_file = self._get_log_file(stream_id)
-            if log_file.exists() and log_file.stat().st_size > 100:
-                # Worker ran but died - has incomplete tasks
-                if status and (status["completed_tasks"] > 0 or status["in_progress_tasks"] > 0):
-                    dead_workers.append(stream_id)
-                elif status and status["total_tasks"] > 0:
-                    # Had tasks but no progress - likely died early
-                    dead_workers.append(stream_id)
+            # Check if there's evidence of prior execution (one stat call)
+            try:
+                log_size = os.stat(self._get_log_file(stream_id)).st_size
+            except FileNotFoundError:
+                continue
+            if log_size <= 100:
+                continue
+
+            # Worker ran but died - has incomplete tasks
+            if status and (status["completed_tasks"] > 0 or status["in_progress_tasks"] > 0):
+                dead_workers.append(stream_id)
+            elif status and status["total_tasks"] > 0:
+                # Had tasks but no progress - likely died early
+                dead_workers.append(stream_id)
 
         return dead_workers
 
     def _build_prompt(self, stream: dict) -> str:
-        """Build the prompt for a Claude Code worker."""
-        dependencies = self.stream_dependencies.get(stream['id'], set())
+        """Build the prompt for a Claude Code worker (cached per stream)."""
+        prompt = self._prompt_cache.get(stream['id'])
+        if prompt is None:
+            prompt = self._prompt_cache[stream['id']] = self._render_prompt(stream)
+        return prompt
+
+    def _render_prompt(self, stream: dict) -> str:
+        """Render the worker prompt for a stream."""
+        dependencies = self.stream_dependencies.get(stream['id'], _NO_DEPENDENCIES)
         deps_str = ", ".join(dependencies) if dependencies else "None"
 
         return f"""You are a worker agent in the Claude Copilot orchestration system.
@@ -383,16 +539,26 @@ Begin by querying your task list with task_list.
                 prompt
             ],
             start_new_session=True,
+            # Descriptors opened from Python are non-inheritable already, so
+            # skip the close-all sweep before exec
+            close_fds=False,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
 
-        # Give wrapper a moment to write PID file
-        time.sleep(0.5)
-
-        # Read actual PID from file
-        if pid_file.exists():
-            actual_pid = pid_file.read_text().strip()
+        # Wait for the wrapper to write its PID file, giving up early if it exits
+        actual_pid = ""
+        deadline = time.monotonic() + PID_WAIT_TIMEOUT
+        while True:
+            try:
+                actual_pid = pid_file.read_text().strip()
+            except FileNotFoundError:
+                pass
+            if actual_pid or proc.poll() is not None or time.monotonic() >= deadline:
+                break
+            time.sleep(PID_POLL_INTERVAL)
+
+        if actual_pid:
             success(f"Worker {stream_id} restarted (PID: {actual_pid})")
             return True
         else:
@@ -408,6 +574,10 @@ Begin by querying your task list with task_list.
         if not self.streams:
             return {"dead_workers": [], "restart_performed": False}
 
+        # Fetch fresh status for all streams each tick
+        self._status_cache.clear()
+        self._load_stream_statuses()
+
         dead_workers = self._detect_dead_workers()
 
         if not dead_workers:
@@ -21,16 +21,24 @@ Routing Logs:
 """
 
 import json
+import re
+import atexit
 import subprocess
 import os
 import sys
 import time
 import signal
 import shutil
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from string import Template
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from collections import Counter, defaultdict, deque
 
 # Import Task Copilot client
 from task_copilot_client import TaskCopilotClient
@@ -41,12 +49,199 @@ PROJECT_ROOT = SCRIPT_DIR.parent.parent  # Go up from .claude/orchestrator to pr
 PROJECT_NAME = PROJECT_ROOT.name  # Auto-detect from directory name
 LOG_DIR = SCRIPT_DIR / "logs"
 PID_DIR = SCRIPT_DIR / "pids"
+WORKTREE_DIR = PROJECT_ROOT / ".claude" / "worktrees"
 ROUTING_LOG = LOG_DIR / "routing.log"
 POLL_INTERVAL = 30  # seconds
+MAX_STATUS_WORKERS = 8  # threads for per-stream status queries
+MAX_GIT_WORKERS = 16  # threads for per-worktree git probes and cleanup
+
+# Keyword arguments shared by the git subprocess calls made from the project root:
+# calls whose output is read, and calls whose output is discarded
+GIT_RUN_KWARGS = {"cwd": PROJECT_ROOT, "capture_output": True, "text": True}
+GIT_QUIET_KWARGS = {"cwd": PROJECT_ROOT, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+# Major/minor from `git --version` output, e.g. "git version 2.43.0"
+GIT_VERSION_RE = re.compile(r'git version (\d+)\.(\d+)')
+
+# Directories skipped when counting project files
+IGNORED_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv'})
+
+# Stream tasks of one initiative. A fixed string, so sqlite3's statement cache
+# on the kept connection only has to compile it once.
+INITIATIVE_TASKS_SQL = """
+    SELECT
+        t.id,
+        t.title,
+        t.status,
+        t.assigned_agent,
+        json_extract(t.metadata, '$.streamId') as stream_id,
+        json_extract(t.metadata, '$.files') as files
+    FROM tasks t
+    LEFT JOIN prds p ON t.prd_id = p.id
+    WHERE json_extract(t.metadata, '$.streamId') IS NOT NULL
+      AND t.archived = 0
+      AND p.initiative_id = ?
+    ORDER BY json_extract(t.metadata, '$.streamId'), t.created_at
+"""
+
+# Prompt given to every worker; filled in per stream by Orchestrator._render_prompt
+WORKER_PROMPT = Template("""You are a worker agent in the Claude Copilot orchestration system.
+
+## Your Assignment
+- Stream: $stream_id
+- Stream Name: $stream_name
+- Dependencies: $deps_str
+
+## MANDATORY PROTOCOL - YOU MUST FOLLOW THIS EXACTLY
+
+### Step 1: Query Your Tasks
+Call `task_list` with streamId filter to get your assigned tasks:
+```
+task_list(metadata.streamId="$stream_id")
+```
+
+### Step 2: Route Each Task to Its Assigned Agent
+
+**For EACH task in order:**
+
+1. **Get task details:**
+   ```
+   task_get(id="TASK-xxx")
+   ```
+
+2. **Check the assignedAgent field:**
+   - If `assignedAgent` is "me", execute the task yourself
+   - If `assignedAgent` is anything else (uid, qa, sec, uxd, etc.), invoke that agent
+
+3. **Route to specialized agent:**
+   ```
+   # Use Task tool to invoke the specialized agent
+   Task: Execute task TASK-xxx
+   Subagent: @agent-{assignedAgent}
+   Context: [Brief task context from task.title and task.description]
+   ```
+
+4. **Wait for agent to complete:**
+   - The specialized agent will call skill_evaluate() to load domain skills
+   - The specialized agent will execute the task
+   - The specialized agent will call task_update() when complete
+
+5. **Move to next task:**
+   - Do NOT mark tasks as complete yourself (agents do this)
+   - Simply move to the next task in your stream
+
+### Step 3: Verify Before Exiting
+
+**Before outputting any completion summary:**
+1. Call `task_list(metadata.streamId="$stream_id")` again
+2. Check that ALL tasks have `status: "completed"`
+3. If ANY task is still `pending` or `in_progress`, investigate and retry
+4. Only after verification passes, output your summary
+
+### Step 4: Output Summary
+Only after ALL tasks are verified complete in Task Copilot, output:
+- List of tasks routed to which agents
+- Which agents completed their work
+- Any commits made
+- Any issues encountered
+
+## CRITICAL RULES
+- DO NOT execute tasks assigned to specialized agents yourself
+- Each specialized agent loads their own domain skills via skill_evaluate()
+- DO NOT claim "complete" without verifying in Task Copilot first
+- Stay focused on $stream_id tasks only
+- If an agent is blocked, check task status and coordinate
+
+## Specialized Agent Examples
+
+**Example 1: UI Implementation Task**
+```
+Task Details:
+- id: TASK-123
+- title: "Implement topic card component"
+- assignedAgent: "uid"
+
+Action: Invoke @agent-uid via Task tool
+→ @agent-uid will call skill_evaluate() with files/context
+→ @agent-uid will load design-patterns or ux-patterns skills
+→ @agent-uid will implement component with accessibility
+→ @agent-uid will call work_product_store(taskId, type="implementation", ...)
+→ @agent-uid will call task_update(id="TASK-123", status="completed")
+```
+
+**Example 2: Testing Task**
+```
+Task Details:
+- id: TASK-456
+- title: "Add tests for evidence selector"
+- assignedAgent: "qa"
+
+Action: Invoke @agent-qa via Task tool
+→ @agent-qa will call skill_evaluate() with test file context
+→ @agent-qa will load pytest-patterns or jest-patterns skills
+→ @agent-qa will write comprehensive tests
+→ @agent-qa will call work_product_store(taskId, type="test_plan", ...)
+→ @agent-qa will call task_update(id="TASK-456", status="completed")
+```
+
+**Example 3: Generic Implementation Task**
+```
+Task Details:
+- id: TASK-789
+- title: "Fix evidence migration bug"
+- assignedAgent: "me"
+
+Action: Execute yourself (you are 'me')
+→ Call task_update(id="TASK-789", status="in_progress")
+→ Execute the fix
+→ Store work product (REQUIRED before completion)
+→ Call task_update(id="TASK-789", status="completed")
+```
+
+## MANDATORY: Work Product Before Completion
+
+**CRITICAL: You MUST store a work product before marking ANY task as completed.**
+
+Tasks have `verificationRequired=true` which enforces:
+1. Task must have `acceptanceCriteria` in metadata (set by @agent-ta)
+2. Task must have proof of completion (work product OR detailed notes)
+
+**Before calling `task_update(status="completed")`, ALWAYS call:**
+
+```
+work_product_store({
+  taskId: "TASK-xxx",
+  type: "implementation",  // or "test_plan", "documentation", etc.
+  title: "Brief title of what was done",
+  content: "Summary of changes:\\n- File1: description\\n- File2: description\\nTest results: PASSED"
+})
+```
+
+**Work product content should include:**
+- Files modified with brief descriptions
+- Key changes made
+- Test results or verification steps
+- Any issues encountered and how they were resolved
+
+**If you skip this step, task_update will FAIL with verification error.**
+
+## Anti-Patterns (NEVER DO THESE)
+- Executing uid/qa/sec tasks yourself instead of routing
+- Outputting "All tasks complete" without verifying Task Copilot
+- Skipping agent routing for specialized tasks
+- Marking other agents' tasks as complete yourself
+- Calling task_update(status="completed") WITHOUT first calling work_product_store()
+- Providing minimal/empty work product content (must be substantive)
+
+Begin by querying your task list with task_list.
+""")
 
 # Task Copilot workspace ID - auto-detect from project name
 WORKSPACE_ID = PROJECT_NAME
 
+# Linux exposes process state in /proc; elsewhere fall back to ps
+HAS_PROC = Path("/proc/self/stat").exists()
+
 
 class Colors:
     RED = '\033[0;31m'
@@ -60,20 +255,71 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+# Keep piped or redirected output free of ANSI escape codes
+if not sys.stdout.isatty():
+    for _color in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _color, '')
+
+# Console prefixes, built once
+_LOG_PREFIX = f"{Colors.BLUE}[ORCHESTRATOR]{Colors.NC} "
+_SUCCESS_PREFIX = f"{Colors.GREEN}[SUCCESS]{Colors.NC} "
+_WARN_PREFIX = f"{Colors.YELLOW}[WARNING]{Colors.NC} "
+_ERROR_PREFIX = f"{Colors.RED}[ERROR]{Colors.NC} "
+_ROUTING_PREFIX = f"{Colors.CYAN}[ROUTING]{Colors.NC} "
+
+# test_routing display tables
+AGENT_COLORS = {
+    'me': Colors.GREEN,
+    'uid': Colors.CYAN,
+    'uxd': Colors.CYAN,
+    'qa': Colors.YELLOW,
+    'sec': Colors.RED,
+    'ta': Colors.BLUE,
+    'sd': Colors.BLUE,
+    'doc': Colors.DIM,
+}
+STATUS_ICONS = {
+    'completed': f"{Colors.GREEN}✓{Colors.NC}",
+    'in_progress': f"{Colors.YELLOW}◐{Colors.NC}",
+    'pending': f"{Colors.DIM}○{Colors.NC}",
+    'blocked': f"{Colors.RED}✗{Colors.NC}",
+}
+# Agent share bars, indexed by filled segments (one per 5%)
+_SHARE_BARS = tuple("█" * filled + "░" * (20 - filled) for filled in range(21))
+
+
 def log(msg: str, color: str = Colors.BLUE):
-    print(f"{color}[ORCHESTRATOR]{Colors.NC} {msg}")
+    if color == Colors.BLUE:
+        print(_LOG_PREFIX + msg)
+    else:
+        print(f"{color}[ORCHESTRATOR]{Colors.NC} {msg}")
 
 
 def success(msg: str):
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.NC} {msg}")
+    print(_SUCCESS_PREFIX + msg)
 
 
 def warn(msg: str):
-    print(f"{Colors.YELLOW}[WARNING]{Colors.NC} {msg}")
+    print(_WARN_PREFIX + msg)
 
 
 def error(msg: str):
-    print(f"{Colors.RED}[ERROR]{Colors.NC} {msg}")
+    print(_ERROR_PREFIX + msg)
+
+
+# Routing log handle, opened on first use and kept for the life of the process
+_routing_log_file = None
+
+
+def _get_routing_log_file():
+    """Get the shared routing log handle, opening it on first use."""
+    global _routing_log_file
+    if _routing_log_file is None:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        # Line buffered so the log stays tail-able during a run
+        _routing_log_file = open(ROUTING_LOG, "a", buffering=1)
+        atexit.register(_routing_log_file.close)
+    return _routing_log_file
 
 
 def log_routing(msg: str, to_file: bool = True, to_console: bool = True):
@@ -82,34 +328,127 @@ def log_routing(msg: str, to_file: bool = True, to_console: bool = True):
     log_msg = f"[{timestamp}] {msg}"
 
     if to_console:
-        print(f"{Colors.CYAN}[ROUTING]{Colors.NC} {msg}")
+        print(_ROUTING_PREFIX + msg)
 
     if to_file:
         try:
-            with open(ROUTING_LOG, "a") as f:
-                f.write(log_msg + "\n")
+            _get_routing_log_file().write(log_msg + "\n")
         except Exception as e:
             warn(f"Failed to write to routing log: {e}")
 
 
+def _count_files(root_path: Path) -> int:
+    """Count files under root_path, skipping IGNORED_DIRS.
+
+    Counts the same entries as os.walk (symlinked directories are neither
+    counted nor followed) but scans directories directly, without building
+    per-directory name lists.
+    """
+    count = 0
+    pending = deque([root_path])
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name not in IGNORED_DIRS and not entry.is_symlink():
+                            pending.append(entry.path)
+                    else:
+                        count += 1
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            continue
+    return count
+
+
+def _stream_from_title(title: str, title_prefixes: Dict[str, str]) -> Optional[str]:
+    """Get the stream named by a "Stream-A: ..." or "[Stream-A] ..." task title.
+
+    title_prefixes maps each "Stream-A:" and "[Stream-A]" prefix to its stream ID.
+    """
+    end = title.find("]") if title.startswith("[") else title.find(":")
+    if end < 0:
+        return None
+    return title_prefixes.get(title[:end + 1])
+
+
+def _terminate_worker(pid: int):
+    """Send SIGTERM to a worker and everything it started.
+
+    Workers are spawned in their own session, so the wrapper's PID is also
+    the process group ID and one killpg reaches the wrapper and its claude
+    child. Falls back to signalling the PID alone if it is not a group leader.
+    """
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        os.kill(pid, signal.SIGTERM)
+
+
+def _is_zombie(pid: int) -> bool:
+    """Check whether a process that passed kill -0 is a zombie or already gone.
+
+    Workers spawned by this process are its children, so waitpid reaps
+    and reports them directly. Other processes fall back to the state field
+    of /proc/<pid>/stat when available (no fork), otherwise to ps.
+    """
+    try:
+        wpid, _ = os.waitpid(pid, os.WNOHANG)
+        # A child that already exited has just been reaped
+        return wpid == pid
+    except ChildProcessError:
+        # Not our child
+        pass
+
+    if HAS_PROC:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            return True
+        # The command name may contain spaces or parens; state follows the last ')'
+        return stat.rsplit(b")", 1)[1].split()[0] == b"Z"
+
+    result = subprocess.run(
+        ["ps", "-p", str(pid), "-o", "pid="],
+        capture_output=True,
+        timeout=5
+    )
+    return result.returncode != 0
+
+
 class PreflightValidator:
     """Validates environment before orchestration to catch issues early."""
 
+    # Main project file counts, shared by the validators created per worktree
+    _main_file_counts: Dict[Path, int] = {}
+
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.errors: List[Tuple[str, str]] = []  # (check_name, error_message)
         self.warnings: List[Tuple[str, str]] = []  # (check_name, warning_message)
+        self._worktree_paths: Optional[Set[Path]] = None
+        self.claude_path: Optional[str] = None  # Set by validate_claude_cli
+        self.git_version_str: Optional[str] = None  # Set by validate_git_worktree_support
 
     def validate_all(self) -> bool:
         """Run all validations. Returns True if environment is healthy."""
         self.errors = []
         self.warnings = []
 
-        # Run all validation checks
-        self.validate_claude_cli()
-        self.validate_git_worktree_support()
-        self.validate_directory_permissions()
-        self.validate_task_copilot()
+        # Run all validation checks concurrently; they are independent and
+        # mostly wait on subprocesses and disk. Each check only appends to
+        # errors/warnings, and print_report looks results up by check name,
+        # so completion order does not matter.
+        checks = (
+            self.validate_claude_cli,
+            self.validate_git_worktree_support,
+            self.validate_directory_permissions,
+            self.validate_task_copilot,
+        )
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            for future in [pool.submit(check) for check in checks]:
+                future.result()
 
         # Return True only if no errors (warnings are acceptable)
         return len(self.errors) == 0
@@ -126,10 +465,8 @@ class PreflightValidator:
                 '/usr/local/bin/claude',
                 os.path.expanduser('~/.local/bin/claude')
             ]
-            for path in common_paths:
-                if os.path.exists(path) and os.access(path, os.X_OK):
-                    claude_path = path
-                    break
+            # X_OK fails for missing paths, so one access() call covers both checks
+            claude_path = next((path for path in common_paths if os.access(path, os.X_OK)), None)
 
         if not claude_path:
             self.errors.append((
@@ -138,6 +475,8 @@ class PreflightValidator:
             ))
             return False
 
+        self.claude_path = claude_path
+
         # Verify it's executable
         if not os.access(claude_path, os.X_OK):
             self.errors.append((
@@ -175,9 +514,9 @@ class PreflightValidator:
 
             # Parse version (output format: "git version 2.43.0")
             version_str = result.stdout.strip()
+            self.git_version_str = version_str
             # Extract version number
-            import re
-            match = re.search(r'git version (\d+)\.(\d+)', version_str)
+            match = GIT_VERSION_RE.search(version_str)
             if match:
                 major, minor = int(match.group(1)), int(match.group(2))
                 if major < 2 or (major == 2 and minor < 5):
@@ -304,6 +643,42 @@ class PreflightValidator:
 
         return True
 
+    def load_worktrees(self, main_project_path: Path) -> Optional[Set[Path]]:
+        """Get the resolved paths of all worktrees git knows about.
+
+        Runs 'git worktree list --porcelain' once per validator and caches the
+        result.
+
+        Args:
+            main_project_path: Path to the main project root
+
+        Returns:
+            Set of worktree paths, or None if the git command failed
+
+        Raises:
+            subprocess.TimeoutExpired: If git does not answer in time
+            FileNotFoundError: If git is not installed
+        """
+        if self._worktree_paths is None:
+            result = subprocess.run(
+                ['git', 'worktree', 'list', '--porcelain'],
+                cwd=main_project_path,
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            if result.returncode != 0:
+                return None
+
+            # Porcelain output has one "worktree <path>" line per worktree
+            self._worktree_paths = {
+                Path(line[len('worktree '):]).resolve()
+                for line in result.stdout.splitlines()
+                if line.startswith('worktree ')
+            }
+
+        return self._worktree_paths
+
     def validate_worktree(self, worktree_path: Path, main_project_path: Path) -> bool:
         """
         Validate a worktree was created correctly.
@@ -340,24 +715,10 @@ class PreflightValidator:
 
         # Check 3: Git recognizes it as a worktree
         try:
-            result = subprocess.run(
-                ['git', 'worktree', 'list'],
-                cwd=main_project_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            worktree_paths = self.load_worktrees(main_project_path)
 
-            if result.returncode == 0:
-                # Check if worktree_path is in the output
-                worktree_listed = False
-                for line in result.stdout.strip().split('\n'):
-                    # Lines are like: "/path/to/worktree <hash> [branch]"
-                    if str(worktree_path.resolve()) in line:
-                        worktree_listed = True
-                        break
-
-                if not worktree_listed:
+            if worktree_paths is not None:
+                if worktree_path.resolve() not in worktree_paths:
                     worktree_errors.append(f"Not listed in 'git worktree list'")
             else:
                 worktree_errors.append(f"Failed to run 'git worktree list'")
@@ -367,22 +728,14 @@ class PreflightValidator:
 
         # Check 4: File count comparison (within 50% of main project)
         try:
-            # Count files in main project (excluding .git and common ignore patterns)
-            main_files = []
-            for root, dirs, files in os.walk(main_project_path):
-                # Skip .git and common directories
-                dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']]
-                main_files.extend(files)
-
-            main_file_count = len(main_files)
+            # Count files in main project once per run (excluding .git and common ignore patterns)
+            main_file_count = self._main_file_counts.get(main_project_path)
+            if main_file_count is None:
+                main_file_count = _count_files(main_project_path)
+                self._main_file_counts[main_project_path] = main_file_count
 
             # Count files in worktree
-            worktree_files = []
-            for root, dirs, files in os.walk(worktree_path):
-                dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']]
-                worktree_files.extend(files)
-
-            worktree_file_count = len(worktree_files)
+            worktree_file_count = _count_files(worktree_path)
 
             # Expect at least 50% of main project files
             min_expected = int(main_file_count * 0.5)
@@ -439,14 +792,13 @@ class PreflightValidator:
                 else:
                     # Need to show details for passing checks
                     if check_name == "Claude CLI":
-                        claude_path = shutil.which('claude') or '/opt/homebrew/bin/claude'
+                        claude_path = self.claude_path or shutil.which('claude') or '/opt/homebrew/bin/claude'
                         print(f"✅ {Colors.GREEN}{check_name}{Colors.NC}: Found at {claude_path}")
                     elif check_name == "Git Worktree":
-                        try:
-                            result = subprocess.run(['git', '--version'], capture_output=True, text=True, timeout=5)
-                            version = result.stdout.strip()
-                            print(f"✅ {Colors.GREEN}{check_name}{Colors.NC}: Supported ({version})")
-                        except:
+                        # Version string captured during validation
+                        if self.git_version_str:
+                            print(f"✅ {Colors.GREEN}{check_name}{Colors.NC}: Supported ({self.git_version_str})")
+                        else:
                             print(f"✅ {Colors.GREEN}{check_name}{Colors.NC}: Supported")
                     elif check_name == "Permissions":
                         print(f"✅ {Colors.GREEN}{check_name}{Colors.NC}: Write access confirmed")
@@ -469,10 +821,79 @@ class PreflightValidator:
             print(f"{Colors.RED}Pre-flight failed with {len(self.errors)} error(s). Fix issues above before running orchestration.{Colors.NC}\n")
 
 
+class _GitBatch:
+    """Long-running 'git cat-file --batch-check' process for ref lookups.
+
+    Started on first use; a single git process answers every lookup for the
+    rest of the run instead of forking git per query.
+    """
+
+    def __init__(self, cwd: Path):
+        self.cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Get the object ID a ref points to, or None if it does not exist."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+
+        try:
+            self._proc.stdin.write(ref + "\n")
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            # git exited (e.g. not a repository); treat the ref as unknown
+            return None
+
+        # "<sha> <type> <size>" when found, "<ref> missing" (or "ambiguous") otherwise
+        fields = self._proc.stdout.readline().split()
+        return fields[0] if len(fields) == 3 else None
+
+    def close(self):
+        """Stop the git process if it is running."""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            self._proc.wait()
+            self._proc = None
+
+    def __enter__(self) -> "_GitBatch":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@dataclass
+class RoutedTask:
+    """A stream task of the current initiative, as used for routing."""
+
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("id", "title", "status", "assigned_agent", "stream_id", "files")
+
+    id: str
+    title: str
+    status: str
+    assigned_agent: str
+    stream_id: str
+    files: Optional[str]
+
+
 class Orchestrator:
     def __init__(self):
-        # Initialize Task Copilot client
-        self.tc_client = TaskCopilotClient(WORKSPACE_ID)
+        # Initialize Task Copilot client; the scheduling loop queries it
+        # repeatedly, so it keeps its database connection open
+        self.tc_client = TaskCopilotClient(WORKSPACE_ID, keep_connection=True)
+        atexit.register(self.tc_client.close)
 
         # Require active initiative
         self.initiative_id = self.tc_client.get_active_initiative_id()
@@ -488,10 +909,28 @@ class Orchestrator:
                 log(f"Goal: {self.initiative_details.goal[:100]}")
 
         self.streams = self._query_streams()
-        self.stream_dependencies = self._build_dependency_graph()
-        self.dependency_depth = self._calculate_dependency_depth()
         self.running_processes: Dict[str, subprocess.Popen] = {}
 
+        # Stream status for the current scheduling pass (see _refresh_status_cache)
+        self._status_cache: Dict[str, Optional[dict]] = {}
+        # Streams whose cached status is complete, for cheap dependency checks
+        self._completed_streams: Set[str] = set()
+
+        # Stream IDs of spawned workers that have exited; wakes the start_all loop
+        self._exited_workers: "queue.Queue[str]" = queue.Queue()
+
+        # Per-stream file paths, which never change during a run
+        self._pid_files: Dict[str, Path] = {}
+        self._log_files: Dict[str, Path] = {}
+
+        # Worker prompts per stream; they only depend on the stream definition
+        # and its dependencies, which are fixed for the run
+        self._prompts: Dict[str, str] = {}
+
+        # Shared git process for ref lookups, stopped at exit
+        self._git = _GitBatch(PROJECT_ROOT)
+        atexit.register(self._git.close)
+
         # Ensure directories exist
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         PID_DIR.mkdir(parents=True, exist_ok=True)
@@ -531,6 +970,35 @@ class Orchestrator:
             error(f"Failed to query streams: {e}")
             sys.exit(1)
 
+    @cached_property
+    def stream_dependencies(self) -> Dict[str, Set[str]]:
+        """Stream dependency graph, built on first use (stop/logs never need it)."""
+        return self._build_dependency_graph()
+
+    @cached_property
+    def dependency_depth(self) -> Dict[str, int]:
+        """Dependency depth per stream, calculated on first use."""
+        return self._calculate_dependency_depth()
+
+    @cached_property
+    def streams_by_depth(self) -> List[str]:
+        """Stream IDs ordered by dependency depth (stable within a depth)."""
+        depth = self.dependency_depth
+        return sorted(self.streams, key=depth.__getitem__)
+
+    @cached_property
+    def depth_levels(self) -> List[Tuple[int, List[str]]]:
+        """(depth, sorted stream IDs) pairs in increasing depth order."""
+        depths = defaultdict(list)
+        for stream_id, depth in self.dependency_depth.items():
+            depths[depth].append(stream_id)
+        return [(depth, sorted(depths[depth])) for depth in sorted(depths)]
+
+    @cached_property
+    def routing_plan(self) -> Dict:
+        """Routing plan for all tasks, generated on first use."""
+        return self._generate_routing_plan()
+
     def _build_dependency_graph(self) -> Dict[str, Set[str]]:
         """Build stream dependency graph from task metadata.
 
@@ -538,6 +1006,12 @@ class Orchestrator:
         """
         dependency_graph: Dict[str, Set[str]] = defaultdict(set)
 
+        # Task title prefixes ("Stream-A:" or "[Stream-A]") that name a stream
+        title_prefixes: Dict[str, str] = {}
+        for sid in self.streams:
+            title_prefixes[f"{sid}:"] = sid
+            title_prefixes[f"[{sid}]"] = sid
+
         for stream_id, stream in self.streams.items():
             dependencies = stream.get("dependencies", [])
 
@@ -549,10 +1023,9 @@ class Orchestrator:
                 else:
                     # Try to extract stream ID from task title format
                     # Common formats: "Stream-A: Task", "[Stream-A] Task", etc.
-                    for sid in self.streams.keys():
-                        if dep.startswith(f"{sid}:") or dep.startswith(f"[{sid}]"):
-                            dependency_graph[stream_id].add(sid)
-                            break
+                    sid = _stream_from_title(dep, title_prefixes)
+                    if sid:
+                        dependency_graph[stream_id].add(sid)
 
         return dependency_graph
 
@@ -562,72 +1035,186 @@ class Orchestrator:
         Depth 0: No dependencies
         Depth 1: Depends only on depth-0 streams
         Depth N: Depends on at least one depth-(N-1) stream
-        """
-        depths: Dict[str, int] = {}
-        remaining = set(self.streams.keys())
-        current_depth = 0
 
-        while remaining:
-            # Find streams where all dependencies are satisfied
-            ready = set()
-            for stream_id in remaining:
-                deps = self.stream_dependencies.get(stream_id, set())
-                if all(dep in depths for dep in deps):
-                    ready.add(stream_id)
-
-            if not ready:
-                # Circular dependency detected
-                warn(f"Circular dependency detected in streams: {remaining}")
-                # Assign remaining to current depth to break the cycle
-                for stream_id in remaining:
-                    depths[stream_id] = current_depth
-                break
+        Uses a single topological pass (Kahn's algorithm) over the graph.
+        Exits with an error if the graph has a cycle, since no stream in it
+        could ever start.
+        """
+        cycles = self._find_cycles()
+        if cycles:
+            for cycle in cycles:
+                error(f"Circular dependency detected between streams: {', '.join(cycle)}")
+            error("Fix the stream dependencies in Task Copilot and re-run")
+            sys.exit(1)
 
-            # Assign depth to ready streams
-            for stream_id in ready:
-                deps = self.stream_dependencies.get(stream_id, set())
-                if deps:
-                    max_dep_depth = max(depths[dep] for dep in deps)
-                    depths[stream_id] = max_dep_depth + 1
-                else:
-                    depths[stream_id] = 0
-                remaining.remove(stream_id)
+        # Successors and unmet dependency counts per stream
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        in_degree: Dict[str, int] = {}
+        for stream_id in self.streams:
+            deps = self.stream_dependencies.get(stream_id, set())
+            in_degree[stream_id] = len(deps)
+            for dep in deps:
+                dependents[dep].append(stream_id)
 
-            current_depth += 1
+        depths: Dict[str, int] = {}
+        candidate: Dict[str, int] = {}
+        ready = deque(stream_id for stream_id, count in in_degree.items() if count == 0)
+        for stream_id in ready:
+            depths[stream_id] = 0
+
+        while ready:
+            stream_id = ready.popleft()
+            next_depth = depths[stream_id] + 1
+            for dependent in dependents[stream_id]:
+                if candidate.get(dependent, 0) < next_depth:
+                    candidate[dependent] = next_depth
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    depths[dependent] = candidate[dependent]
+                    ready.append(dependent)
 
         return depths
 
-    def _get_stream_status(self, stream_id: str) -> Optional[dict]:
-        """Get stream status using Task Copilot client."""
-        try:
-            # Filter by initiative
-            progress = self.tc_client.stream_get(stream_id, initiative_id=self.initiative_id)
-            if not progress:
-                return None
-
-            return {
-                "total_tasks": progress.total_tasks,
-                "completed_tasks": progress.completed_tasks,
-                "in_progress_tasks": progress.in_progress_tasks,
-                "is_complete": progress.is_complete
-            }
-        except Exception as e:
-            warn(f"Failed to get status for {stream_id}: {e}")
-            return None
+    def _find_cycles(self) -> List[List[str]]:
+        """Find dependency cycles using Tarjan's strongly connected components.
 
-    def _are_dependencies_complete(self, stream_id: str) -> bool:
-        """Check if all dependencies for a stream are complete.
+        Iterative, so deep dependency chains cannot hit the recursion limit.
 
-        A stream is ready when ALL streams it depends on have 100% tasks completed.
+        Returns:
+            Sorted stream IDs of each cycle (components with more than one
+            stream, or a stream that depends on itself)
         """
-        dependencies = self.stream_dependencies.get(stream_id, set())
+        graph = self.stream_dependencies
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        cycles: List[List[str]] = []
+
+        for root in self.streams:
+            if root in index:
+                continue
 
-        if not dependencies:
-            # No dependencies, always ready
-            return True
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph.get(root, ())))]
+
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in index:
+                        # Descend into the dependency; resume this node afterwards
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(graph.get(dep, ()))))
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
+                else:
+                    # All dependencies visited
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in graph.get(node, ()):
+                            cycles.append(sorted(component))
+
+        return cycles
+
+    @staticmethod
+    def _progress_to_status(progress) -> Optional[dict]:
+        """Convert a StreamProgress into the status dict used by the orchestrator."""
+        if not progress:
+            return None
 
-        # Check each dependency
-        for dep_stream_id in dependencies:
+        return {
+            "total_tasks": progress.total_tasks,
+            "completed_tasks": progress.completed_tasks,
+            "in_progress_tasks": progress.in_progress_tasks,
+            "is_complete": progress.is_complete
+        }
+
+    def _refresh_status_cache(self):
+        """Reload the status of every stream with one bulk query.
+
+        Called at the start of each scheduling pass. If the bulk query fails,
+        streams are queried individually in parallel instead.
+        """
+        self._status_cache.clear()
+        self._completed_streams.clear()
+        try:
+            progress_by_stream = self.tc_client.stream_get_many(list(self.streams), initiative_id=self.initiative_id)
+        except Exception as e:
+            warn(f"Failed to bulk-load stream status: {e}")
+            self._fetch_statuses_parallel()
+            return
+
+        for stream_id in self.streams:
+            status = self._progress_to_status(progress_by_stream.get(stream_id))
+            self._status_cache[stream_id] = status
+            if status and status["is_complete"]:
+                self._completed_streams.add(stream_id)
+
+    def _fetch_statuses_parallel(self):
+        """Fill the status cache with one stream_get per stream, run concurrently.
+
+        Each client call opens its own database connection, so the queries
+        are safe to run from worker threads.
+        """
+        stream_ids = list(self.streams)
+        if not stream_ids:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_STATUS_WORKERS, len(stream_ids))) as pool:
+            statuses = list(pool.map(self._get_stream_status, stream_ids))
+
+        self._status_cache.update(zip(stream_ids, statuses))
+
+    def _get_stream_status(self, stream_id: str) -> Optional[dict]:
+        """Get stream status using Task Copilot client.
+
+        Results are cached until the next _refresh_status_cache.
+        """
+        if stream_id in self._status_cache:
+            return self._status_cache[stream_id]
+
+        status = None
+        try:
+            # Filter by initiative
+            progress = self.tc_client.stream_get(stream_id, initiative_id=self.initiative_id)
+            status = self._progress_to_status(progress)
+        except Exception as e:
+            warn(f"Failed to get status for {stream_id}: {e}")
+
+        self._status_cache[stream_id] = status
+        if status and status["is_complete"]:
+            self._completed_streams.add(stream_id)
+        return status
+
+    def _are_dependencies_complete(self, stream_id: str) -> bool:
+        """Check if all dependencies for a stream are complete.
+
+        A stream is ready when ALL streams it depends on have 100% tasks completed.
+        """
+        dependencies = self.stream_dependencies.get(stream_id, set())
+
+        if not dependencies:
+            # No dependencies, always ready
+            return True
+
+        # Only dependencies not already known to be complete need a status check
+        for dep_stream_id in dependencies - self._completed_streams:
             status = self._get_stream_status(dep_stream_id)
             if not status or not status["is_complete"]:
                 return False
@@ -635,21 +1222,28 @@ class Orchestrator:
         return True
 
     def _get_ready_streams(self) -> List[str]:
-        """Get list of streams that are ready to start (dependencies complete, not running, not complete)."""
-        ready = []
-        for stream_id in self.streams.keys():
-            # Skip if already running
-            if self._is_running(stream_id):
-                continue
+        """Get list of streams that are ready to start (dependencies complete, not running, not complete).
 
+        Streams are visited in dependency-depth order so upstream streams start
+        first, and the cached status checks run before the PID probe so
+        streams that cannot start yet never touch the process table.
+        """
+        ready = []
+        for stream_id in self.streams_by_depth:
             # Skip if already complete
             status = self._get_stream_status(stream_id)
             if status and status["is_complete"]:
                 continue
 
-            # Check if dependencies are complete
-            if self._are_dependencies_complete(stream_id):
-                ready.append(stream_id)
+            # Skip if dependencies are not complete
+            if not self._are_dependencies_complete(stream_id):
+                continue
+
+            # Skip if already running
+            if self._is_running(stream_id):
+                continue
+
+            ready.append(stream_id)
 
         return ready
 
@@ -707,9 +1301,12 @@ class Orchestrator:
                 continue
 
             # Check if there's evidence of prior execution
-            # (log file exists with content, indicating worker started)
-            log_file = self._get_log_file(stream_id)
-            if log_file.exists() and log_file.stat().st_size > 100:
+            # (log file exists with content, indicating worker started; one stat call)
+            try:
+                log_size = os.stat(self._get_log_file(stream_id)).st_size
+            except FileNotFoundError:
+                continue
+            if log_size > 100:
                 # Worker ran but died - has incomplete tasks
                 # Check if there's at least one in_progress or we had progress
                 if status and (status["completed_tasks"] > 0 or status["in_progress_tasks"] > 0):
@@ -730,15 +1327,11 @@ class Orchestrator:
             True (always passes now that routing is enabled)
         """
         # Specialized agent routing is now enabled - no need to check/reassign
-        non_me_tasks = self.tc_client.get_non_me_agent_tasks(initiative_id=self.initiative_id)
-
-        if non_me_tasks:
-            # Group by agent for informational display
-            by_agent: Dict[str, int] = defaultdict(int)
-            for task in non_me_tasks:
-                by_agent[task['assigned_agent']] += 1
+        # Only the per-agent totals are shown, so let the database count them
+        by_agent = self.tc_client.get_non_me_agent_counts(initiative_id=self.initiative_id)
 
-            log(f"Found {len(non_me_tasks)} task(s) assigned to specialized agents:")
+        if by_agent:
+            log(f"Found {sum(by_agent.values())} task(s) assigned to specialized agents:")
             for agent, count in sorted(by_agent.items()):
                 log(f"  • @agent-{agent}: {count} tasks")
             log("Workers will route these tasks to their assigned agents.")
@@ -747,42 +1340,66 @@ class Orchestrator:
         return True
 
     def _get_pid_file(self, stream_id: str) -> Path:
-        return PID_DIR / f"{stream_id}.pid"
+        pid_file = self._pid_files.get(stream_id)
+        if pid_file is None:
+            pid_file = self._pid_files[stream_id] = PID_DIR / f"{stream_id}.pid"
+        return pid_file
 
     def _get_log_file(self, stream_id: str) -> Path:
         """Get log file path using per-initiative naming."""
-        return LOG_DIR / f"{stream_id}_{self.initiative_id[:8]}.log"
+        log_file = self._log_files.get(stream_id)
+        if log_file is None:
+            log_file = self._log_files[stream_id] = LOG_DIR / f"{stream_id}_{self.initiative_id[:8]}.log"
+        return log_file
 
     def _is_running(self, stream_id: str) -> bool:
-        """Check if a stream worker is currently running."""
+        """Check if a stream worker is currently running.
+
+        Zombies pass kill -0, so the process state is checked as well.
+        """
         pid_file = self._get_pid_file(stream_id)
-        if not pid_file.exists():
+
+        try:
+            # A single read covers both existence and parsing of the PID file
+            with open(pid_file, "rb") as f:
+                pid = int(f.read().strip())
+        except FileNotFoundError:
+            return False
+        except ValueError:
+            pid_file.unlink(missing_ok=True)
+            return False
+
+        if pid <= 0:
+            # kill -0 on 0 or a negative PID would probe a process group
+            pid_file.unlink(missing_ok=True)
             return False
 
         try:
-            pid = int(pid_file.read_text().strip())
             # Check if process exists with kill -0
-            os.kill(pid, 0)
-            # Double-check with ps to catch zombies (kill -0 succeeds for zombies)
-            result = subprocess.run(
-                ["ps", "-p", str(pid), "-o", "pid="],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode != 0:
+            try:
+                os.kill(pid, 0)
+            except PermissionError:
+                # EPERM: the process exists but belongs to another user
+                pass
+
+            # Double-check the process state to catch zombies
+            if _is_zombie(pid):
                 # Process is zombie or doesn't exist
                 pid_file.unlink(missing_ok=True)
                 return False
+
             return True
-        except (ProcessLookupError, ValueError, subprocess.TimeoutExpired):
+
+        except (ProcessLookupError, subprocess.TimeoutExpired):
             pid_file.unlink(missing_ok=True)
             return False
 
     def _cleanup_stale_pids(self):
         """Clean up stale PID files from workers that exited without cleanup."""
         cleaned = 0
-        for pid_file in PID_DIR.glob("*.pid"):
-            stream_id = pid_file.stem
+        with os.scandir(PID_DIR) as entries:
+            stream_ids = [entry.name[:-len(".pid")] for entry in entries if entry.name.endswith(".pid")]
+        for stream_id in stream_ids:
             if not self._is_running(stream_id):
                 # _is_running already cleaned up the file if stale
                 cleaned += 1
@@ -795,67 +1412,78 @@ class Orchestrator:
         Returns:
             Tuple of (success_count, list_of_failed_stream_ids)
         """
-        worktree_base = PROJECT_ROOT / '.claude' / 'worktrees'
         success_count = 0
         failures = []
 
-        if not worktree_base.exists():
+        if not WORKTREE_DIR.exists():
             log("No worktrees directory found")
             return 0, []
 
-        # Get current branch name
+        main_branch = self._main_branch
+
+        # HEAD and branch of every worktree in one call, instead of probing
+        # each; without a listing (e.g. git < 2.7) each worktree is asked
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=PROJECT_ROOT,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            main_branch = result.stdout.strip() or "main"
-        except Exception:
-            main_branch = "main"
+            worktree_heads = self._get_worktree_heads()
+        except Exception as e:
+            warn(f"Could not list worktrees, probing each instead: {e}")
+            worktree_heads = None
 
-        for stream_id in self.streams.keys():
-            worktree_path = worktree_base / stream_id
-            if not worktree_path.exists():
-                continue
+        def get_head(path: Path) -> Tuple[Optional[str], Optional[str]]:
+            if worktree_heads is not None:
+                return worktree_heads.get(path.resolve(), (None, None))
+            return self._probe_worktree_head(path)
 
-            try:
-                # Check if worktree has commits ahead of main
+        main_head = get_head(PROJECT_ROOT)[0]
+
+        stream_ids = self._streams_with_worktrees()
+        if not stream_ids:
+            return 0, []
+
+        # Ahead counts of all branches in one call where git supports it
+        branch_ahead = self._get_branch_ahead_counts(main_branch)
+
+        def probe(stream_id: str) -> Tuple[Optional[str], Optional[str], int]:
+            # Check if worktree has commits ahead of main; a worktree still
+            # at main's HEAD (or not registered with git) has none
+            head_sha, head_branch = get_head(WORKTREE_DIR / stream_id)
+            ahead = 0
+            if head_sha and head_sha != main_head:
+                if head_branch in branch_ahead:
+                    return head_sha, head_branch, branch_ahead[head_branch]
                 result = subprocess.run(
-                    ["git", "log", f"{main_branch}..HEAD", "--oneline"],
-                    cwd=worktree_path,
-                    capture_output=True,
-                    text=True,
+                    ["git", "rev-list", "--count", f"{main_branch}..{head_sha}"],
+                    **GIT_RUN_KWARGS,
                     timeout=30
                 )
+                ahead = int(result.stdout.strip() or 0)
+            return head_sha, head_branch, ahead
+
+        # Probes are read-only, so run them concurrently; merges below stay
+        # serial since they all write to the main repo's index
+        with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(stream_ids))) as pool:
+            probes = [pool.submit(probe, stream_id) for stream_id in stream_ids]
+
+        for stream_id, probe_future in zip(stream_ids, probes):
+            try:
+                head_sha, head_branch, ahead = probe_future.result()
 
-                if not result.stdout.strip():
+                if not ahead:
                     # No new commits in worktree
                     log(f"  {stream_id}: No new commits to merge")
                     continue
 
-                commits = result.stdout.strip().split('\n')
-                log(f"  {stream_id}: {len(commits)} commit(s) to merge")
+                log(f"  {stream_id}: {ahead} commit(s) to merge")
 
-                # Get the worktree's branch name (usually same as stream_id)
-                branch_result = subprocess.run(
-                    ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                    cwd=worktree_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                worktree_branch = branch_result.stdout.strip()
+                # The worktree's branch (usually same as stream_id); detached
+                # worktrees are merged by commit
+                worktree_branch = head_branch or head_sha
 
                 # Merge the worktree branch into main from the main project root
                 merge_result = subprocess.run(
                     ["git", "merge", worktree_branch, "--no-edit", "-m",
                      f"Merge {stream_id} into {main_branch}"],
-                    cwd=PROJECT_ROOT,
-                    capture_output=True,
-                    text=True,
+                    **GIT_RUN_KWARGS,
                     timeout=60
                 )
 
@@ -867,7 +1495,7 @@ class Orchestrator:
                     if "CONFLICT" in merge_result.stdout or "CONFLICT" in merge_result.stderr:
                         warn(f"  {stream_id}: Merge conflict - manual resolution required")
                         # Abort the merge
-                        subprocess.run(["git", "merge", "--abort"], cwd=PROJECT_ROOT, capture_output=True)
+                        subprocess.run(["git", "merge", "--abort"], **GIT_QUIET_KWARGS)
                     else:
                         warn(f"  {stream_id}: Merge failed - {merge_result.stderr[:100]}")
                     failures.append(stream_id)
@@ -881,85 +1509,179 @@ class Orchestrator:
 
         return success_count, failures
 
+    def _streams_with_worktrees(self) -> List[str]:
+        """Streams that have a directory under WORKTREE_DIR, from one directory scan."""
+        with os.scandir(WORKTREE_DIR) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+        return [stream_id for stream_id in self.streams if stream_id in present]
+
+    @cached_property
+    def _main_branch(self) -> str:
+        """Name of the branch checked out in the project root, resolved once."""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                **GIT_RUN_KWARGS,
+                timeout=10
+            )
+            return result.stdout.strip() or "main"
+        except Exception:
+            return "main"
+
+    def _get_branch_ahead_counts(self, base: str) -> Dict[str, int]:
+        """Count the commits each local branch has that base does not.
+
+        Uses for-each-ref's ahead-behind atom (git 2.41+). Returns an empty
+        dict on older git, in which case callers count per branch instead.
+        """
+        try:
+            result = subprocess.run(
+                ["git", "for-each-ref", f"--format=%(refname:lstrip=2) %(ahead-behind:{base})", "refs/heads/"],
+                **GIT_RUN_KWARGS,
+                timeout=30
+            )
+        except Exception:
+            return {}
+        if result.returncode != 0:
+            return {}
+
+        # Each line is "<branch> <ahead> <behind>"
+        counts = {}
+        for line in result.stdout.splitlines():
+            fields = line.rsplit(" ", 2)
+            if len(fields) == 3 and fields[1].isdigit():
+                counts[fields[0]] = int(fields[1])
+        return counts
+
+    def _get_worktree_heads(self) -> Dict[Path, Tuple[str, Optional[str]]]:
+        """Get the HEAD commit and branch of every git worktree.
+
+        Returns:
+            Dict mapping resolved worktree path -> (head_sha, branch name or
+            None when detached)
+
+        Raises:
+            subprocess.CalledProcessError: If git cannot list worktrees
+        """
+        result = subprocess.run(
+            ["git", "worktree", "list", "--porcelain"],
+            **GIT_RUN_KWARGS,
+            timeout=10
+        )
+        # An empty listing would read as "no worktrees registered"
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, result.stdout, result.stderr
+            )
+
+        # Porcelain output: one block per worktree with "worktree <path>",
+        # "HEAD <sha>" and "branch refs/heads/<name>" (or "detached") lines
+        heads: Dict[Path, Tuple[str, Optional[str]]] = {}
+        path, sha, branch = None, None, None
+        for line in result.stdout.splitlines() + [""]:
+            if line.startswith("worktree "):
+                path = Path(line[len("worktree "):]).resolve()
+            elif line.startswith("HEAD "):
+                sha = line[len("HEAD "):]
+            elif line.startswith("branch "):
+                branch = line[len("branch "):]
+                if branch.startswith("refs/heads/"):
+                    branch = branch[len("refs/heads/"):]
+            elif not line:
+                if path is not None and sha:
+                    heads[path] = (sha, branch)
+                path, sha, branch = None, None, None
+
+        return heads
+
+    def _probe_worktree_head(self, path: Path) -> Tuple[Optional[str], Optional[str]]:
+        """Get the HEAD commit and branch of a single worktree.
+
+        Returns:
+            (head_sha, branch name or None when detached), or (None, None)
+            if git cannot read the worktree
+        """
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
+                **{**GIT_RUN_KWARGS, "cwd": path},
+                timeout=10
+            )
+        except Exception:
+            return None, None
+        lines = result.stdout.split()
+        if result.returncode != 0 or len(lines) != 2:
+            return None, None
+        head_sha, branch = lines
+        return head_sha, (None if branch == "HEAD" else branch)
+
     def _cleanup_worktrees(self):
         """Remove all worktrees after successful merge."""
-        worktree_base = PROJECT_ROOT / '.claude' / 'worktrees'
-
-        if not worktree_base.exists():
+        if not WORKTREE_DIR.exists():
             return
 
-        cleaned = 0
-        for stream_id in self.streams.keys():
-            worktree_path = worktree_base / stream_id
-            if not worktree_path.exists():
-                continue
+        # Only directories git knows as worktrees need `git worktree remove`;
+        # anything else is just deleted. If the listing fails (git exits
+        # non-zero, e.g. before 2.7), ask git to remove every directory.
+        try:
+            registered = set(self._get_worktree_heads())
+        except (subprocess.SubprocessError, OSError):
+            registered = None
 
+        def remove(stream_id: str) -> bool:
+            worktree_path = WORKTREE_DIR / stream_id
+            if registered is not None and worktree_path.resolve() not in registered:
+                shutil.rmtree(worktree_path, ignore_errors=True)
+                return True
             try:
                 # Remove the git worktree properly
                 result = subprocess.run(
                     ["git", "worktree", "remove", str(worktree_path), "--force"],
-                    cwd=PROJECT_ROOT,
-                    capture_output=True,
-                    text=True,
+                    **GIT_QUIET_KWARGS,
                     timeout=30
                 )
-                if result.returncode == 0:
-                    cleaned += 1
-                else:
+                if result.returncode != 0:
                     # Fallback: just delete the directory
                     shutil.rmtree(worktree_path, ignore_errors=True)
-                    cleaned += 1
+                return True
             except Exception as e:
                 warn(f"Failed to cleanup {stream_id} worktree: {e}")
                 # Try force delete
                 shutil.rmtree(worktree_path, ignore_errors=True)
+                return False
+
+        # Each worktree is removed independently, so do them concurrently
+        cleaned = 0
+        stream_ids = self._streams_with_worktrees()
+        if stream_ids:
+            with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(stream_ids))) as pool:
+                cleaned = sum(pool.map(remove, stream_ids))
 
         # Prune worktree metadata
-        subprocess.run(["git", "worktree", "prune"], cwd=PROJECT_ROOT, capture_output=True)
+        subprocess.run(["git", "worktree", "prune"], **GIT_QUIET_KWARGS)
 
         if cleaned > 0:
             log(f"Cleaned up {cleaned} worktree(s)")
 
         # Remove worktrees directory if empty
-        if worktree_base.exists() and not any(worktree_base.iterdir()):
-            worktree_base.rmdir()
+        if WORKTREE_DIR.exists() and not any(WORKTREE_DIR.iterdir()):
+            WORKTREE_DIR.rmdir()
 
-    def _get_all_tasks(self) -> List[Dict]:
+    def _get_all_tasks(self) -> List[RoutedTask]:
         """Get all tasks for the current initiative."""
+        return list(self._iter_tasks())
+
+    def _iter_tasks(self) -> Iterator[RoutedTask]:
+        """Yield the tasks for the current initiative as rows are read."""
         conn = self.tc_client._connect()
         try:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    t.id,
-                    t.title,
-                    t.status,
-                    t.assigned_agent,
-                    json_extract(t.metadata, '$.streamId') as stream_id,
-                    json_extract(t.metadata, '$.files') as files
-                FROM tasks t
-                LEFT JOIN prds p ON t.prd_id = p.id
-                WHERE json_extract(t.metadata, '$.streamId') IS NOT NULL
-                  AND t.archived = 0
-                  AND p.initiative_id = ?
-                ORDER BY json_extract(t.metadata, '$.streamId'), t.created_at
-            """, (self.initiative_id,))
-
-            tasks = []
-            for row in cursor.fetchall():
-                task_id, title, status, agent, stream_id, files = row
-                tasks.append({
-                    'id': task_id,
-                    'title': title,
-                    'status': status,
-                    'assigned_agent': agent or 'me',
-                    'stream_id': stream_id,
-                    'files': files
-                })
-
-            return tasks
+            cursor.execute(INITIATIVE_TASKS_SQL, (self.initiative_id,))
+
+            for task_id, title, status, agent, stream_id, files in cursor:
+                yield RoutedTask(task_id, title, status, agent or 'me', stream_id, files)
         finally:
-            conn.close()
+            self.tc_client._release(conn)
 
     def _generate_routing_plan(self) -> Dict:
         """Generate routing plan for all tasks."""
@@ -967,176 +1689,32 @@ class Orchestrator:
 
         # Group by stream
         streams_tasks = defaultdict(list)
-        agent_counts = defaultdict(int)
-
         for task in tasks:
-            stream_id = task['stream_id']
-            agent = task['assigned_agent']
-
-            streams_tasks[stream_id].append(task)
-            agent_counts[agent] += 1
+            streams_tasks[task.stream_id].append(task)
 
         return {
             'streams': streams_tasks,
-            'agent_counts': agent_counts,
+            'agent_counts': Counter(task.assigned_agent for task in tasks),
             'total_tasks': len(tasks)
         }
 
     def _build_prompt(self, stream: dict) -> str:
-        """Build the prompt for a Claude Code worker."""
+        """Build the prompt for a Claude Code worker, reusing it on restarts."""
+        prompt = self._prompts.get(stream['id'])
+        if prompt is None:
+            prompt = self._prompts[stream['id']] = self._render_prompt(stream)
+        return prompt
+
+    def _render_prompt(self, stream: dict) -> str:
+        """Render the worker prompt for a stream."""
         dependencies = self.stream_dependencies.get(stream['id'], set())
         deps_str = ", ".join(dependencies) if dependencies else "None"
 
-        return f"""You are a worker agent in the Claude Copilot orchestration system.
-
-## Your Assignment
-- Stream: {stream['id']}
-- Stream Name: {stream['name']}
-- Dependencies: {deps_str}
-
-## MANDATORY PROTOCOL - YOU MUST FOLLOW THIS EXACTLY
-
-### Step 1: Query Your Tasks
-Call `task_list` with streamId filter to get your assigned tasks:
-```
-task_list(metadata.streamId="{stream['id']}")
-```
-
-### Step 2: Route Each Task to Its Assigned Agent
-
-**For EACH task in order:**
-
-1. **Get task details:**
-   ```
-   task_get(id="TASK-xxx")
-   ```
-
-2. **Check the assignedAgent field:**
-   - If `assignedAgent` is "me", execute the task yourself
-   - If `assignedAgent` is anything else (uid, qa, sec, uxd, etc.), invoke that agent
-
-3. **Route to specialized agent:**
-   ```
-   # Use Task tool to invoke the specialized agent
-   Task: Execute task TASK-xxx
-   Subagent: @agent-{{assignedAgent}}
-   Context: [Brief task context from task.title and task.description]
-   ```
-
-4. **Wait for agent to complete:**
-   - The specialized agent will call skill_evaluate() to load domain skills
-   - The specialized agent will execute the task
-   - The specialized agent will call task_update() when complete
-
-5. **Move to next task:**
-   - Do NOT mark tasks as complete yourself (agents do this)
-   - Simply move to the next task in your stream
-
-### Step 3: Verify Before Exiting
-
-**Before outputting any completion summary:**
-1. Call `task_list(metadata.streamId="{stream['id']}")` again
-2. Check that ALL tasks have `status: "completed"`
-3. If ANY task is still `pending` or `in_progress`, investigate and retry
-4. Only after verification passes, output your summary
-
-### Step 4: Output Summary
-Only after ALL tasks are verified complete in Task Copilot, output:
-- List of tasks routed to which agents
-- Which agents completed their work
-- Any commits made
-- Any issues encountered
-
-## CRITICAL RULES
-- DO NOT execute tasks assigned to specialized agents yourself
-- Each specialized agent loads their own domain skills via skill_evaluate()
-- DO NOT claim "complete" without verifying in Task Copilot first
-- Stay focused on {stream['id']} tasks only
-- If an agent is blocked, check task status and coordinate
-
-## Specialized Agent Examples
-
-**Example 1: UI Implementation Task**
-```
-Task Details:
-- id: TASK-123
-- title: "Implement topic card component"
-- assignedAgent: "uid"
-
-Action: Invoke @agent-uid via Task tool
-→ @agent-uid will call skill_evaluate() with files/context
-→ @agent-uid will load design-patterns or ux-patterns skills
-→ @agent-uid will implement component with accessibility
-→ @agent-uid will call work_product_store(taskId, type="implementation", ...)
-→ @agent-uid will call task_update(id="TASK-123", status="completed")
-```
-
-**Example 2: Testing Task**
-```
-Task Details:
-- id: TASK-456
-- title: "Add tests for evidence selector"
-- assignedAgent: "qa"
-
-Action: Invoke @agent-qa via Task tool
-→ @agent-qa will call skill_evaluate() with test file context
-→ @agent-qa will load pytest-patterns or jest-patterns skills
-→ @agent-qa will write comprehensive tests
-→ @agent-qa will call work_product_store(taskId, type="test_plan", ...)
-→ @agent-qa will call task_update(id="TASK-456", status="completed")
-```
-
-**Example 3: Generic Implementation Task**
-```
-Task Details:
-- id: TASK-789
-- title: "Fix evidence migration bug"
-- assignedAgent: "me"
-
-Action: Execute yourself (you are 'me')
-→ Call task_update(id="TASK-789", status="in_progress")
-→ Execute the fix
-→ Store work product (REQUIRED before completion)
-→ Call task_update(id="TASK-789", status="completed")
-```
-
-## MANDATORY: Work Product Before Completion
-
-**CRITICAL: You MUST store a work product before marking ANY task as completed.**
-
-Tasks have `verificationRequired=true` which enforces:
-1. Task must have `acceptanceCriteria` in metadata (set by @agent-ta)
-2. Task must have proof of completion (work product OR detailed notes)
-
-**Before calling `task_update(status="completed")`, ALWAYS call:**
-
-```
-work_product_store({{
-  taskId: "TASK-xxx",
-  type: "implementation",  // or "test_plan", "documentation", etc.
-  title: "Brief title of what was done",
-  content: "Summary of changes:\\n- File1: description\\n- File2: description\\nTest results: PASSED"
-}})
-```
-
-**Work product content should include:**
-- Files modified with brief descriptions
-- Key changes made
-- Test results or verification steps
-- Any issues encountered and how they were resolved
-
-**If you skip this step, task_update will FAIL with verification error.**
-
-## Anti-Patterns (NEVER DO THESE)
-- Executing uid/qa/sec tasks yourself instead of routing
-- Outputting "All tasks complete" without verifying Task Copilot
-- Skipping agent routing for specialized tasks
-- Marking other agents' tasks as complete yourself
-- Calling task_update(status="completed") WITHOUT first calling work_product_store()
-- Providing minimal/empty work product content (must be substantive)
-
-Begin by querying your task list with task_list.
-"""
+        return WORKER_PROMPT.substitute(
+            stream_id=stream['id'],
+            stream_name=stream['name'],
+            deps_str=deps_str
+        )
 
     def spawn_worker(self, stream_id: str, wait_for_deps: bool = True, skip_preflight: bool = False) -> bool:
         """Spawn a Claude Code worker for a stream.
@@ -1181,35 +1759,24 @@ Begin by querying your task list with task_list.
             # Create proper git worktree (not just a directory!)
             log(f"Creating git worktree for {stream_id}...")
 
-            # Ensure branch exists (create from current HEAD if not)
-            branch_result = subprocess.run(
-                ["git", "branch", stream_id],
-                cwd=PROJECT_ROOT,
-                capture_output=True,
-                text=True
-            )
-            # Ignore error if branch already exists
-
-            # Create the worktree linked to the branch
-            worktree_result = subprocess.run(
-                ["git", "worktree", "add", str(work_dir), stream_id],
-                cwd=PROJECT_ROOT,
-                capture_output=True,
-                text=True
-            )
+            # Create the worktree linked to the branch, creating the branch from
+            # current HEAD in the same call if it does not exist yet
+            if self._git.resolve(f"refs/heads/{stream_id}") is None:
+                worktree_cmd = ["git", "worktree", "add", "-b", stream_id, str(work_dir)]
+            else:
+                worktree_cmd = ["git", "worktree", "add", str(work_dir), stream_id]
+            worktree_result = subprocess.run(worktree_cmd, **GIT_RUN_KWARGS)
 
             if worktree_result.returncode != 0:
                 # Check if worktree already exists but directory was deleted
                 if "already checked out" in worktree_result.stderr or "already exists" in worktree_result.stderr:
                     warn(f"Worktree issue for {stream_id}: {worktree_result.stderr.strip()}")
                     warn(f"Attempting to repair by removing and recreating...")
-                    subprocess.run(["git", "worktree", "remove", str(work_dir), "--force"], cwd=PROJECT_ROOT, capture_output=True)
-                    subprocess.run(["git", "worktree", "prune"], cwd=PROJECT_ROOT, capture_output=True)
+                    subprocess.run(["git", "worktree", "remove", str(work_dir), "--force"], **GIT_QUIET_KWARGS)
+                    subprocess.run(["git", "worktree", "prune"], **GIT_QUIET_KWARGS)
                     worktree_result = subprocess.run(
                         ["git", "worktree", "add", str(work_dir), stream_id],
-                        cwd=PROJECT_ROOT,
-                        capture_output=True,
-                        text=True
+                        **GIT_RUN_KWARGS
                     )
 
                 if worktree_result.returncode != 0:
@@ -1228,10 +1795,9 @@ Begin by querying your task list with task_list.
                     shutil.rmtree(work_dir, ignore_errors=True)
                     subprocess.run(
                         ["git", "worktree", "remove", str(work_dir), "--force"],
-                        cwd=PROJECT_ROOT,
-                        capture_output=True
+                        **GIT_QUIET_KWARGS
                     )
-                    subprocess.run(["git", "worktree", "prune"], cwd=PROJECT_ROOT, capture_output=True)
+                    subprocess.run(["git", "worktree", "prune"], **GIT_QUIET_KWARGS)
                 except Exception as cleanup_err:
                     warn(f"Cleanup warning: {cleanup_err}")
 
@@ -1265,6 +1831,9 @@ Begin by querying your task list with task_list.
                 prompt
             ],
             start_new_session=True,  # Detach from parent
+            # Descriptors opened from Python are non-inheritable already, so
+            # skip the close-all sweep before exec
+            close_fds=False,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -1279,9 +1848,10 @@ Begin by querying your task list with task_list.
             actual_pid = str(proc.pid)
 
         self.running_processes[stream_id] = proc
+        threading.Thread(target=self._watch_worker, args=(stream_id, proc), daemon=True).start()
 
         # Log file uses per-initiative naming
-        log_file = LOG_DIR / f"{stream_id}_{self.initiative_id[:8]}.log"
+        log_file = self._get_log_file(stream_id)
         success(f"Worker {stream_id} started (PID: {actual_pid})")
         success(f"Logs: {log_file}")
         success(f"Logs: {log_file}")
@@ -1322,6 +1892,9 @@ Begin by querying your task list with task_list.
 
         # Main execution loop
         while True:
+            # One status snapshot per pass
+            self._refresh_status_cache()
+
             # Find streams that are ready to start
             ready_streams = self._get_ready_streams()
 
@@ -1388,8 +1961,7 @@ Begin by querying your task list with task_list.
                 break
 
             # Check if we're stuck (nothing ready, nothing running, not all complete)
-            running_count = sum(1 for s in self.streams.keys() if self._is_running(s))
-            if not new_ready and running_count == 0 and not all_complete:
+            if not new_ready and not all_complete and not self._any_worker_running():
                 error("Orchestration stuck - no streams ready and none running")
                 blocked = self._get_blocked_streams()
                 if blocked:
@@ -1398,32 +1970,63 @@ Begin by querying your task list with task_list.
                         error(f"  {stream_id} waiting for: {', '.join(deps)}")
                 break
 
-            # Wait before next poll
+            # Wait before next poll, waking early when a worker exits
             if not all_complete:
-                time.sleep(POLL_INTERVAL)
+                self._wait_for_worker_exit(POLL_INTERVAL)
 
         print()
         log("Orchestration complete")
         log("Use 'python orchestrate.py status' to check final status")
 
+    def _any_worker_running(self) -> bool:
+        """Check whether any stream worker is still alive.
+
+        Workers spawned by this process are checked through their Popen
+        handles first; PID files, which also cover workers chained from
+        start-ready-streams, are only probed when none of those is alive.
+        """
+        if any(proc.poll() is None for proc in self.running_processes.values()):
+            return True
+        return any(self._is_running(s) for s in self.streams)
+
+    def _watch_worker(self, stream_id: str, proc: subprocess.Popen):
+        """Wait for a spawned worker to exit and report it to the scheduler."""
+        proc.wait()
+        self._exited_workers.put(stream_id)
+
+    def _wait_for_worker_exit(self, timeout: float):
+        """Block until a spawned worker exits or the timeout elapses.
+
+        A worker exiting is the usual reason for a dependency to complete, so
+        the next scheduling pass runs right away instead of after a full poll
+        interval. Polling remains the fallback for workers started elsewhere.
+        """
+        try:
+            exited = [self._exited_workers.get(timeout=timeout)]
+        except queue.Empty:
+            return
+
+        # Collect any other workers that exited at the same time
+        while True:
+            try:
+                exited.append(self._exited_workers.get_nowait())
+            except queue.Empty:
+                break
+
+        log(f"Worker(s) exited: {', '.join(exited)} - checking for ready streams")
+
     def _display_dependency_structure(self):
         """Display stream dependency structure grouped by depth."""
-        print(f"{Colors.BOLD}Stream Dependency Structure:{Colors.NC}")
-        print()
-
-        # Group by depth
-        depths = defaultdict(list)
-        for stream_id, depth in self.dependency_depth.items():
-            depths[depth].append(stream_id)
+        # Built up and written in one go rather than one print() per line
+        out = [f"{Colors.BOLD}Stream Dependency Structure:{Colors.NC}\n\n"]
 
         # Display each depth level
-        for depth in sorted(depths.keys()):
-            stream_ids = sorted(depths[depth])
+        for depth, stream_ids in self.depth_levels:
 
             if depth == 0:
-                print(f"  {Colors.GREEN}Depth {depth} (Independent):{Colors.NC}")
+                out.append(f"  {Colors.GREEN}Depth {depth} (Independent):{Colors.NC}\n")
             else:
-                print(f"  {Colors.CYAN}Depth {depth}:{Colors.NC}")
+                out.append(f"  {Colors.CYAN}Depth {depth}:{Colors.NC}\n")
 
             for stream_id in stream_ids:
                 stream = self.streams[stream_id]
@@ -1434,72 +2037,74 @@ Begin by querying your task list with task_list.
                 else:
                     deps_str = ""
 
-                print(f"    • {Colors.BOLD}{stream_id}{Colors.NC} ({stream['name']}){deps_str}")
+                out.append(f"    • {Colors.BOLD}{stream_id}{Colors.NC} ({stream['name']}){deps_str}\n")
 
-            print()
+            out.append("\n")
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def check_status(self):
         """Display status of all workers grouped by dependency depth."""
-        print(f"\n{Colors.BOLD}{'='*75}{Colors.NC}")
-        print(f"{Colors.BOLD}              {PROJECT_NAME.upper()} - WORKER STATUS{Colors.NC}")
-        print(f"{Colors.BOLD}{'='*75}{Colors.NC}\n")
+        bold, nc = Colors.BOLD, Colors.NC
+        # Built up and written in one go rather than one print() per line
+        out = [
+            f"\n{bold}{'='*75}{nc}\n"
+            f"{bold}              {PROJECT_NAME.upper()} - WORKER STATUS{nc}\n"
+            f"{bold}{'='*75}{nc}\n\n"
+        ]
 
-        # Group streams by dependency depth
-        depths = defaultdict(list)
-        for stream_id, depth in self.dependency_depth.items():
-            depths[depth].append(stream_id)
+        self._refresh_status_cache()
 
         # Display overall progress
         total_streams = len(self.streams)
         completed_streams = 0
-        running_streams = 0
+        running = {}
 
         for stream_id in self.streams.keys():
             status = self._get_stream_status(stream_id)
             if status and status["is_complete"]:
                 completed_streams += 1
-            if self._is_running(stream_id):
-                running_streams += 1
+            running[stream_id] = self._is_running(stream_id)
+        running_streams = sum(running.values())
 
-        print(f"  {Colors.BOLD}Overall:{Colors.NC} {completed_streams}/{total_streams} complete, {running_streams} running")
-        print()
+        out.append(f"  {bold}Overall:{nc} {completed_streams}/{total_streams} complete, {running_streams} running\n\n")
 
         # Display each depth level
-        for depth in sorted(depths.keys()):
-            stream_ids = sorted(depths[depth])
+        for depth, stream_ids in self.depth_levels:
 
             if depth == 0:
                 depth_label = f"Depth {depth} (Independent)"
             else:
                 depth_label = f"Depth {depth}"
 
-            print(f"  {Colors.MAGENTA}{depth_label}{Colors.NC}")
+            out.append(f"  {Colors.MAGENTA}{depth_label}{nc}\n")
 
             for stream_id in stream_ids:
                 stream = self.streams[stream_id]
-                running = self._is_running(stream_id)
+                is_running = running.get(stream_id, False)
                 status = self._get_stream_status(stream_id)
 
                 # Determine status icon
                 if status and status["is_complete"]:
-                    icon = f"{Colors.GREEN}[DONE]{Colors.NC}"
+                    icon = f"{Colors.GREEN}[DONE]{nc}"
                     status_text = "Complete"
-                elif running:
-                    icon = f"{Colors.YELLOW}[RUN]{Colors.NC}"
+                elif is_running:
+                    icon = f"{Colors.YELLOW}[RUN]{nc}"
                     status_text = "Running"
                 else:
                     # Check if blocked by dependencies
                     if not self._are_dependencies_complete(stream_id):
-                        icon = f"{Colors.CYAN}[WAIT]{Colors.NC}"
+                        icon = f"{Colors.CYAN}[WAIT]{nc}"
                         deps = self.stream_dependencies.get(stream_id, set())
                         status_text = f"Waiting for: {', '.join(sorted(deps))}"
                     else:
                         pid_file = self._get_pid_file(stream_id)
                         if pid_file.exists():
-                            icon = f"{Colors.RED}[STOP]{Colors.NC}"
+                            icon = f"{Colors.RED}[STOP]{nc}"
                             status_text = "Stopped"
                         else:
-                            icon = f"{Colors.DIM}[---]{Colors.NC}"
+                            icon = f"{Colors.DIM}[---]{nc}"
                             status_text = "Not started"
 
                 # Progress bar
@@ -1513,36 +2118,56 @@ Begin by querying your task list with task_list.
 
                 # Get PID if running
                 pid_str = ""
-                if running:
+                if is_running:
                     pid_file = self._get_pid_file(stream_id)
                     if pid_file.exists():
                         pid_str = f" (PID: {pid_file.read_text().strip()})"
 
-                print(f"    {icon} {Colors.BOLD}{stream_id}{Colors.NC} | {stream['name']}")
-                print(f"      {progress} | {status_text}{pid_str}")
-            print()
+                out.append(
+                    f"    {icon} {bold}{stream_id}{nc} | {stream['name']}\n"
+                    f"      {progress} | {status_text}{pid_str}\n"
+                )
+            out.append("\n")
 
         # Show blocked streams summary
         blocked = self._get_blocked_streams()
         if blocked:
-            print(f"  {Colors.YELLOW}Blocked Streams:{Colors.NC}")
+            out.append(f"  {Colors.YELLOW}Blocked Streams:{nc}\n")
             for stream_id, deps in blocked.items():
-                print(f"    • {stream_id} waiting for: {', '.join(sorted(deps))}")
-            print()
+                out.append(f"    • {stream_id} waiting for: {', '.join(sorted(deps))}\n")
+            out.append("\n")
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def stop_all(self):
         """Stop all running workers."""
         log("Stopping all workers...")
 
-        for pid_file in PID_DIR.glob("*.pid"):
-            stream_id = pid_file.stem
+        with os.scandir(PID_DIR) as entries:
+            pid_paths = [entry.path for entry in entries if entry.name.endswith(".pid")]
+
+        # Signal every worker first, then remove the PID files
+        for path in pid_paths:
+            stream_id = os.path.basename(path)[:-len(".pid")]
             try:
-                pid = int(pid_file.read_text().strip())
-                os.kill(pid, signal.SIGTERM)
-                log(f"Stopped {stream_id} (PID: {pid})")
-            except (ProcessLookupError, ValueError):
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    pid = int(os.read(fd, 32).strip())
+                finally:
+                    os.close(fd)
+                # 0 or a negative PID would signal a whole process group
+                if pid > 0:
+                    _terminate_worker(pid)
+                    log(f"Stopped {stream_id} (PID: {pid})")
+            except (FileNotFoundError, ProcessLookupError, ValueError):
+                pass
+
+        for path in pid_paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
                 pass
-            pid_file.unlink(missing_ok=True)
 
         success("All workers stopped")
 
@@ -1555,7 +2180,10 @@ Begin by querying your task list with task_list.
 
         try:
             pid = int(pid_file.read_text().strip())
-            os.kill(pid, signal.SIGTERM)
+            if pid <= 0:
+                # 0 or a negative PID would signal a whole process group
+                raise ValueError(pid)
+            _terminate_worker(pid)
             log(f"Stopped {stream_id} (PID: {pid})")
         except (ProcessLookupError, ValueError):
             warn(f"Process not found for {stream_id}")
@@ -1569,116 +2197,94 @@ Begin by querying your task list with task_list.
             error(f"No logs found for {stream_id}")
             return
 
-        subprocess.run(["tail", "-f", str(log_file)])
+        # tail is all that is left to do, so it replaces this process rather
+        # than running under it; Ctrl-C then goes straight to tail.
+        sys.stdout.flush()
+        os.execvp("tail", ["tail", "-f", str(log_file)])
 
     def test_routing(self):
         """Display routing plan without executing tasks."""
-        print(f"\n{Colors.BOLD}{'='*75}{Colors.NC}")
-        print(f"{Colors.BOLD}           ROUTING PLAN - TEST MODE (DRY RUN){Colors.NC}")
-        print(f"{Colors.BOLD}{'='*75}{Colors.NC}\n")
-
-        log(f"Initiative: {self.initiative_details.name if self.initiative_details else self.initiative_id}")
-        print()
+        bold, nc = Colors.BOLD, Colors.NC
+        initiative = self.initiative_details.name if self.initiative_details else self.initiative_id
+        # Built up and written in one go rather than one print() per line
+        out = [
+            f"\n{bold}{'='*75}{nc}\n"
+            f"{bold}           ROUTING PLAN - TEST MODE (DRY RUN){nc}\n"
+            f"{bold}{'='*75}{nc}\n\n",
+            f"{_LOG_PREFIX}Initiative: {initiative}\n\n",
+        ]
 
         # Generate routing plan
-        plan = self._generate_routing_plan()
+        plan = self.routing_plan
 
         # Display tasks grouped by stream
-        print(f"{Colors.BOLD}Task Routing by Stream:{Colors.NC}\n")
+        out.append(f"{bold}Task Routing by Stream:{nc}\n\n")
 
-        # Sort streams by dependency depth
-        depths = defaultdict(list)
-        for stream_id, depth in self.dependency_depth.items():
-            depths[depth].append(stream_id)
+        # The execution order section is built in the same pass over the
+        # depth levels and appended after the summary
+        order_out = []
 
-        for depth in sorted(depths.keys()):
-            stream_ids = sorted(depths[depth])
+        # Streams in dependency depth order
+        for depth, stream_ids in self.depth_levels:
+            stream_ids = [s for s in stream_ids if s in plan['streams']]
+            if not stream_ids:
+                continue
 
-            for stream_id in stream_ids:
-                if stream_id not in plan['streams']:
-                    continue
+            if depth == 0:
+                order_out.append(f"  {Colors.GREEN}Depth {depth} (Independent - can run in parallel):{nc}\n")
+            else:
+                order_out.append(f"  {Colors.CYAN}Depth {depth} (will start after depth {depth-1} completes):{nc}\n")
 
+            for stream_id in stream_ids:
                 stream = self.streams[stream_id]
                 tasks = plan['streams'][stream_id]
+                order_out.append(f"    • {stream_id} ({len(tasks)} tasks)\n")
 
                 # Display stream header
                 deps = self.stream_dependencies.get(stream_id, set())
                 deps_str = f" (depends on: {', '.join(sorted(deps))})" if deps else ""
 
-                print(f"  {Colors.MAGENTA}{stream_id}{Colors.NC}: {stream['name']}{deps_str}")
+                out.append(f"  {Colors.MAGENTA}{stream_id}{nc}: {stream['name']}{deps_str}\n")
 
                 # Display tasks with agent assignments
-                agent_colors = {
-                    'me': Colors.GREEN,
-                    'uid': Colors.CYAN,
-                    'uxd': Colors.CYAN,
-                    'qa': Colors.YELLOW,
-                    'sec': Colors.RED,
-                    'ta': Colors.BLUE,
-                    'sd': Colors.BLUE,
-                    'doc': Colors.DIM,
-                }
-
                 for task in tasks:
-                    agent = task['assigned_agent']
-                    color = agent_colors.get(agent, Colors.NC)
-                    status_icon = {
-                        'completed': f"{Colors.GREEN}✓{Colors.NC}",
-                        'in_progress': f"{Colors.YELLOW}◐{Colors.NC}",
-                        'pending': f"{Colors.DIM}○{Colors.NC}",
-                        'blocked': f"{Colors.RED}✗{Colors.NC}",
-                    }.get(task['status'], "?")
+                    agent = task.assigned_agent
+                    color = AGENT_COLORS.get(agent, nc)
+                    status_icon = STATUS_ICONS.get(task.status, "?")
 
                     # Truncate title if too long
-                    title = task['title']
+                    title = task.title
                     if len(title) > 60:
-                        title = title[:57] + "..."
+                        title = f"{title[:57]}..."
 
-                    print(f"    {status_icon} {task['id']} → {color}@agent-{agent}{Colors.NC}")
-                    print(f"      {Colors.DIM}{title}{Colors.NC}")
+                    out.append(
+                        f"    {status_icon} {task.id} → {color}@agent-{agent}{nc}\n"
+                        f"      {Colors.DIM}{title}{nc}\n"
+                    )
 
-                print()
+                out.append("\n")
 
-        # Display routing summary
-        print(f"{Colors.BOLD}Routing Summary:{Colors.NC}\n")
+            order_out.append("\n")
 
-        # Sort agents by count
-        sorted_agents = sorted(plan['agent_counts'].items(), key=lambda x: x[1], reverse=True)
+        # Display routing summary
+        out.append(f"{bold}Routing Summary:{nc}\n\n")
 
         total_tasks = plan['total_tasks']
-        for agent, count in sorted_agents:
-            color = agent_colors.get(agent, Colors.NC)
+        # Agents by task count, highest first
+        for agent, count in plan['agent_counts'].most_common():
+            color = AGENT_COLORS.get(agent, nc)
             pct = int(count / total_tasks * 100) if total_tasks > 0 else 0
-            bar_filled = pct // 5
-            bar = "█" * bar_filled + "░" * (20 - bar_filled)
-            print(f"  {color}@agent-{agent:6}{Colors.NC} {bar} {count:3} tasks ({pct:3}%)")
+            out.append(f"  {color}@agent-{agent:6}{nc} {_SHARE_BARS[pct // 5]} {count:3} tasks ({pct:3}%)\n")
 
-        print()
-        print(f"  {Colors.BOLD}Total:{Colors.NC} {total_tasks} tasks across {len(plan['streams'])} streams")
-        print()
+        out.append(f"\n  {bold}Total:{nc} {total_tasks} tasks across {len(plan['streams'])} streams\n\n")
 
         # Display execution order
-        print(f"{Colors.BOLD}Execution Order (by dependency depth):{Colors.NC}\n")
-
-        for depth in sorted(depths.keys()):
-            stream_ids = sorted(depths[depth])
-            stream_ids_with_tasks = [s for s in stream_ids if s in plan['streams']]
-
-            if not stream_ids_with_tasks:
-                continue
+        out.append(f"{bold}Execution Order (by dependency depth):{nc}\n\n")
+        out.extend(order_out)
 
-            if depth == 0:
-                print(f"  {Colors.GREEN}Depth {depth} (Independent - can run in parallel):{Colors.NC}")
-            else:
-                print(f"  {Colors.CYAN}Depth {depth} (will start after depth {depth-1} completes):{Colors.NC}")
-
-            for stream_id in stream_ids_with_tasks:
-                task_count = len(plan['streams'][stream_id])
-                print(f"    • {stream_id} ({task_count} tasks)")
-
-            print()
+        out.append(f"{Colors.YELLOW}[DRY RUN] No workers will be spawned. Use 'orchestrate.py start' to execute.{nc}\n\n")
 
-        print(f"{Colors.YELLOW}[DRY RUN] No workers will be spawned. Use 'orchestrate.py start' to execute.{Colors.NC}\n")
+        sys.stdout.write("".join(out))
 
 
 def main():
@@ -83,13 +83,14 @@ def main():
     if not streams:
         return
 
-    # Build dependency map and get status for each stream
+    # Build dependency map and get status for each stream (one bulk progress query)
     stream_deps = {}
     stream_status = {}
+    progress_by_stream = client.stream_get_all(initiative_id=initiative_id)
 
     for stream_info in streams:
         stream_deps[stream_info.stream_id] = set(stream_info.dependencies)
-        progress = client.stream_get(stream_info.stream_id, initiative_id=initiative_id)
+        progress = progress_by_stream.get(stream_info.stream_id)
         if progress:
             stream_status[stream_info.stream_id] = {
                 "complete": progress.is_complete,
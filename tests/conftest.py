@@ -2,35 +2,37 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 
-@pytest.fixture
-def mock_orchestrator():
-    """Create a mock MonitoringOrchestrator."""
-    orchestrator = MagicMock()
-    orchestrator.update_interval = 10
-    orchestrator._update_callbacks = []
-    orchestrator._session_callbacks = []
+class _StubOrchestrator:
+    """Stand-in for MonitoringOrchestrator with only what the TUI calls."""
 
-    def register_update_callback(callback):
-        orchestrator._update_callbacks.append(callback)
+    __slots__ = ("update_interval", "_update_callbacks", "_session_callbacks")
 
-    def register_session_callback(callback):
-        orchestrator._session_callbacks.append(callback)
+    def __init__(self):
+        self.update_interval = 10
+        self._update_callbacks = []
+        self._session_callbacks = []
 
-    orchestrator.register_update_callback = register_update_callback
-    orchestrator.register_session_callback = register_session_callback
-    orchestrator.start = MagicMock()
-    orchestrator.stop = MagicMock()
-    orchestrator.force_refresh = MagicMock()
+    def register_update_callback(self, callback):
+        self._update_callbacks.append(callback)
 
-    return orchestrator
+    def register_session_callback(self, callback):
+        self._session_callbacks.append(callback)
 
+    def start(self):
+        pass
 
-@pytest.fixture
-def mock_settings():
-    """Create mock settings."""
+    def stop(self):
+        pass
+
+    def force_refresh(self):
+        pass
+
+
+def _build_mock_settings():
     settings = MagicMock()
     settings.plan = "max20"
     settings.tui = True
@@ -42,68 +44,161 @@ def mock_settings():
 
 
 @pytest.fixture
-def sample_blocks() -> List[Dict[str, Any]]:
-    """Create sample usage blocks for testing.
+def mock_orchestrator():
+    """Create a mock MonitoringOrchestrator."""
+    return _StubOrchestrator()
 
-    Note: burnRate is a dict with tokensPerMinute and costPerHour,
-    matching the real data structure from the monitoring orchestrator.
-    """
-    return [
-        {
-            "startTime": "2024-12-14T10:00:00Z",
-            "endTime": "2024-12-14T15:00:00Z",
-            "totalTokens": 50000,
-            "costUSD": 5.00,
-            "isActive": True,
-            "burnRate": {
-                "tokensPerMinute": 166.67,
-                "costPerHour": 2.50,
+
+@pytest.fixture
+def mock_settings():
+    """Create mock settings."""
+    return _build_mock_settings()
+
+
+@pytest.fixture(scope="module")
+def module_mock_orchestrator():
+    """Mock MonitoringOrchestrator shared by a module's tests."""
+    return _StubOrchestrator()
+
+
+@pytest.fixture(scope="module")
+def module_mock_settings():
+    """Mock settings shared by a module's tests."""
+    return _build_mock_settings()
+
+
+# Sample data is built once at import and shared by every test. The records
+# are read-only mappings (nested values such as burnRate stay plain dicts,
+# as the code under test checks for dict), so accidental writes fail loudly.
+
+_SAMPLE_BLOCKS = tuple(MappingProxyType(item) for item in [
+    {
+        "startTime": "2024-12-14T10:00:00Z",
+        "endTime": "2024-12-14T15:00:00Z",
+        "totalTokens": 50000,
+        "costUSD": 5.00,
+        "isActive": True,
+        "burnRate": {
+            "tokensPerMinute": 166.67,
+            "costPerHour": 2.50,
+        },
+        "durationMinutes": 300,
+        "usagePercentage": 25.0,
+        "perModelStats": {
+            "claude-3-5-sonnet-20241022": {
+                "tokens": 40000,
+                "cost": 4.00,
             },
-            "durationMinutes": 300,
-            "usagePercentage": 25.0,
-            "perModelStats": {
-                "claude-3-5-sonnet-20241022": {
-                    "tokens": 40000,
-                    "cost": 4.00,
-                },
-                "claude-3-5-haiku-20241022": {
-                    "tokens": 10000,
-                    "cost": 1.00,
-                },
+            "claude-3-5-haiku-20241022": {
+                "tokens": 10000,
+                "cost": 1.00,
             },
         },
-        {
-            "startTime": "2024-12-13T08:00:00Z",
-            "endTime": "2024-12-13T16:00:00Z",
-            "totalTokens": 80000,
-            "costUSD": 8.00,
-            "isActive": False,
-            "burnRate": {
-                "tokensPerMinute": 166.67,
-                "costPerHour": 2.50,
-            },
-            "durationMinutes": 480,
-            "usagePercentage": 40.0,
-            "perModelStats": {},
+    },
+    {
+        "startTime": "2024-12-13T08:00:00Z",
+        "endTime": "2024-12-13T16:00:00Z",
+        "totalTokens": 80000,
+        "costUSD": 8.00,
+        "isActive": False,
+        "burnRate": {
+            "tokensPerMinute": 166.67,
+            "costPerHour": 2.50,
         },
-        {
-            "startTime": "2024-12-12T09:00:00Z",
-            "endTime": "2024-12-12T17:00:00Z",
-            "totalTokens": 60000,
-            "costUSD": 6.00,
-            "isActive": False,
-            "burnRate": {
-                "tokensPerMinute": 125.0,
-                "costPerHour": 1.88,
-            },
-            "durationMinutes": 480,
-            "usagePercentage": 30.0,
-            "perModelStats": {},
+        "durationMinutes": 480,
+        "usagePercentage": 40.0,
+        "perModelStats": {},
+    },
+    {
+        "startTime": "2024-12-12T09:00:00Z",
+        "endTime": "2024-12-12T17:00:00Z",
+        "totalTokens": 60000,
+        "costUSD": 6.00,
+        "isActive": False,
+        "burnRate": {
+            "tokensPerMinute": 125.0,
+            "costPerHour": 1.88,
         },
-    ]
+        "durationMinutes": 480,
+        "usagePercentage": 30.0,
+        "perModelStats": {},
+    },
+])
+
+_SAMPLE_AGENTS = tuple(MappingProxyType(item) for item in [
+    {
+        "id": "agent-1",
+        "name": "Main Session",
+        "type": "Session",
+        "tokens": 50000,
+        "is_active": True,
+        "context_percent": 25.0,
+        "last_action": "Processing code",
+        "parent_id": None,
+    },
+    {
+        "id": "agent-2",
+        "name": "Explore Agent",
+        "type": "Explore",
+        "tokens": 15000,
+        "is_active": True,
+        "context_percent": 60.0,
+        "last_action": "Searching codebase",
+        "parent_id": "agent-1",
+    },
+    {
+        "id": "agent-3",
+        "name": "Test Agent",
+        "type": "Tester",
+        "tokens": 8000,
+        "is_active": False,
+        "context_percent": 0,
+        "last_action": "Completed",
+        "parent_id": "agent-1",
+    },
+])
+
+
+@pytest.fixture(scope="session")
+def sample_blocks() -> Tuple[Mapping[str, Any], ...]:
+    """Create sample usage blocks for testing.
 
+    Note: burnRate is a dict with tokensPerMinute and costPerHour,
+    matching the real data structure from the monitoring orchestrator.
+    """
+    return _SAMPLE_BLOCKS
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def sample_blocks_active_count(sample_blocks) -> int:
+    """Number of active blocks in sample_blocks."""
+    return sum(1 for b in sample_blocks if b.get("isActive"))
+
+
+@pytest.fixture(scope="session")
+def sample_blocks_soa(sample_blocks):
+    """Columnar view of sample_blocks for aggregate assertions.
+
+    Fields: tokens, cost, duration, tpm, cph - one array per field, so
+    totals and means are single numpy reductions (e.g. blocks.tokens.sum()).
+    """
+    np = pytest.importorskip("numpy")
+    return np.rec.fromrecords(
+        [
+            (
+                b["totalTokens"],
+                b["costUSD"],
+                b["durationMinutes"],
+                b["burnRate"]["tokensPerMinute"],
+                b["burnRate"]["costPerHour"],
+            )
+            for b in sample_blocks
+        ],
+        names="tokens,cost,duration,tpm,cph",
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_monitoring_data(sample_blocks) -> Dict[str, Any]:
     """Create sample monitoring data."""
     return {
@@ -117,38 +212,7 @@ def sample_monitoring_data(sample_blocks) -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
-def sample_agents() -> List[Dict[str, Any]]:
+@pytest.fixture(scope="session")
+def sample_agents() -> Tuple[Mapping[str, Any], ...]:
     """Create sample agent data for testing."""
-    return [
-        {
-            "id": "agent-1",
-            "name": "Main Session",
-            "type": "Session",
-            "tokens": 50000,
-            "is_active": True,
-            "context_percent": 25.0,
-            "last_action": "Processing code",
-            "parent_id": None,
-        },
-        {
-            "id": "agent-2",
-            "name": "Explore Agent",
-            "type": "Explore",
-            "tokens": 15000,
-            "is_active": True,
-            "context_percent": 60.0,
-            "last_action": "Searching codebase",
-            "parent_id": "agent-1",
-        },
-        {
-            "id": "agent-3",
-            "name": "Test Agent",
-            "type": "Tester",
-            "tokens": 8000,
-            "is_active": False,
-            "context_percent": 0,
-            "last_action": "Completed",
-            "parent_id": "agent-1",
-        },
-    ]
+    return _SAMPLE_AGENTS
@@ -0,0 +1,29 @@
+#!/bin/bash
+
+# Test Runner: TUI Tests (fast path)
+#
+# Runs the Textual TUI tests with a minimal pytest start-up: plugin autoload,
+# the cache provider, and the coverage addopts from pyproject.toml are all
+# disabled, and only the plugins these tests need are loaded explicitly.
+# Use this for CI and local iteration on src/claude_monitor/tui; run plain
+# `pytest` when you need coverage reports.
+#
+# Usage:
+#   ./run-tui-tests.sh                  # Run all TUI tests in parallel
+#   ./run-tui-tests.sh -k SessionData   # Extra arguments are passed to pytest
+
+set -e
+
+# Change to repository root
+cd "$(dirname "$0")/.."
+
+export PYTHONPATH="src${PYTHONPATH:+:$PYTHONPATH}"
+export PYTEST_DISABLE_PLUGIN_AUTOLOAD=1
+
+# --import-mode=importlib avoids prepending each test directory to sys.path
+exec python -m pytest tests/tui \
+  -p asyncio -p xdist -p no:cacheprovider \
+  --import-mode=importlib \
+  -o addopts="" \
+  -q -n auto --dist loadfile \
+  "$@"
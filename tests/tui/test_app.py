@@ -1,9 +1,12 @@
 """Tests for the main TUI application."""
 
 import pytest
+import pytest_asyncio
 from unittest.mock import MagicMock, patch
 from textual.pilot import Pilot
 
+from claude_monitor.tui.widgets import FooterWidget, HeaderWidget
+
 
 @pytest.fixture
 def app(mock_orchestrator, mock_settings):
@@ -17,6 +20,23 @@ def app(mock_orchestrator, mock_settings):
     return app
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def app_session(module_mock_orchestrator, module_mock_settings):
+    """Run one TUI app for the whole module and share its pilot.
+
+    Mounting the app is the bulk of each test's cost, so the session tests
+    reuse it and call ``pilot.press("1")`` first to start from the dashboard.
+    """
+    from claude_monitor.tui.app import ClaudeMonitorApp
+
+    app = ClaudeMonitorApp(
+        orchestrator=module_mock_orchestrator,
+        settings=module_mock_settings,
+    )
+    async with app.run_test() as pilot:
+        yield app, pilot
+
+
 class TestClaudeMonitorApp:
     """Tests for ClaudeMonitorApp."""
 
@@ -38,103 +58,121 @@ class TestClaudeMonitorApp:
         assert app.state.is_paused is False
         assert app.state.is_loading is True
 
-    @pytest.mark.asyncio
-    async def test_app_compose(self, app):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_app_compose(self, app_session):
         """Test app composes correctly."""
-        async with app.run_test() as pilot:
-            # Check header is present
-            header = app.query_one("#app-header")
-            assert header is not None
+        app, pilot = app_session
+        await pilot.press("1")
+        await pilot.pause()
 
-            # Check main content is present
-            main_content = app.query_one("#main-content")
-            assert main_content is not None
+        # Check header is present
+        header = app.query_one("#app-header")
+        assert header is not None
 
-            # Check footer is present
-            footer = app.query_one("#app-footer")
-            assert footer is not None
+        # Check main content is present
+        main_content = app.query_one("#main-content")
+        assert main_content is not None
 
-            # Check dashboard screen is present initially
-            dashboard = app.query_one("#dashboard-screen")
-            assert dashboard is not None
+        # Check footer is present
+        footer = app.query_one("#app-footer")
+        assert footer is not None
 
-    @pytest.mark.asyncio
-    async def test_switch_to_daily_view(self, app, sample_monitoring_data):
+        # Check dashboard screen is present initially
+        dashboard = app.query_one("#dashboard-screen")
+        assert dashboard is not None
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_switch_to_daily_view(self, app_session, sample_monitoring_data):
         """Test switching to daily view."""
-        async with app.run_test() as pilot:
-            # First update state with sample data so screens have something to show
-            app.state.update_from_monitoring_data(sample_monitoring_data)
+        app, pilot = app_session
+        await pilot.press("1")
+        await pilot.pause()
 
-            # Press 2 to switch to daily view
-            await pilot.press("2")
+        # First update state with sample data so screens have something to show
+        app.state.update_from_monitoring_data(sample_monitoring_data)
 
-            # Wait for the view to switch
-            await pilot.pause()
+        # Press 2 to switch to daily view
+        await pilot.press("2")
 
-            # Verify current view is now daily
-            assert app._current_view == "daily"
+        # Wait for the view to switch
+        await pilot.pause()
 
-            # Verify daily screen is mounted
-            daily_screen = app.query("#daily-screen")
-            assert len(daily_screen) == 1
+        # Verify current view is now daily
+        assert app._current_view == "daily"
 
-    @pytest.mark.asyncio
-    async def test_switch_to_monthly_view(self, app, sample_monitoring_data):
+        # Verify daily screen is mounted
+        daily_screen = app.query("#daily-screen")
+        assert len(daily_screen) == 1
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_switch_to_monthly_view(self, app_session, sample_monitoring_data):
         """Test switching to monthly view."""
-        async with app.run_test() as pilot:
-            app.state.update_from_monitoring_data(sample_monitoring_data)
+        app, pilot = app_session
+        await pilot.press("1")
+        await pilot.pause()
 
-            await pilot.press("3")
-            await pilot.pause()
+        app.state.update_from_monitoring_data(sample_monitoring_data)
 
-            assert app._current_view == "monthly"
-            monthly_screen = app.query("#monthly-screen")
-            assert len(monthly_screen) == 1
+        await pilot.press("3")
+        await pilot.pause()
 
-    @pytest.mark.asyncio
-    async def test_switch_to_agents_view(self, app, sample_monitoring_data):
+        assert app._current_view == "monthly"
+        monthly_screen = app.query("#monthly-screen")
+        assert len(monthly_screen) == 1
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_switch_to_agents_view(self, app_session, sample_monitoring_data):
         """Test switching to agents view."""
-        async with app.run_test() as pilot:
-            app.state.update_from_monitoring_data(sample_monitoring_data)
+        app, pilot = app_session
+        await pilot.press("1")
+        await pilot.pause()
 
-            await pilot.press("4")
-            await pilot.pause()
+        app.state.update_from_monitoring_data(sample_monitoring_data)
 
-            assert app._current_view == "agents"
-            agents_screen = app.query("#agents-screen")
-            assert len(agents_screen) == 1
+        await pilot.press("4")
+        await pilot.pause()
 
-    @pytest.mark.asyncio
-    async def test_switch_back_to_dashboard(self, app, sample_monitoring_data):
+        assert app._current_view == "agents"
+        agents_screen = app.query("#agents-screen")
+        assert len(agents_screen) == 1
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_switch_back_to_dashboard(self, app_session, sample_monitoring_data):
         """Test switching back to dashboard."""
-        async with app.run_test() as pilot:
-            app.state.update_from_monitoring_data(sample_monitoring_data)
+        app, pilot = app_session
+        await pilot.press("1")
+        await pilot.pause()
 
-            # Switch to daily first
-            await pilot.press("2")
-            await pilot.pause()
-            assert app._current_view == "daily"
+        app.state.update_from_monitoring_data(sample_monitoring_data)
 
-            # Switch back to dashboard
-            await pilot.press("1")
-            await pilot.pause()
-            assert app._current_view == "dashboard"
+        # Switch to daily first
+        await pilot.press("2")
+        await pilot.pause()
+        assert app._current_view == "daily"
 
-    @pytest.mark.asyncio
-    async def test_pause_toggle(self, app):
+        # Switch back to dashboard
+        await pilot.press("1")
+        await pilot.pause()
+        assert app._current_view == "dashboard"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_pause_toggle(self, app_session):
         """Test pause toggle."""
-        async with app.run_test() as pilot:
-            assert app.state.is_paused is False
+        app, pilot = app_session
+        await pilot.press("1")
+        await pilot.pause()
 
-            await pilot.press("space")
-            await pilot.pause()
+        assert app.state.is_paused is False
 
-            assert app.state.is_paused is True
+        await pilot.press("space")
+        await pilot.pause()
 
-            await pilot.press("space")
-            await pilot.pause()
+        assert app.state.is_paused is True
 
-            assert app.state.is_paused is False
+        await pilot.press("space")
+        await pilot.pause()
+
+        assert app.state.is_paused is False
 
     @pytest.mark.asyncio
     async def test_quit_app(self, app):
@@ -145,15 +183,28 @@ class TestClaudeMonitorApp:
             # We can't easily test exit, but we can verify the action exists
             assert "q" in [b.key for b in app.BINDINGS]
 
-    @pytest.mark.asyncio
-    async def test_data_update_callback(self, app, sample_monitoring_data):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_data_update_callback(self, app_session, sample_monitoring_data):
         """Test data update callback updates state."""
-        async with app.run_test() as pilot:
-            # Simulate data update from orchestrator
-            app._process_data_update(sample_monitoring_data)
-            await pilot.pause()
-
-            # Verify state was updated
-            assert app.state.is_loading is False
-            assert len(app.state.blocks) == 3
-            assert app.state.token_limit == 200000
+        app, pilot = app_session
+        await pilot.press("1")
+        await pilot.pause()
+
+        # Simulate data update from orchestrator; the shared app has seen
+        # sample_monitoring_data before, so pass a fresh payload
+        previous_refresh = app.state.last_refresh
+        app._process_data_update(dict(sample_monitoring_data))
+        await pilot.pause()
+
+        # Verify state was updated
+        assert app.state.last_refresh is not previous_refresh
+        assert app.state.is_loading is False
+        assert len(app.state.blocks) == 3
+        assert app.state.token_limit == 200000
+
+        # Verify header and footer were refreshed from the new state
+        header = app.query_one("#app-header", HeaderWidget)
+        footer = app.query_one("#app-footer", FooterWidget)
+        assert header.plan_name == "MAX20"
+        assert header.usage_percent == app.state.session.usage_percentage > 0
+        assert footer.last_refresh is app.state.last_refresh
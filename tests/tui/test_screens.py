@@ -2,155 +2,100 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
-
-
-class TestDashboardScreen:
-    """Tests for DashboardScreen."""
-
-    def test_dashboard_screen_import(self):
-        """Test DashboardScreen can be imported."""
-        from claude_monitor.tui.screens.dashboard import DashboardScreen
-        assert DashboardScreen is not None
-
-    def test_dashboard_screen_creation(self):
-        """Test DashboardScreen can be created."""
-        from claude_monitor.tui.screens.dashboard import DashboardScreen
-        screen = DashboardScreen(id="test-dashboard")
+from textual.widget import Widget
+
+from claude_monitor.tui.screens.agents import AgentsScreen
+from claude_monitor.tui.screens.base import BaseMonitorScreen
+from claude_monitor.tui.screens.daily import DailyScreen
+from claude_monitor.tui.screens.dashboard import DashboardScreen
+from claude_monitor.tui.screens.monthly import MonthlyScreen
+
+# (screen class, id used for the creation test)
+SCREEN_CLASSES = [
+    (DashboardScreen, "test-dashboard"),
+    (DailyScreen, "test-daily"),
+    (MonthlyScreen, "test-monthly"),
+    (AgentsScreen, "test-agents"),
+]
+
+# Keys each screen must bind
+SCREEN_BINDING_KEYS = [
+    (DashboardScreen, ("m", "w")),  # Models, What-if
+    (DailyScreen, ("s", "c", "enter")),  # Sort, Compare, Details
+    (AgentsScreen, ("f", "r", "a", "i")),  # Filter, Relationships, Show all, Toggle inactive
+]
+
+# (screen class, aggregation method, fields every aggregated row must carry)
+SCREEN_AGGREGATIONS = [
+    (DailyScreen, "_aggregate_by_day", {"date", "tokens", "cost", "sessions", "peak_hour"}),
+    (MonthlyScreen, "_aggregate_by_month", {"month", "tokens", "cost", "days_active", "daily_avg"}),
+]
+
+
+class TestScreenClasses:
+    """Import, creation and binding checks shared by every screen."""
+
+    @pytest.mark.parametrize(
+        "screen_class,screen_id", SCREEN_CLASSES, ids=[cls.__name__ for cls, _ in SCREEN_CLASSES]
+    )
+    def test_screen_creation(self, screen_class, screen_id):
+        """Test the screen can be created with an id."""
+        screen = screen_class(id=screen_id)
         assert screen is not None
-        assert screen.id == "test-dashboard"
-
-    def test_dashboard_bindings(self):
-        """Test DashboardScreen has expected bindings."""
-        from claude_monitor.tui.screens.dashboard import DashboardScreen
-        binding_keys = [b[0] for b in DashboardScreen.BINDINGS]
-        assert "m" in binding_keys  # Models
-        assert "w" in binding_keys  # What-if
-
-
-class TestDailyScreen:
-    """Tests for DailyScreen."""
-
-    def test_daily_screen_import(self):
-        """Test DailyScreen can be imported."""
-        from claude_monitor.tui.screens.daily import DailyScreen
-        assert DailyScreen is not None
-
-    def test_daily_screen_creation(self):
-        """Test DailyScreen can be created."""
-        from claude_monitor.tui.screens.daily import DailyScreen
-        screen = DailyScreen(id="test-daily")
-        assert screen is not None
-        assert screen.id == "test-daily"
-
-    def test_daily_bindings(self):
-        """Test DailyScreen has expected bindings."""
-        from claude_monitor.tui.screens.daily import DailyScreen
-        binding_keys = [b[0] for b in DailyScreen.BINDINGS]
-        assert "s" in binding_keys  # Sort
-        assert "c" in binding_keys  # Compare
-        assert "enter" in binding_keys  # Details
+        assert screen.id == screen_id
 
-    def test_daily_aggregate_by_day(self, sample_blocks):
-        """Test daily aggregation logic."""
-        from claude_monitor.tui.screens.daily import DailyScreen
-        screen = DailyScreen(id="test-daily")
+    @pytest.mark.parametrize(
+        "screen_class,keys", SCREEN_BINDING_KEYS, ids=[cls.__name__ for cls, _ in SCREEN_BINDING_KEYS]
+    )
+    def test_screen_bindings(self, screen_class, keys):
+        """Test the screen has its expected bindings."""
+        assert set(keys) <= screen_class.BINDING_KEYS
 
-        # Call the aggregation method directly
-        daily_data = screen._aggregate_by_day(sample_blocks)
+    @pytest.mark.parametrize(
+        "screen_class,method,required",
+        SCREEN_AGGREGATIONS,
+        ids=[cls.__name__ for cls, _, _ in SCREEN_AGGREGATIONS],
+    )
+    def test_aggregate_schema(self, screen_class, method, required, sample_blocks):
+        """Test the screen aggregates blocks into rows with the expected fields."""
+        rows = getattr(screen_class(id="test-aggregate"), method)(sample_blocks)
 
-        # Should have entries for each day with data
-        assert len(daily_data) > 0
-
-        # Each entry should have expected fields
-        for day in daily_data:
-            assert "date" in day
-            assert "tokens" in day
-            assert "cost" in day
-            assert "sessions" in day
-            assert "peak_hour" in day
+        assert rows
+        assert all(required <= row.keys() for row in rows)
 
 
 class TestMonthlyScreen:
     """Tests for MonthlyScreen."""
 
-    def test_monthly_screen_import(self):
-        """Test MonthlyScreen can be imported."""
-        from claude_monitor.tui.screens.monthly import MonthlyScreen
-        assert MonthlyScreen is not None
-
-    def test_monthly_screen_creation(self):
-        """Test MonthlyScreen can be created."""
-        from claude_monitor.tui.screens.monthly import MonthlyScreen
-        screen = MonthlyScreen(id="test-monthly")
-        assert screen is not None
-        assert screen.id == "test-monthly"
-
-    def test_monthly_aggregate_by_month(self, sample_blocks):
-        """Test monthly aggregation logic."""
-        from claude_monitor.tui.screens.monthly import MonthlyScreen
+    def test_monthly_totals_match_blocks(self, sample_blocks, sample_blocks_soa):
+        """Test monthly totals add up to the block totals."""
         screen = MonthlyScreen(id="test-monthly")
 
-        # Call the aggregation method directly
         monthly_data = screen._aggregate_by_month(sample_blocks)
 
-        # Should have at least one month
-        assert len(monthly_data) >= 0  # Could be 0 if blocks are in same month
-
-        # Each entry should have expected fields
-        for month in monthly_data:
-            assert "month" in month
-            assert "tokens" in month
-            assert "cost" in month
-            assert "days_active" in month
-            assert "daily_avg" in month
+        assert sum(m["tokens"] for m in monthly_data) == sample_blocks_soa.tokens.sum()
+        assert sum(m["cost"] for m in monthly_data) == pytest.approx(sample_blocks_soa.cost.sum())
 
 
 class TestAgentsScreen:
     """Tests for AgentsScreen."""
 
-    def test_agents_screen_import(self):
-        """Test AgentsScreen can be imported."""
-        from claude_monitor.tui.screens.agents import AgentsScreen
-        assert AgentsScreen is not None
-
-    def test_agents_screen_creation(self):
-        """Test AgentsScreen can be created."""
-        from claude_monitor.tui.screens.agents import AgentsScreen
-        screen = AgentsScreen(id="test-agents")
-        assert screen is not None
-        assert screen.id == "test-agents"
-
-    def test_agents_bindings(self):
-        """Test AgentsScreen has expected bindings."""
-        from claude_monitor.tui.screens.agents import AgentsScreen
-        binding_keys = [b[0] for b in AgentsScreen.BINDINGS]
-        assert "f" in binding_keys  # Filter
-        assert "r" in binding_keys  # Relationships
-        assert "a" in binding_keys  # Show all
-        assert "i" in binding_keys  # Toggle inactive
-
-    def test_agents_extract_from_blocks(self, sample_blocks):
+    def test_agents_extract_from_blocks(self, sample_blocks, sample_blocks_active_count):
         """Test extracting agents from blocks."""
-        from claude_monitor.tui.screens.agents import AgentsScreen
         screen = AgentsScreen(id="test-agents")
 
         agents = screen._extract_agents_from_blocks(sample_blocks)
 
-        # Should extract at least the active block
-        active_count = sum(1 for b in sample_blocks if b.get("isActive"))
-        assert len(agents) == active_count
+        # Should extract one agent per active block
+        assert len(agents) == sample_blocks_active_count
+
+        # A new blocks list is rescanned rather than served from the cache
+        assert screen._extract_agents_from_blocks([]) == []
 
 
 class TestBaseMonitorScreen:
     """Tests for BaseMonitorScreen."""
 
-    def test_base_screen_import(self):
-        """Test BaseMonitorScreen can be imported."""
-        from claude_monitor.tui.screens.base import BaseMonitorScreen
-        assert BaseMonitorScreen is not None
-
     def test_base_screen_is_widget_subclass(self):
         """Test BaseMonitorScreen is a Widget subclass (not Screen)."""
-        from claude_monitor.tui.screens.base import BaseMonitorScreen
-        from textual.widget import Widget
         assert issubclass(BaseMonitorScreen, Widget)
@@ -1,58 +1,77 @@
 """Tests for TUI application state."""
 
+import sys
+
 import pytest
+from operator import attrgetter
 from unittest.mock import MagicMock
 
+from claude_monitor.tui.state.app_state import AppState
+
+# Active block that the single-block update tests override per case
+BASE_BLOCK = {
+    "startTime": "2024-12-14T10:00:00Z",
+    "totalTokens": 50000,
+    "costUSD": 5.00,
+    "isActive": True,
+    "durationMinutes": 30,
+}
+
+# Default value of every AppState / SessionState field the TUI relies on
+STATE_DEFAULTS = [
+    ("is_paused", False),
+    ("is_loading", True),
+    ("current_view", "dashboard"),
+    ("last_refresh", None),
+    ("blocks", []),
+    ("agents", []),
+    ("token_limit", 44000),
+    ("plan", "custom"),
+    ("timezone", "UTC"),
+    ("filter_text", ""),
+    ("session.tokens_used", 0),
+    ("session.token_limit", 44000),
+    ("session.cost_used", 0.0),
+    ("session.burn_rate", 0.0),
+    ("session.cost_per_hour", 0.0),
+    ("session.usage_percentage", 0.0),
+    ("session.elapsed_minutes", 0.0),
+    ("session.is_active", False),
+]
+
+
+@pytest.fixture
+def state():
+    """Fresh AppState for tests that change it."""
+    return AppState()
+
+
+@pytest.fixture(scope="module")
+def default_state():
+    """One untouched AppState shared by the read-only default checks."""
+    return AppState()
+
 
 class TestAppState:
     """Tests for AppState."""
 
-    def test_app_state_import(self):
-        """Test AppState can be imported."""
-        from claude_monitor.tui.state.app_state import AppState
-        assert AppState is not None
-
-    def test_app_state_creation(self):
-        """Test AppState can be created."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-        assert state is not None
-
-    def test_app_state_defaults(self):
-        """Test AppState has correct default values."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
-        assert state.is_paused is False
-        assert state.is_loading is True
-        assert state.current_view == "dashboard"
-        assert state.last_refresh is None
-        assert state.blocks == []
-        assert state.agents == []
-        assert state.token_limit == 44000
-        assert state.plan == "custom"
-        assert state.timezone == "UTC"
-        assert state.filter_text == ""
-
-    def test_session_state_defaults(self):
-        """Test SessionState has correct default values."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-        session = state.session
-
-        assert session.tokens_used == 0
-        assert session.token_limit == 44000
-        assert session.cost_used == 0.0
-        assert session.burn_rate == 0.0
-        assert session.usage_percentage == 0.0
-        assert session.elapsed_minutes == 0.0
-        assert session.is_active is False
-
-    def test_update_from_monitoring_data(self, sample_monitoring_data):
+    @pytest.mark.parametrize("attr,expected", STATE_DEFAULTS, ids=[attr for attr, _ in STATE_DEFAULTS])
+    def test_state_defaults(self, default_state, attr, expected):
+        """Test AppState and its SessionState start with the correct defaults."""
+        value = attrgetter(attr)(default_state)
+        assert value == expected
+        assert type(value) is type(expected)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_state_is_slotted(self, state):
+        """Test AppState and SessionState carry no per-instance __dict__."""
+        assert not hasattr(state, "__dict__")
+        assert not hasattr(state.session, "__dict__")
+        with pytest.raises(AttributeError):
+            state.is_pasued = True
+
+    def test_update_from_monitoring_data(self, state, sample_monitoring_data):
         """Test updating state from monitoring data."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
         state.update_from_monitoring_data(sample_monitoring_data)
 
         assert state.is_loading is False
@@ -65,23 +84,29 @@ class TestAppState:
         assert state.session.tokens_used == 50000
         assert state.session.cost_used == 5.00
 
-    def test_update_when_paused(self, sample_monitoring_data):
+    def test_update_when_paused(self, state, sample_monitoring_data):
         """Test state is not updated when paused."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
         state.is_paused = True
 
-        state.update_from_monitoring_data(sample_monitoring_data)
+        assert state.update_from_monitoring_data(sample_monitoring_data) is False
 
         # Should not have updated
         assert state.is_loading is True
         assert len(state.blocks) == 0
 
-    def test_toggle_paused(self):
-        """Test pause toggle."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
+    def test_update_idempotent_same_payload(self, state, sample_monitoring_data):
+        """Test a payload that was already applied is skipped."""
+        assert state.update_from_monitoring_data(sample_monitoring_data) is True
+        last_refresh = state.last_refresh
+
+        assert state.update_from_monitoring_data(sample_monitoring_data) is False
+        assert state.last_refresh is last_refresh
+
+        # An equal but new payload is applied
+        assert state.update_from_monitoring_data(dict(sample_monitoring_data)) is True
 
+    def test_toggle_paused(self, state):
+        """Test pause toggle."""
         assert state.is_paused is False
 
         result = state.toggle_paused()
@@ -92,11 +117,8 @@ class TestAppState:
         assert result is False
         assert state.is_paused is False
 
-    def test_set_view(self):
+    def test_set_view(self, state):
         """Test setting view."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
         assert state.current_view == "dashboard"
 
         state.set_view("daily")
@@ -112,113 +134,49 @@ class TestAppState:
         state.set_view("invalid")
         assert state.current_view == "agents"
 
-    def test_set_filter(self):
+    def test_set_filter(self, state):
         """Test setting filter."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
         assert state.filter_text == ""
 
         state.set_filter("test")
         assert state.filter_text == "test"
 
-    def test_clear_filter(self):
+    def test_clear_filter(self, state):
         """Test clearing filter."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
         state.filter_text = "test"
         state.clear_filter()
         assert state.filter_text == ""
 
-    def test_no_active_block(self):
-        """Test state update with no active block."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
+    @pytest.mark.parametrize(
+        "block_override,expected_burn_rate,expected_cost_per_hour,expected_is_active",
+        [
+            # burnRate dict: tokensPerMinute and costPerHour are extracted
+            ({"burnRate": {"tokensPerMinute": 768522.60, "costPerHour": 90.27}}, 768522.60, 90.27, True),
+            # burnRate float (backwards compat): used directly, no cost per hour
+            ({"burnRate": 166.67}, 166.67, 0.0, True),
+            # No active block
+            (
+                {"isActive": False, "totalTokens": 80000, "costUSD": 8.00, "startTime": "2024-12-13T08:00:00Z"},
+                0.0,
+                0.0,
+                False,
+            ),
+        ],
+        ids=["burn_rate_dict", "burn_rate_float", "no_active_block"],
+    )
+    def test_update_session_from_block(
+        self, state, block_override, expected_burn_rate, expected_cost_per_hour, expected_is_active
+    ):
+        """Test session burn rate, cost per hour and activity from a single block."""
         monitoring_data = {
-            "data": {
-                "blocks": [
-                    {
-                        "startTime": "2024-12-13T08:00:00Z",
-                        "totalTokens": 80000,
-                        "costUSD": 8.00,
-                        "isActive": False,
-                    }
-                ]
-            },
+            "data": {"blocks": [{**BASE_BLOCK, **block_override}]},
             "token_limit": 200000,
         }
 
         state.update_from_monitoring_data(monitoring_data)
 
-        assert state.session.is_active is False
+        assert state.session.burn_rate == expected_burn_rate
+        assert state.session.cost_per_hour == expected_cost_per_hour
+        assert state.session.is_active is expected_is_active
         assert state.is_loading is False
         assert len(state.blocks) == 1
-
-    def test_burn_rate_dict_handling(self):
-        """Test that burn_rate correctly extracts values from dict."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
-        monitoring_data = {
-            "data": {
-                "blocks": [
-                    {
-                        "startTime": "2024-12-14T10:00:00Z",
-                        "totalTokens": 50000,
-                        "costUSD": 5.00,
-                        "isActive": True,
-                        "burnRate": {
-                            "tokensPerMinute": 768522.60,
-                            "costPerHour": 90.27,
-                        },
-                        "durationMinutes": 30,
-                    }
-                ]
-            },
-            "token_limit": 200000,
-        }
-
-        state.update_from_monitoring_data(monitoring_data)
-
-        # burn_rate should be extracted as tokensPerMinute
-        assert state.session.burn_rate == 768522.60
-        # cost_per_hour should be extracted from dict
-        assert state.session.cost_per_hour == 90.27
-        assert state.session.is_active is True
-
-    def test_burn_rate_float_fallback(self):
-        """Test that burn_rate handles float values for backwards compat."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
-        monitoring_data = {
-            "data": {
-                "blocks": [
-                    {
-                        "startTime": "2024-12-14T10:00:00Z",
-                        "totalTokens": 50000,
-                        "costUSD": 5.00,
-                        "isActive": True,
-                        "burnRate": 166.67,  # Float instead of dict
-                        "durationMinutes": 30,
-                    }
-                ]
-            },
-            "token_limit": 200000,
-        }
-
-        state.update_from_monitoring_data(monitoring_data)
-
-        # burn_rate should be the float value directly
-        assert state.session.burn_rate == 166.67
-        # cost_per_hour should be 0 when burnRate is not a dict
-        assert state.session.cost_per_hour == 0.0
-
-    def test_session_state_cost_per_hour_default(self):
-        """Test SessionState has cost_per_hour field with default."""
-        from claude_monitor.tui.state.app_state import AppState
-        state = AppState()
-
-        assert state.session.cost_per_hour == 0.0
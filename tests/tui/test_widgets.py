@@ -2,114 +2,69 @@
 
 import pytest
 from unittest.mock import MagicMock
-
-
-class TestHeaderWidget:
-    """Tests for HeaderWidget."""
-
-    def test_header_import(self):
-        """Test HeaderWidget can be imported."""
-        from claude_monitor.tui.widgets.header import HeaderWidget
-        assert HeaderWidget is not None
-
-    def test_header_creation(self):
-        """Test HeaderWidget can be created."""
-        from claude_monitor.tui.widgets.header import HeaderWidget
-        widget = HeaderWidget(id="test-header")
-        assert widget is not None
-
-    def test_header_class_attributes(self):
-        """Test HeaderWidget class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.header import HeaderWidget
-        # Check that the class has the reactive descriptors
-        assert hasattr(HeaderWidget, 'plan_name')
-        assert hasattr(HeaderWidget, 'is_paused')
-        assert hasattr(HeaderWidget, 'usage_percent')
-
-
-class TestFooterWidget:
-    """Tests for FooterWidget."""
-
-    def test_footer_import(self):
-        """Test FooterWidget can be imported."""
-        from claude_monitor.tui.widgets.footer import FooterWidget
-        assert FooterWidget is not None
-
-    def test_footer_creation(self):
-        """Test FooterWidget can be created."""
-        from claude_monitor.tui.widgets.footer import FooterWidget
-        widget = FooterWidget(id="test-footer")
-        assert widget is not None
-
-    def test_footer_class_attributes(self):
-        """Test FooterWidget class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.footer import FooterWidget
-        assert hasattr(FooterWidget, 'current_view')
-        assert hasattr(FooterWidget, 'last_refresh')
-
-
-class TestUsagePanel:
-    """Tests for UsagePanel."""
-
-    def test_usage_panel_import(self):
-        """Test UsagePanel can be imported."""
-        from claude_monitor.tui.widgets.usage_panel import UsagePanel
-        assert UsagePanel is not None
-
-    def test_usage_panel_creation(self):
-        """Test UsagePanel can be created."""
-        from claude_monitor.tui.widgets.usage_panel import UsagePanel
-        widget = UsagePanel(id="test-usage")
-        assert widget is not None
-
-    def test_usage_panel_class_attributes(self):
-        """Test UsagePanel class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.usage_panel import UsagePanel
-        assert hasattr(UsagePanel, 'plan_name')
-        assert hasattr(UsagePanel, 'tokens_used')
-        assert hasattr(UsagePanel, 'token_limit')
-        assert hasattr(UsagePanel, 'cost_used')
-
-
-class TestBurnRateWidget:
-    """Tests for BurnRateWidget."""
-
-    def test_burn_rate_import(self):
-        """Test BurnRateWidget can be imported."""
-        from claude_monitor.tui.widgets.burn_rate import BurnRateWidget
-        assert BurnRateWidget is not None
-
-    def test_burn_rate_creation(self):
-        """Test BurnRateWidget can be created."""
-        from claude_monitor.tui.widgets.burn_rate import BurnRateWidget
-        widget = BurnRateWidget(id="test-burn")
+from textual.app import App
+from textual.widgets import DataTable
+
+from claude_monitor.tui.widgets.agent_table import AgentDataTable, _build_search_index, _filter_agents
+from claude_monitor.tui.widgets.burn_rate import BurnRateWidget
+from claude_monitor.tui.widgets.footer import FooterWidget
+from claude_monitor.tui.widgets.header import HeaderWidget
+from claude_monitor.tui.widgets.model_usage import ModelUsageWidget
+from claude_monitor.tui.widgets.predictions import PredictionsPanel
+from claude_monitor.tui.widgets.progress_bars import CostBar, TimeBar, TokenBar
+from claude_monitor.tui.widgets.session_table import SessionDataTable
+from claude_monitor.tui.widgets.usage_panel import UsagePanel
+
+# (widget class, id used for the creation test)
+WIDGET_CLASSES = [
+    (HeaderWidget, "test-header"),
+    (FooterWidget, "test-footer"),
+    (UsagePanel, "test-usage"),
+    (BurnRateWidget, "test-burn"),
+    (PredictionsPanel, "test-predictions"),
+    (ModelUsageWidget, "test-model"),
+    (SessionDataTable, "test-table"),
+    (AgentDataTable, "test-agent-table"),
+]
+
+# Reactive attributes each widget class must declare
+WIDGET_REACTIVE_ATTRS = [
+    (HeaderWidget, ("plan_name", "is_paused", "usage_percent")),
+    (FooterWidget, ("current_view", "last_refresh")),
+    (UsagePanel, ("plan_name", "tokens_used", "token_limit", "cost_used")),
+    (BurnRateWidget, ("burn_rate", "previous_rate", "cost_per_hour")),
+    (SessionDataTable, ("data", "view_mode", "sort_column", "sort_reverse")),
+    (AgentDataTable, ("agents", "filter_text", "show_inactive")),
+    (TokenBar, ("tokens_used", "token_limit", "show_label")),
+    (CostBar, ("cost_used", "cost_projected", "show_label")),
+    (TimeBar, ("elapsed_minutes", "total_minutes", "show_label")),
+]
+
+
+class TestWidgetClasses:
+    """Import, creation and reactive-attribute checks shared by every widget."""
+
+    @pytest.mark.parametrize(
+        "widget_class,widget_id", WIDGET_CLASSES, ids=[cls.__name__ for cls, _ in WIDGET_CLASSES]
+    )
+    def test_widget_creation(self, widget_class, widget_id):
+        """Test the widget can be created."""
+        widget = widget_class(id=widget_id)
         assert widget is not None
 
-    def test_burn_rate_class_attributes(self):
-        """Test BurnRateWidget class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.burn_rate import BurnRateWidget
-        assert hasattr(BurnRateWidget, 'burn_rate')
-        assert hasattr(BurnRateWidget, 'previous_rate')
-        assert hasattr(BurnRateWidget, 'cost_per_hour')
+    @pytest.mark.parametrize(
+        "widget_class,attrs", WIDGET_REACTIVE_ATTRS, ids=[cls.__name__ for cls, _ in WIDGET_REACTIVE_ATTRS]
+    )
+    def test_widget_class_attributes(self, widget_class, attrs):
+        """Test the widget class declares its expected reactive attributes."""
+        assert set(attrs) <= widget_class._reactives.keys()
 
 
 class TestPredictionsPanel:
     """Tests for PredictionsPanel."""
 
-    def test_predictions_import(self):
-        """Test PredictionsPanel can be imported."""
-        from claude_monitor.tui.widgets.predictions import PredictionsPanel
-        assert PredictionsPanel is not None
-
-    def test_predictions_creation(self):
-        """Test PredictionsPanel can be created."""
-        from claude_monitor.tui.widgets.predictions import PredictionsPanel
-        widget = PredictionsPanel(id="test-predictions")
-        assert widget is not None
-
     def test_predictions_format_time(self):
         """Test time formatting."""
-        from claude_monitor.tui.widgets.predictions import PredictionsPanel
         widget = PredictionsPanel()
 
         # Test various time values
@@ -122,20 +77,8 @@ class TestPredictionsPanel:
 class TestModelUsageWidget:
     """Tests for ModelUsageWidget."""
 
-    def test_model_usage_import(self):
-        """Test ModelUsageWidget can be imported."""
-        from claude_monitor.tui.widgets.model_usage import ModelUsageWidget
-        assert ModelUsageWidget is not None
-
-    def test_model_usage_creation(self):
-        """Test ModelUsageWidget can be created."""
-        from claude_monitor.tui.widgets.model_usage import ModelUsageWidget
-        widget = ModelUsageWidget(id="test-model")
-        assert widget is not None
-
     def test_model_display_name(self):
         """Test model display name formatting."""
-        from claude_monitor.tui.widgets.model_usage import ModelUsageWidget
         widget = ModelUsageWidget()
 
         assert widget._get_model_display_name("claude-3-opus-20240229") == "Opus 4"
@@ -146,106 +89,53 @@ class TestModelUsageWidget:
 class TestSessionDataTable:
     """Tests for SessionDataTable."""
 
-    def test_session_table_import(self):
-        """Test SessionDataTable can be imported."""
-        from claude_monitor.tui.widgets.session_table import SessionDataTable
-        assert SessionDataTable is not None
-
-    def test_session_table_creation(self):
-        """Test SessionDataTable can be created."""
-        from claude_monitor.tui.widgets.session_table import SessionDataTable
-        widget = SessionDataTable(id="test-table")
-        assert widget is not None
-
-    def test_session_table_class_attributes(self):
-        """Test SessionDataTable class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.session_table import SessionDataTable
-        assert hasattr(SessionDataTable, 'data')
-        assert hasattr(SessionDataTable, 'view_mode')
-        assert hasattr(SessionDataTable, 'sort_column')
-        assert hasattr(SessionDataTable, 'sort_reverse')
+    @pytest.mark.asyncio
+    async def test_session_table_sort_in_place(self):
+        """Test sorting reorders rows numerically and keeps row selection mapped to data."""
+        class TableApp(App):
+            def compose(self):
+                yield SessionDataTable(id="test-table")
+
+        app = TableApp()
+        async with app.run_test() as pilot:
+            widget = app.query_one(SessionDataTable)
+            widget.data = [
+                {"date": "2024-12-12", "tokens": 900, "cost": 1.0},
+                {"date": "2024-12-14", "tokens": 10000, "cost": 3.0},
+                {"date": "2024-12-13", "tokens": 50, "cost": 2.0},
+            ]
+            await pilot.pause()
+
+            table = widget.query_one(DataTable)
+            dates = [table.get_row_at(i)[0] for i in range(table.row_count)]
+            assert dates == ["2024-12-14", "2024-12-13", "2024-12-12"]
+
+            widget.sort_by("tokens")
+            await pilot.pause()
+            tokens = [table.get_row_at(i)[1] for i in range(table.row_count)]
+            assert tokens == ["10,000", "900", "50"]
+            assert widget.get_selected_row()["date"] == "2024-12-14"
 
 
 class TestAgentDataTable:
     """Tests for AgentDataTable."""
 
-    def test_agent_table_import(self):
-        """Test AgentDataTable can be imported."""
-        from claude_monitor.tui.widgets.agent_table import AgentDataTable
-        assert AgentDataTable is not None
-
-    def test_agent_table_creation(self):
-        """Test AgentDataTable can be created."""
-        from claude_monitor.tui.widgets.agent_table import AgentDataTable
-        widget = AgentDataTable(id="test-agent-table")
-        assert widget is not None
-
-    def test_agent_table_class_attributes(self):
-        """Test AgentDataTable class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.agent_table import AgentDataTable
-        assert hasattr(AgentDataTable, 'agents')
-        assert hasattr(AgentDataTable, 'filter_text')
-        assert hasattr(AgentDataTable, 'show_inactive')
-
     def test_agent_filter_logic(self, sample_agents):
         """Test agent filtering logic directly (without reactive initialization)."""
-        # Test the filtering logic independently of the widget
+        index = _build_search_index(sample_agents)
+
         # Filter active only
-        active_agents = [a for a in sample_agents if a.get("is_active", False)]
+        active_agents = _filter_agents(index, "", show_inactive=False)
         active_count = sum(1 for a in sample_agents if a.get("is_active"))
         assert len(active_agents) == active_count
         assert active_count == 2  # Main Session and Explore Agent are active
 
-        # Filter by text
-        filter_text = "Explore"
-        text_filtered = [
-            a for a in sample_agents
-            if filter_text.lower() in a.get("name", "").lower()
-            or filter_text.lower() in a.get("type", "").lower()
-        ]
+        # Filter by text (case-insensitive, name or type)
+        text_filtered = _filter_agents(index, "EXPLORE", show_inactive=False)
         assert len(text_filtered) == 1
         assert text_filtered[0]["name"] == "Explore Agent"
+        assert [a["name"] for a in _filter_agents(index, "tester", show_inactive=True)] == ["Test Agent"]
 
         # Filter inactive (should include all)
-        all_agents = sample_agents
+        all_agents = _filter_agents(index, "", show_inactive=True)
         assert len(all_agents) == 3
-
-
-class TestProgressBars:
-    """Tests for progress bar widgets."""
-
-    def test_token_bar_import(self):
-        """Test TokenBar can be imported."""
-        from claude_monitor.tui.widgets.progress_bars import TokenBar
-        assert TokenBar is not None
-
-    def test_cost_bar_import(self):
-        """Test CostBar can be imported."""
-        from claude_monitor.tui.widgets.progress_bars import CostBar
-        assert CostBar is not None
-
-    def test_time_bar_import(self):
-        """Test TimeBar can be imported."""
-        from claude_monitor.tui.widgets.progress_bars import TimeBar
-        assert TimeBar is not None
-
-    def test_token_bar_class_attributes(self):
-        """Test TokenBar class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.progress_bars import TokenBar
-        assert hasattr(TokenBar, 'tokens_used')
-        assert hasattr(TokenBar, 'token_limit')
-        assert hasattr(TokenBar, 'show_label')
-
-    def test_cost_bar_class_attributes(self):
-        """Test CostBar class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.progress_bars import CostBar
-        assert hasattr(CostBar, 'cost_used')
-        assert hasattr(CostBar, 'cost_projected')
-        assert hasattr(CostBar, 'show_label')
-
-    def test_time_bar_class_attributes(self):
-        """Test TimeBar class has expected reactive attributes."""
-        from claude_monitor.tui.widgets.progress_bars import TimeBar
-        assert hasattr(TimeBar, 'elapsed_minutes')
-        assert hasattr(TimeBar, 'total_minutes')
-        assert hasattr(TimeBar, 'show_label')